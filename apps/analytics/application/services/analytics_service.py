@@ -1,4 +1,5 @@
 """Services for analytics operations."""
+from apps.core.infrastructure.db.routing import use_replica
 
 
 class AnalyticsService:
@@ -11,6 +12,7 @@ class AnalyticsService:
         pass
     
     @staticmethod
+    @use_replica()
     def get_analytics(query_params):
         """Get analytics data."""
         # TODO: Implement analytics retrieval
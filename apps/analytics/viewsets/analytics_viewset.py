@@ -3,9 +3,13 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core.viewsets.mixins import ProfiledViewMixin, ReplicaReadMixin
 
-class AnalyticsViewSet(viewsets.ViewSet):
+
+class AnalyticsViewSet(ProfiledViewMixin, ReplicaReadMixin, viewsets.ViewSet):
     """ViewSet for analytics operations."""
+
+    replica_actions = ("list", "summary")
     
     def list(self, request):
         """List analytics data."""
@@ -5,3 +5,15 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
     label = "core"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from apps.core.infrastructure.metrics.breakdown import track_db_time
+
+        connection_created.connect(track_db_time, dispatch_uid="core.track_db_time")
+
+        from apps.core.infrastructure.aws.warmup import should_warm_on_ready, warm_up
+
+        if should_warm_on_ready():
+            warm_up("app.ready")
@@ -0,0 +1,59 @@
+# apps/core/authentication.py
+from __future__ import annotations
+import uuid
+from typing import Optional, Tuple
+
+from rest_framework import authentication, exceptions
+
+from apps.core.infrastructure.aws import cognito as cognito_client
+from apps.core.infrastructure.cache.clients import get_cache, make_key
+from apps.core.models import User
+
+USER_CACHE_TTL = 300
+
+
+def _user_for_sub(sub: str) -> Optional[User]:
+    key = make_key("auth", "cognito-user", sub)
+    cache = get_cache()
+    user = cache.get(key)
+    if user is None:
+        user = User.objects.filter(cognito_sub=sub, is_active=True).first()
+        if user is not None:
+            cache.set(key, user, USER_CACHE_TTL)
+    return user
+
+
+class CognitoJWTAuthentication(authentication.BaseAuthentication):
+    """
+    Stateless ``Authorization: Bearer <cognito access token>`` auth.
+
+    Needs no session/auth middleware, so it works on the lean API chain
+    (see apps.core.middleware.lean). JWKS and the sub -> User lookup are cached.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request) -> Optional[Tuple[User, dict]]:
+        header = authentication.get_authorization_header(request).split()
+        if not header or header[0].decode().lower() != self.keyword.lower():
+            return None
+        if len(header) != 2:
+            raise exceptions.AuthenticationFailed("Invalid bearer header")
+
+        try:
+            payload = cognito_client.verify_access_token(header[1].decode())
+        except ValueError as exc:
+            raise exceptions.AuthenticationFailed(str(exc)) from exc
+
+        try:
+            # User.cognito_sub is a UUIDField: anything else would not filter
+            sub = str(uuid.UUID(str(payload["sub"])))
+        except (KeyError, ValueError) as exc:
+            raise exceptions.AuthenticationFailed("Invalid token subject") from exc
+        user = _user_for_sub(sub)
+        if user is None:
+            raise exceptions.AuthenticationFailed("Unknown user")
+        return user, payload
+
+    def authenticate_header(self, request) -> str:
+        return self.keyword
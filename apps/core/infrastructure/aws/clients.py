@@ -5,6 +5,8 @@ from boto3 import client, resource
 from botocore.config import Config
 from config import settings
 
+from apps.core.infrastructure.metrics.breakdown import instrument_client
+
 _base_cfg = Config(
     region_name=settings.AWS_REGION,
     retries={"max_attempts": 10, "mode": "adaptive"},
@@ -17,20 +19,46 @@ _base_cfg = Config(
 _s3_cfg = _base_cfg.merge(
     Config(
         signature_version="s3v4",
-        s3={"addressing_style": "virtual"},  # or "path" if you need it
+        # "path" for local stand-ins (moto server): bucket.<host> won't resolve
+        s3={"addressing_style": settings.AWS_S3_ADDRESSING_STYLE},
         user_agent_extra="file-upload-service/1.0",
     )
 )
 
 
+def _endpoint(endpoint_url: Optional[str]) -> Optional[str]:
+    # settings.AWS_ENDPOINT_URL sends every client to a local stand-in
+    return endpoint_url or settings.AWS_ENDPOINT_URL or None
+
+
+def get_warmup_client(service: str):
+    """
+    Uncached, uninstrumented client for the warm-up round trips: short
+    timeouts (AWS_WARMUP_TIMEOUT) and a single attempt, so boot fails fast.
+    """
+    timeout = settings.AWS_WARMUP_TIMEOUT
+    cfg = (_s3_cfg if service == "s3" else _base_cfg).merge(
+        Config(
+            retries={"total_max_attempts": 1, "mode": "standard"},
+            connect_timeout=timeout,
+            read_timeout=timeout,
+        )
+    )
+    return client(service, config=cfg, endpoint_url=_endpoint(None))
+
+
 @lru_cache(maxsize=32)
 def get_s3_client(endpoint_url: Optional[str] = None):
-    return client("s3", config=_s3_cfg, endpoint_url=endpoint_url)
+    return instrument_client(
+        client("s3", config=_s3_cfg, endpoint_url=_endpoint(endpoint_url))
+    )
 
 
 @lru_cache(maxsize=32)
 def get_dynamodb_resource(endpoint_url: Optional[str] = None):
-    return resource("dynamodb", config=_base_cfg, endpoint_url=endpoint_url)
+    dynamodb = resource("dynamodb", config=_base_cfg, endpoint_url=_endpoint(endpoint_url))
+    instrument_client(dynamodb.meta.client)
+    return dynamodb
 
 
 @lru_cache(maxsize=128)
@@ -41,9 +69,13 @@ def get_dynamodb_table(table_name: str, endpoint_url: Optional[str] = None):
 
 @lru_cache(maxsize=32)
 def get_sqs_client(endpoint_url: Optional[str] = None):
-    return client("sqs", config=_base_cfg, endpoint_url=endpoint_url)
+    return instrument_client(
+        client("sqs", config=_base_cfg, endpoint_url=_endpoint(endpoint_url))
+    )
 
 
 @lru_cache(maxsize=32)
 def get_sns_client(endpoint_url: Optional[str] = None):
-    return client("sns", config=_base_cfg, endpoint_url=endpoint_url)
+    return instrument_client(
+        client("sns", config=_base_cfg, endpoint_url=_endpoint(endpoint_url))
+    )
@@ -6,12 +6,18 @@ from typing import Any, Dict, Optional
 
 import boto3
 import requests
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
 from django.conf import settings
 from jose import jwt, JWTError
 
 
 def _client():
-    return boto3.client("cognito-idp", region_name=settings.AWS_REGION)
+    return boto3.client(
+        "cognito-idp",
+        region_name=settings.AWS_REGION,
+        endpoint_url=settings.AWS_ENDPOINT_URL or None,
+    )
 
 
 def _secret_hash(username: str) -> Optional[str]:
@@ -117,24 +123,55 @@ _JWKS_CACHE: Optional[Dict[str, Any]] = None
 def _jwks() -> Dict[str, Any]:
     global _JWKS_CACHE
     if _JWKS_CACHE is None:
-        url = (
-            f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/"
-            f"{settings.AWS_COGNITO_USER_POOL_ID}/.well-known/jwks.json"
+        base = (
+            settings.AWS_ENDPOINT_URL.rstrip("/")
+            or f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com"
         )
-        resp = requests.get(url, timeout=5)
+        url = f"{base}/{settings.AWS_COGNITO_USER_POOL_ID}/.well-known/jwks.json"
+        resp = requests.get(url, headers=_stand_in_headers(url), timeout=5)
         resp.raise_for_status()
         _JWKS_CACHE = resp.json()
     return _JWKS_CACHE
 
 
+def _stand_in_headers(url: str) -> Dict[str, str]:
+    """
+    A local stand-in (moto server) serves the JWKS under the same path but
+    routes requests by their SigV4 scope, so sign the (public) GET there.
+    """
+    if not settings.AWS_ENDPOINT_URL:
+        return {}
+    request = AWSRequest(method="GET", url=url)
+    credentials = boto3.Session().get_credentials()
+    SigV4Auth(credentials, "cognito-idp", settings.AWS_REGION).add_auth(request)
+    return dict(request.headers)
+
+
+def _issuer() -> str:
+    return (
+        f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/"
+        f"{settings.AWS_COGNITO_USER_POOL_ID}"
+    )
+
+
 def verify_access_token(token: str) -> Dict[str, Any]:
+    """
+    Signature, expiry and issuer, then the claims jose can't check: access
+    tokens carry no `aud`, so ID tokens and tokens of the pool's other app
+    clients are told apart by `token_use` and `client_id`.
+    """
     try:
-        return jwt.decode(
+        payload = jwt.decode(
             token,
             _jwks(),
             algorithms=["RS256"],
-            audience=settings.AWS_COGNITO_CLIENT_ID,
-            options={"verify_at_hash": False},
+            issuer=_issuer(),
+            options={"verify_at_hash": False, "verify_aud": False},
         )
     except JWTError as exc:
         raise ValueError(f"Invalid or expired token: {exc}") from exc
+    if payload.get("token_use") != "access":
+        raise ValueError("Not an access token")
+    if payload.get("client_id") != settings.AWS_COGNITO_CLIENT_ID:
+        raise ValueError("Token was issued to another client")
+    return payload
@@ -0,0 +1,155 @@
+# apps/core/infrastructure/aws/warmup.py
+"""
+Boot-time warm-up of the lazy AWS singletons.
+
+The first call to get_s3_client()/get_dynamodb_table()/get_file_service() in a
+fresh worker resolves the credential chain, loads the botocore service models
+and endpoint rules, and opens the first TLS connection. warm_up() runs those
+steps (settings.AWS_WARMUP_STEPS, dotted paths) once per process, so the first
+request after a deploy or scale-out costs the same as any other.
+
+Triggers: CoreConfig.ready (gunicorn workers), gunicorn post_fork and celery
+worker_process_init. Management commands, scripts and benchmarks never warm
+up. A process that inherits warm clients through fork() drops them and warms
+its own, since connection pools must not be shared.
+
+The network round trips (HeadBucket, DescribeTable) go through
+clients.get_warmup_client: AWS_WARMUP_TIMEOUT connect/read timeouts and no
+retries, so an unreachable endpoint delays boot by seconds, not by the shared
+clients' retry budget. The shared clients still load their models, endpoint
+rules and credentials, which are the cold cost; only their first TLS
+connection is left to the first request.
+"""
+from __future__ import annotations
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupReport:
+    trigger: str
+    pid: int
+    total_ms: float = 0.0
+    steps: Dict[str, float] = field(default_factory=dict)  # name -> ms
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+_warmed_pid: Optional[int] = None
+last_report: Optional[WarmupReport] = None
+
+
+def _step_name(path: str) -> str:
+    return path.rsplit(".", 1)[-1].removeprefix("warm_")
+
+
+def reset_clients() -> None:
+    """Drop every cached AWS client/service (e.g. after fork())."""
+    from apps.core.infrastructure.aws import clients
+
+    for fn in (
+        clients.get_s3_client,
+        clients.get_dynamodb_resource,
+        clients.get_dynamodb_table,
+        clients.get_sqs_client,
+        clients.get_sns_client,
+    ):
+        fn.cache_clear()
+    try:
+        from apps.file_upload.application.services.file_service import (
+            get_file_service,
+        )
+    except ImportError:  # pragma: no cover
+        return
+    get_file_service.cache_clear()
+
+
+def warm_up(trigger: str) -> Optional[WarmupReport]:
+    """
+    Run the configured warm-up steps once per process. Never raises: a failed
+    step is logged and the request that needs it simply pays the cold cost.
+    """
+    global _warmed_pid, last_report
+
+    from django.apps import apps
+
+    if not apps.models_ready:  # gunicorn post_fork without preload; ready() follows
+        return None
+    if not settings.AWS_WARMUP:
+        return None
+    pid = os.getpid()
+    if _warmed_pid == pid:
+        return None
+    if _warmed_pid is not None:
+        reset_clients()
+
+    report = WarmupReport(trigger=trigger, pid=pid)
+    start = time.perf_counter()
+    for path in settings.AWS_WARMUP_STEPS:
+        name = _step_name(path)
+        t0 = time.perf_counter()
+        try:
+            import_string(path)(connect=settings.AWS_WARMUP_CONNECT)
+        except Exception as exc:
+            report.errors[name] = f"{type(exc).__name__}: {exc}"
+        report.steps[name] = round((time.perf_counter() - t0) * 1000, 2)
+    report.total_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    _warmed_pid = pid
+    last_report = report
+    logger.info(
+        "aws warm-up (%s) pid=%s total=%.1fms %s",
+        trigger,
+        pid,
+        report.total_ms,
+        " ".join(f"{k}={v:.1f}ms" for k, v in report.steps.items()),
+    )
+    for name, err in report.errors.items():
+        logger.warning("aws warm-up step %s failed: %s", name, err)
+    return report
+
+
+def should_warm_on_ready(argv=None) -> bool:
+    """
+    AppConfig.ready runs in every process that sets up Django: management
+    commands, `python -c`, scripts, the celery parent. Only gunicorn workers
+    warm up from there; celery pool processes use worker_process_init.
+    """
+    argv = sys.argv if argv is None else argv
+    prog = os.path.basename(argv[0]) if argv else ""
+    return prog == "gunicorn"
+
+
+
+# ---- steps (called with connect=settings.AWS_WARMUP_CONNECT) ----
+
+
+def warm_s3(connect: bool = True) -> None:
+    from apps.core.infrastructure.aws.clients import get_s3_client, get_warmup_client
+
+    s3 = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    if not bucket:
+        return
+    # loads the signer + endpoint ruleset used by every presign call
+    s3.generate_presigned_url(
+        "get_object", Params={"Bucket": bucket, "Key": "warmup"}, ExpiresIn=60
+    )
+    if connect:
+        get_warmup_client("s3").head_bucket(Bucket=bucket)  # reachable, credentials ok
+
+
+def warm_cognito_jwks(connect: bool = True) -> None:
+    if not (connect and settings.AWS_COGNITO_USER_POOL_ID):
+        return
+    from apps.core.infrastructure.aws import cognito
+
+    cognito._jwks()
@@ -0,0 +1,79 @@
+# apps/core/infrastructure/cache/clients.py
+from __future__ import annotations
+import functools
+import hashlib
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import redis
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+
+CACHE_DEFAULT = "default"
+CACHE_SESSIONS = "sessions"
+CACHE_AXES = "axes"
+CACHE_THROTTLE = "throttle"
+
+_REDIS_BACKEND = "django.core.cache.backends.redis.RedisCache"
+
+
+def get_cache(alias: str = CACHE_DEFAULT) -> BaseCache:
+    return caches[alias]
+
+
+@lru_cache(maxsize=16)
+def get_redis_client(alias: str = CACHE_DEFAULT) -> Optional[redis.Redis]:
+    """
+    Process-wide redis client for a cache alias, for what the Django cache API
+    can't do (Lua scripts, pub/sub, atomic counters). Shares the alias' URL and
+    pool options; returns None when the alias isn't Redis-backed (tests, dev).
+    """
+    conf = settings.CACHES.get(alias) or {}
+    if conf.get("BACKEND") != _REDIS_BACKEND:
+        return None
+    location = conf["LOCATION"]
+    if isinstance(location, (list, tuple)):
+        location = location[0]  # first server is the writer
+    return redis.Redis.from_url(location, **conf.get("OPTIONS", {}))
+
+
+def make_key(*parts: Any) -> str:
+    """Join parts into a cache key; long keys are hashed to keep them bounded."""
+    key = ":".join(str(p) for p in parts)
+    if len(key) > 200:
+        key = f"h:{hashlib.sha256(key.encode()).hexdigest()}"
+    return key
+
+
+def cached(
+    timeout: Optional[int] = 300,
+    *,
+    alias: str = CACHE_DEFAULT,
+    key_func: Optional[Callable[..., str]] = None,
+):
+    """
+    Memoize a function's return value in a Django cache.
+
+    @cached(60)
+    def expensive(user_id): ...
+    """
+
+    def decorator(fn):
+        prefix = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            suffix = (
+                key_func(*args, **kwargs)
+                if key_func
+                else make_key(*args, *sorted(kwargs.items()))
+            )
+            return get_cache(alias).get_or_set(
+                make_key(prefix, suffix), lambda: fn(*args, **kwargs), timeout
+            )
+
+        wrapper.cache_alias = alias
+        return wrapper
+
+    return decorator
@@ -0,0 +1,495 @@
+# apps/core/infrastructure/db/partitioning.py
+"""
+Monthly RANGE partitioning on created_at (Postgres only).
+
+Partitions are named ``<table>_pYYYY_MM`` and cover [month start, next month
+start) in UTC; ``<table>_default`` catches rows outside the pre-created range.
+Unique constraints (the primary key included) must contain the partition key,
+so a converted table's PK is (id, created_at) in the database while Django
+keeps treating ``id`` as the primary key. Every other unique constraint gets
+``created_at`` appended too (jobs: UNIQUE (job_id, created_at)), which alone
+would let the same job_id exist once per month. The original columns stay
+unique through a guard: a plain ``<constraint>_guard`` table with those
+columns as its primary key, kept in sync by a row trigger on the partitioned
+table. A duplicate fails the INSERT/UPDATE with an IntegrityError, as before.
+Rows of a detached partition keep their claims until it is dropped.
+
+- convert_to_partitioned / convert_to_plain: used by the migrations.
+- ensure_partitions / detach_partitions (maintain_partitions runs both over
+  settings.PARTITIONED_TABLES): `manage.py manage_partitions` and the daily
+  beat task.
+"""
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+PARTITION_KEY = "created_at"
+_NAME_RE = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, n: int) -> date:
+    y, m = divmod(d.year * 12 + d.month - 1 + n, 12)
+    return date(y, m + 1, 1)
+
+
+def partition_name(table: str, start: date) -> str:
+    return f"{table}_p{start:%Y_%m}"
+
+
+def partition_start(table: str, name: str) -> Optional[date]:
+    if not name.startswith(f"{table}_p"):
+        return None
+    m = _NAME_RE.search(name)
+    return date(int(m.group(1)), int(m.group(2)), 1) if m else None
+
+
+def _bound(d: date) -> str:
+    return f"'{d.isoformat()} 00:00:00+00'"
+
+
+def _qn(name: str) -> str:
+    return '"%s"' % name.replace('"', '""')
+
+
+def create_partition_sql(table: str, start: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {_qn(partition_name(table, start))} "
+        f"PARTITION OF {_qn(table)} "
+        f"FOR VALUES FROM ({_bound(start)}) TO ({_bound(add_months(start, 1))})"
+    )
+
+
+def _today() -> date:
+    return timezone.now().date()
+
+
+# ---------- introspection ----------
+
+
+def is_partitioned(cursor, table: str) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+        [table],
+    )
+    return cursor.fetchone() is not None
+
+
+def list_partitions(cursor, table: str) -> List[str]:
+    cursor.execute(
+        """
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        ORDER BY c.relname
+        """,
+        [table],
+    )
+    return [r[0] for r in cursor.fetchall()]
+
+
+@dataclass
+class _TableShape:
+    pk: Sequence[str]
+    uniques: List[Tuple[str, List[str]]]  # (constraint name, columns)
+    indexes: List[str]  # CREATE INDEX statements (non-constraint indexes)
+    foreign_keys: List[Tuple[str, str]]  # (constraint name, definition)
+    identity_column: Optional[str]
+    sequence: Optional[str]
+
+
+def _shape(cursor, table: str) -> _TableShape:
+    cursor.execute(
+        """
+        SELECT con.conname, con.contype,
+               array(SELECT a.attname FROM unnest(con.conkey) WITH ORDINALITY k(n, o)
+                     JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.n
+                     ORDER BY k.o)
+        FROM pg_constraint con
+        WHERE con.conrelid = to_regclass(%s) AND con.contype IN ('p', 'u')
+        """,
+        [table],
+    )
+    pk: Sequence[str] = ()
+    uniques = []
+    for name, kind, cols in cursor.fetchall():
+        if kind == "p":
+            pk = list(cols)
+        else:
+            uniques.append((name, list(cols)))
+
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(ix.indexrelid) FROM pg_index ix
+        WHERE ix.indrelid = to_regclass(%s)
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint con
+                          WHERE con.conindid = ix.indexrelid)
+        """,
+        [table],
+    )
+    indexes = [r[0] for r in cursor.fetchall()]
+
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = to_regclass(%s) AND contype = 'f'
+        """,
+        [table],
+    )
+    foreign_keys = list(cursor.fetchall())
+
+    cursor.execute(
+        """
+        SELECT attname FROM pg_attribute
+        WHERE attrelid = to_regclass(%s) AND attidentity <> '' AND NOT attisdropped
+        """,
+        [table],
+    )
+    row = cursor.fetchone()
+    identity = row[0] if row else None
+    sequence = None
+    if pk and not identity:
+        cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", [table, pk[0]])
+        sequence = cursor.fetchone()[0]
+    return _TableShape(pk, uniques, indexes, foreign_keys, identity, sequence)
+
+
+def _referenced_by(cursor, table: str) -> List[str]:
+    cursor.execute(
+        """
+        SELECT conrelid::regclass::text FROM pg_constraint
+        WHERE confrelid = to_regclass(%s) AND contype = 'f'
+        """,
+        [table],
+    )
+    return [r[0] for r in cursor.fetchall()]
+
+
+# ---------- unique guards ----------
+
+
+def guards(cursor, table: str) -> Dict[str, List[str]]:
+    """Guard table -> guarded columns, for the unique constraints of `table`."""
+    cursor.execute(
+        """
+        SELECT con.conname || '_guard',
+               array(SELECT a.attname FROM pg_attribute a
+                     WHERE a.attrelid = to_regclass(con.conname || '_guard')
+                       AND a.attnum > 0 AND NOT a.attisdropped AND a.attname <> %s
+                     ORDER BY a.attnum)
+        FROM pg_constraint con
+        WHERE con.conrelid = to_regclass(%s) AND con.contype = 'u'
+          AND to_regclass(con.conname || '_guard') IS NOT NULL
+        """,
+        [PARTITION_KEY, table],
+    )
+    return dict(cursor.fetchall())
+
+
+def _claim_sql(guard: str, cols: Sequence[str], source: str) -> str:
+    cols_sql = ", ".join(_qn(col) for col in cols)
+    not_null = " AND ".join(f"{_qn(col)} IS NOT NULL" for col in cols)
+    return (
+        f"INSERT INTO {_qn(guard)} ({cols_sql}, {PARTITION_KEY}) "
+        f"SELECT {cols_sql}, {PARTITION_KEY} FROM {_qn(source)} WHERE {not_null}"
+    )
+
+
+def add_guard(cursor, table: str, constraint: str, cols: Sequence[str]) -> None:
+    """Keep `cols` unique across all partitions of `table` (see module doc)."""
+    guard = f"{constraint}_guard"
+    cols_sql = ", ".join(_qn(col) for col in cols)
+    cursor.execute(
+        f"CREATE TABLE {_qn(guard)} AS SELECT {cols_sql}, {PARTITION_KEY} "
+        f"FROM {_qn(table)} WITH NO DATA"
+    )
+    cursor.execute(
+        f"ALTER TABLE {_qn(guard)} ADD CONSTRAINT {_qn(guard + '_pkey')} "
+        f"PRIMARY KEY ({cols_sql})"
+    )
+    cursor.execute(_claim_sql(guard, cols, table))
+    # NULLs never conflict, so they are never claimed
+    matches = " AND ".join(f"{_qn(col)} = OLD.{_qn(col)}" for col in cols)
+    not_null = " AND ".join(f"NEW.{_qn(col)} IS NOT NULL" for col in cols)
+    new_cols = ", ".join(f"NEW.{_qn(col)}" for col in cols)
+    cursor.execute(
+        f"""
+        CREATE FUNCTION {_qn(guard + '_sync')}() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                DELETE FROM {_qn(guard)} WHERE {matches};
+            END IF;
+            IF TG_OP <> 'DELETE' AND {not_null} THEN
+                INSERT INTO {_qn(guard)} ({cols_sql}, {PARTITION_KEY})
+                VALUES ({new_cols}, NEW.{PARTITION_KEY});
+            END IF;
+            RETURN NULL;
+        END $$
+        """
+    )
+    cursor.execute(
+        f"CREATE TRIGGER {_qn(guard)} "
+        f"AFTER INSERT OR DELETE OR UPDATE OF {cols_sql}, {PARTITION_KEY} "
+        f"ON {_qn(table)} FOR EACH ROW EXECUTE FUNCTION {_qn(guard + '_sync')}()"
+    )
+
+
+def drop_guard(cursor, guard: str) -> None:
+    cursor.execute(f"DROP FUNCTION {_qn(guard + '_sync')}() CASCADE")  # + trigger
+    cursor.execute(f"DROP TABLE {_qn(guard)}")
+
+
+def add_missing_guards(schema_editor, table: str) -> None:
+    """
+    Migration helper for tables partitioned before guards existed: guard each
+    unique constraint of the form (cols..., created_at).
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as c:
+        if not is_partitioned(c, table):
+            return
+        existing = guards(c, table)
+        for name, cols in _shape(c, table).uniques:
+            if f"{name}_guard" in existing or cols[-1:] != [PARTITION_KEY]:
+                continue
+            if cols[:-1]:
+                add_guard(c, table, name, cols[:-1])
+
+
+# ---------- conversion (migrations) ----------
+
+
+def _rebuild(schema_editor, table: str, *, partitioned: bool, months_ahead: int):
+    legacy = f"{table}__legacy"
+    with schema_editor.connection.cursor() as c:
+        if is_partitioned(c, table) == partitioned:
+            return
+        refs = _referenced_by(c, table)
+        if refs:
+            raise RuntimeError(
+                f"{table} is referenced by foreign keys from {refs}; "
+                "a partitioned table cannot be the target of those"
+            )
+        shape = _shape(c, table)
+        id_col = shape.pk[0]
+        guarded = guards(c, table)
+        for guard in guarded:
+            drop_guard(c, guard)
+
+        c.execute(f"ALTER TABLE {_qn(table)} RENAME TO {_qn(legacy)}")
+        if shape.sequence:
+            c.execute(f"ALTER SEQUENCE {shape.sequence} OWNED BY NONE")
+        clause = f" PARTITION BY RANGE ({PARTITION_KEY})" if partitioned else ""
+        c.execute(
+            f"CREATE TABLE {_qn(table)} (LIKE {_qn(legacy)} INCLUDING DEFAULTS)"
+            + clause
+        )
+
+        if partitioned:
+            c.execute(f"SELECT min({PARTITION_KEY}) FROM {_qn(legacy)}")
+            oldest = c.fetchone()[0]
+            first = month_start(oldest.date() if oldest else _today())
+            last = add_months(month_start(_today()), months_ahead)
+            month = first
+            while month <= last:
+                c.execute(create_partition_sql(table, month))
+                month = add_months(month, 1)
+            c.execute(
+                f"CREATE TABLE {_qn(table + '_default')} "
+                f"PARTITION OF {_qn(table)} DEFAULT"
+            )
+
+        c.execute(f"INSERT INTO {_qn(table)} SELECT * FROM {_qn(legacy)}")
+        c.execute(f"DROP TABLE {_qn(legacy)}")
+
+        # constraints: the partition key joins every unique constraint; a
+        # guard keeps the original columns unique
+        def key_cols(cols, name=None):
+            if not partitioned and name and f"{name}_guard" not in guarded:
+                return cols  # created_at was part of it to begin with
+            cols = [col for col in cols if col != PARTITION_KEY]
+            return cols + [PARTITION_KEY] if partitioned else cols
+
+        pk_cols = ", ".join(_qn(col) for col in key_cols(shape.pk))
+        c.execute(
+            f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(table + '_pkey')} "
+            f"PRIMARY KEY ({pk_cols})"
+        )
+        for name, cols in shape.uniques:
+            cols_sql = ", ".join(_qn(col) for col in key_cols(cols, name))
+            c.execute(
+                f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(name)} "
+                f"UNIQUE ({cols_sql})"
+            )
+            if partitioned and PARTITION_KEY not in cols:
+                add_guard(c, table, name, cols)
+        for ddl in shape.indexes:
+            c.execute(ddl)
+        for name, definition in shape.foreign_keys:
+            c.execute(
+                f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(name)} {definition}"
+            )
+
+        # id generation: identity columns cannot move to a partitioned table
+        # before PG 17, so both directions end up with an owned sequence
+        sequence = shape.sequence
+        if shape.identity_column:
+            sequence = _qn(f"{table}_{id_col}_seq")
+            c.execute(f"CREATE SEQUENCE {sequence}")
+        if not sequence:  # e.g. UUID keys generated in Python
+            return
+        c.execute(f"ALTER SEQUENCE {sequence} OWNED BY {_qn(table)}.{_qn(id_col)}")
+        c.execute(
+            f"SELECT setval('{sequence}', coalesce(max({_qn(id_col)}), 0) + 1, false) "
+            f"FROM {_qn(table)}"
+        )
+        c.execute(
+            f"ALTER TABLE {_qn(table)} ALTER COLUMN {_qn(id_col)} "
+            f"SET DEFAULT nextval('{sequence}')"
+        )
+
+
+def convert_to_partitioned(schema_editor, table: str, *, months_ahead: int = 3):
+    """Migration helper: rebuild `table` as monthly partitions (no-op off Postgres)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    _rebuild(schema_editor, table, partitioned=True, months_ahead=months_ahead)
+
+
+def convert_to_plain(schema_editor, table: str):
+    """Reverse of convert_to_partitioned."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    _rebuild(schema_editor, table, partitioned=False, months_ahead=0)
+
+
+# ---------- maintenance (command / beat task) ----------
+
+
+def ensure_partitions(
+    connection, table: str, *, months_ahead: int, today: Optional[date] = None
+) -> List[str]:
+    """
+    Create the partitions for this month through `months_ahead` months out.
+    Rows already sitting in the default partition for a new month are moved
+    into it first (ATTACH would fail otherwise).
+    """
+    created = []
+    start = month_start(today or _today())
+    default = _qn(table + "_default")
+    with connection.cursor() as c:
+        if not is_partitioned(c, table):
+            return created
+        existing = set(list_partitions(c, table))
+        for i in range(months_ahead + 1):
+            month = add_months(start, i)
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+            lo, hi = _bound(month), _bound(add_months(month, 1))
+            with transaction.atomic(using=connection.alias):
+                c.execute(
+                    f"SELECT count(*) FROM {default} "
+                    f"WHERE {PARTITION_KEY} >= {lo} AND {PARTITION_KEY} < {hi}"
+                )
+                if c.fetchone()[0] == 0:
+                    c.execute(create_partition_sql(table, month))
+                else:
+                    c.execute(
+                        f"CREATE TABLE {_qn(name)} "
+                        f"(LIKE {_qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+                    )
+                    c.execute(
+                        f"WITH moved AS (DELETE FROM {default} "
+                        f"WHERE {PARTITION_KEY} >= {lo} AND {PARTITION_KEY} < {hi} "
+                        f"RETURNING *) INSERT INTO {_qn(name)} SELECT * FROM moved"
+                    )
+                    # the DELETE released the moved rows' claims; the INSERT
+                    # into a table not yet attached fired no trigger
+                    for guard, cols in guards(c, table).items():
+                        c.execute(_claim_sql(guard, cols, name))
+                    c.execute(
+                        f"ALTER TABLE {_qn(table)} ATTACH PARTITION {_qn(name)} "
+                        f"FOR VALUES FROM ({lo}) TO ({hi})"
+                    )
+            created.append(name)
+    return created
+
+
+def detach_partitions(
+    connection,
+    table: str,
+    *,
+    keep_months: int,
+    today: Optional[date] = None,
+    drop: bool = False,
+) -> List[str]:
+    """
+    Detach monthly partitions that end before the retention window; the
+    detached tables are left in place (for archiving), their rows' unique
+    claims with them, unless `drop`.
+    """
+    cutoff = add_months(month_start(today or _today()), -keep_months)
+    detached = []
+    with connection.cursor() as c:
+        if not is_partitioned(c, table):
+            return detached
+        for name in list_partitions(c, table):
+            start = partition_start(table, name)
+            if start is None or add_months(start, 1) > cutoff:
+                continue
+            lo, hi = _bound(start), _bound(add_months(start, 1))
+            with transaction.atomic(using=connection.alias):
+                c.execute(f"ALTER TABLE {_qn(table)} DETACH PARTITION {_qn(name)}")
+                if drop:
+                    c.execute(f"DROP TABLE {_qn(name)}")
+                    for guard in guards(c, table):
+                        c.execute(
+                            f"DELETE FROM {_qn(guard)} WHERE {PARTITION_KEY} >= {lo} "
+                            f"AND {PARTITION_KEY} < {hi}"
+                        )
+            detached.append(name)
+    return detached
+
+
+def maintain_partitions(
+    connection,
+    tables: Optional[Dict[str, int]] = None,
+    *,
+    months_ahead: Optional[int] = None,
+    drop: Optional[bool] = None,
+    today: Optional[date] = None,
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    One maintenance pass over settings.PARTITIONED_TABLES (table -> months
+    kept, 0 = keep all): create upcoming partitions, detach expired ones.
+    """
+    if connection.vendor != "postgresql":
+        return {}
+    tables = settings.PARTITIONED_TABLES if tables is None else tables
+    ahead = settings.PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    drop = settings.PARTITION_DROP_DETACHED if drop is None else drop
+    report = {}
+    for table, keep_months in tables.items():
+        report[table] = {
+            "created": ensure_partitions(
+                connection, table, months_ahead=ahead, today=today
+            ),
+            "detached": detach_partitions(
+                connection, table, keep_months=keep_months, today=today, drop=drop
+            )
+            if keep_months
+            else [],
+        }
+    return report
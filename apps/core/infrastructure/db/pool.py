@@ -0,0 +1,125 @@
+# apps/core/infrastructure/db/pool.py
+"""
+Helpers around Django's native psycopg_pool integration
+(DATABASES[...]["OPTIONS"]["pool"], sized by settings.db_pool_options).
+
+- pool_stats(): live numbers for /health/db (in use, waiting, wait time).
+- reset_pools_after_fork(): a forked child must not reuse the parent's pool.
+- get_checkpointer_pool(): the langgraph Postgres checkpointer's own pool
+  (dict rows, no Django cursor), sized from its slice of the budget.
+"""
+from __future__ import annotations
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db import connections
+
+
+def get_pool(alias: str = "default"):
+    """The psycopg_pool.ConnectionPool behind `alias`, or None if unpooled."""
+    return getattr(connections[alias], "pool", None)
+
+
+def pool_stats(alias: str = "default") -> Optional[Dict[str, Any]]:
+    pool = get_pool(alias)
+    if pool is None:
+        return None
+    if pool.closed:  # Django opens it on first checkout
+        return {"open": False}
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    requests = stats.get("requests_num", 0)
+    return {
+        "open": True,
+        "min_size": stats.get("pool_min"),
+        "max_size": stats.get("pool_max"),
+        "size": size,
+        "in_use": size - stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "requests_queued": stats.get("requests_queued", 0),
+        "wait_ms_total": stats.get("requests_wait_ms", 0),
+        "wait_ms_avg": round(stats.get("requests_wait_ms", 0) / requests, 3)
+        if requests
+        else 0.0,
+        "errors": stats.get("requests_errors", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
+
+
+def probe_checkout(alias: str = "default") -> float:
+    """Round trip of checkout + SELECT 1 + return, in ms."""
+    start = time.perf_counter()
+    with connections[alias].cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    elapsed = (time.perf_counter() - start) * 1000
+    connections[alias].close()  # hands a pooled connection back
+    return round(elapsed, 3)
+
+
+# inherited connections/pools are parked, not garbage collected: finalizing
+# them in the child would send Terminate on sockets the parent still uses
+_inherited: list = []
+
+
+def reset_pools_after_fork() -> None:
+    """
+    Detach pools and connections inherited through fork() (their sockets and
+    pool threads belong to the parent); each child opens its own lazily.
+    """
+    for conn in connections.all(initialized_only=True):
+        if conn.connection is not None:
+            _inherited.append(conn.connection)
+            conn.connection = None
+    for alias in settings.DATABASES:
+        pools = getattr(type(connections[alias]), "_connection_pools", None)
+        if pools is not None and alias in pools:
+            _inherited.append(pools.pop(alias))
+    if get_checkpointer_pool.cache_info().currsize:
+        _inherited.append(get_checkpointer_pool())
+        get_checkpointer_pool.cache_clear()
+
+
+def checkpointer_conninfo(alias: str = "default") -> Dict[str, Any]:
+    db = settings.DATABASES[alias]
+    return {
+        "dbname": db["NAME"],
+        "user": db["USER"],
+        "password": db["PASSWORD"],
+        "host": db["HOST"],
+        "port": db["PORT"],
+    }
+
+
+@lru_cache(maxsize=1)
+def get_checkpointer_pool():
+    """
+    psycopg_pool for langgraph's PostgresSaver. It is sized from
+    DB_POOL_CHECKPOINTER_BUDGET (settings.DB_CHECKPOINTER_POOL_OPTIONS), which
+    is taken out of DB_POOL_BUDGET before the Django pool is sized, so both
+    pools together stay within the budget.
+    """
+    from psycopg.rows import dict_row
+    from psycopg_pool import ConnectionPool
+
+    return ConnectionPool(
+        kwargs={
+            **checkpointer_conninfo(),
+            "autocommit": True,
+            "prepare_threshold": 0,
+            "row_factory": dict_row,
+        },
+        check=ConnectionPool.check_connection,
+        name="langgraph-checkpointer",
+        open=True,
+        **settings.DB_CHECKPOINTER_POOL_OPTIONS,
+    )
+
+
+def get_postgres_checkpointer():
+    from langgraph.checkpoint.postgres import PostgresSaver
+
+    return PostgresSaver(get_checkpointer_pool())
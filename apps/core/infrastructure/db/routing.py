@@ -0,0 +1,128 @@
+# apps/core/infrastructure/db/routing.py
+"""
+Optional read replica.
+
+Reads go to the primary unless code opts in with `use_replica()` (list
+endpoints via ReplicaReadMixin, analytics services, reporting tasks). Inside a
+request the replica is skipped when:
+
+- the client asks for it (`X-Read-Consistency: strong`),
+- this request already wrote, or
+- the same user wrote within REPLICA_PIN_SECONDS (read-your-writes).
+
+Without a "replica" alias in DATABASES the router is a no-op.
+"""
+from __future__ import annotations
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.core.infrastructure.cache.clients import CACHE_DEFAULT, get_cache
+
+REPLICA_DB_ALIAS = "replica"
+CONSISTENCY_HEADER = "HTTP_X_READ_CONSISTENCY"
+
+
+@dataclass
+class RequestRouting:
+    """Per-request routing state, installed by ReplicaRoutingMiddleware."""
+
+    request: Any = None
+    force_primary: bool = False
+    wrote: bool = False
+    _pinned: Optional[bool] = None
+
+    def user_key(self) -> Optional[str]:
+        # DRF copies the authenticated user onto the HttpRequest, so by the time
+        # the view queries, bearer-token users are known here too
+        user = getattr(self.request, "user", None)
+        if user is None or not getattr(user, "is_authenticated", False):
+            return None
+        return f"db:pin:user:{user.pk}"
+
+    def pinned(self) -> bool:
+        if self._pinned is None:
+            self._pinned = False  # resolving a lazy user reads the DB too
+            key = self.user_key()
+            self._pinned = bool(key and get_cache(CACHE_DEFAULT).get(key))
+        return self._pinned
+
+    def prefers_primary(self) -> bool:
+        return self.force_primary or self.wrote or self.pinned()
+
+
+_replica_scope: ContextVar[bool] = ContextVar("db_replica_scope", default=False)
+_request_routing: ContextVar[Optional[RequestRouting]] = ContextVar(
+    "db_request_routing", default=None
+)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+class use_replica(ContextDecorator):
+    """Send reads in this block (or decorated function) to the replica."""
+
+    def _recreate_cm(self):
+        # a decorator is one instance shared by every call (and thread, and
+        # task); each call gets its own, so concurrent calls keep their tokens
+        return type(self)()
+
+    def __enter__(self):
+        self._token = _replica_scope.set(True)
+        return self
+
+    def __exit__(self, *exc):
+        _replica_scope.reset(self._token)
+        return False
+
+
+def begin_request(request) -> Any:
+    force = request.META.get(CONSISTENCY_HEADER, "").lower() == "strong"
+    return _request_routing.set(RequestRouting(request=request, force_primary=force))
+
+
+def end_request(token) -> RequestRouting:
+    state = _request_routing.get()
+    _request_routing.reset(token)
+    if state is not None and state.wrote:
+        key = state.user_key()
+        if key:
+            get_cache(CACHE_DEFAULT).set(key, 1, settings.REPLICA_PIN_SECONDS)
+    return state
+
+
+class ReplicaRouter:
+    """settings.DATABASE_ROUTERS entry; see the module docstring."""
+
+    def db_for_read(self, model, **hints):
+        if not (_replica_scope.get() and replica_configured()):
+            return None
+        state = _request_routing.get()
+        if state is not None and state.prefers_primary():
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _request_routing.get()
+        if state is not None:
+            state.wrote = True
+        # explicit: an instance read from the replica still saves to primary
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        dbs = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in dbs and obj2._state.db in dbs:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # the replica receives schema changes through replication
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
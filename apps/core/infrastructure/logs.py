@@ -0,0 +1,190 @@
+# apps/core/infrastructure/logs.py
+"""
+Non-blocking logging: request/task threads only enqueue records; a
+QueueListener thread formats (JSONFormatter) and writes them.
+
+Wired through settings.LOGGING (LOG_QUEUE, LOG_QUEUE_SIZE, LOG_FORMAT); the
+Celery worker applies the same config via the setup_logging signal. Keep this
+module free of Django imports: dictConfig loads it before apps are ready.
+"""
+from __future__ import annotations
+import atexit
+import logging
+import os
+import queue
+import weakref
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import orjson
+from prometheus_client import Counter
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped",
+    "Log records dropped because the logging queue was full",
+    ["level"],
+)
+
+# LogRecord attributes that are not user "extra" fields
+_RESERVED = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    One JSON object per line. Runs on the listener thread, so the cost of
+    serializing `extra` fields (non-JSON values fall back to str()) and
+    tracebacks stays off the request path.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        doc = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                doc[key] = value
+        if record.exc_info:
+            doc["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            doc["exc"] = record.exc_text
+        if record.stack_info:
+            doc["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(doc, default=str).decode()
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # the stock put_nowait fails when full
+
+
+class QueuedHandler(QueueHandler):
+    """
+    Enqueues records for a background QueueListener that owns the real
+    (stream) handler. The formatter set on this handler is handed to that
+    handler, so formatting happens on the listener thread.
+
+    Under backpressure (queue above `debug_high_water` of its size) DEBUG
+    records are dropped; when the queue is full, other records wait up to
+    `block_seconds` and are then dropped. Drops are counted per level
+    (`dropped`, the log_records_dropped metric) and reported by a WARNING
+    once the queue drains. Pending records are flushed at exit; forked
+    children (gunicorn/celery prefork) get a fresh queue and listener.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 10000,
+        block_seconds: float = 0.05,
+        debug_high_water: float = 0.8,
+        sink: Optional[logging.Handler] = None,
+    ):
+        self.queue_size = queue_size
+        self.block_seconds = block_seconds
+        self.debug_limit = int(queue_size * debug_high_water)
+        self.sink = sink or logging.StreamHandler()
+        self.dropped: Dict[str, int] = {}
+        self._unreported = 0
+        self.listener: Optional[_Listener] = None
+        super().__init__(queue.Queue(queue_size))
+        self._start()
+        _live_handlers.add(self)
+
+    def _start(self) -> None:
+        self.listener = _Listener(self.queue, self.sink, respect_handler_level=True)
+        self.listener.start()
+
+    def setFormatter(self, fmt) -> None:
+        self.sink.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # freeze the message (args may be mutated after the call) but leave
+        # formatting, extras and the traceback to the listener thread
+        message = record.getMessage()
+        if record.args:
+            record = logging.makeLogRecord(record.__dict__)
+            record.msg, record.args = message, None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno <= logging.DEBUG and self.queue.qsize() >= self.debug_limit:
+            self._drop(record)
+            return
+        try:
+            self.queue.put(record, timeout=self.block_seconds)
+        except queue.Full:
+            self._drop(record)
+            return
+        if self._unreported and self.queue.qsize() < self.debug_limit:
+            count, self._unreported = self._unreported, 0
+            self.queue.put_nowait(
+                logging.makeLogRecord(
+                    {
+                        "name": __name__,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": "logging queue overflow: dropped %d records",
+                        "args": (count,),
+                        "dropped": dict(self.dropped),
+                    }
+                )
+            )
+
+    def _drop(self, record: logging.LogRecord) -> None:
+        self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+        self._unreported += 1
+        LOG_RECORDS_DROPPED.labels(record.levelname).inc()
+
+    def flush(self) -> None:
+        """Drain pending records and restart the listener."""
+        if self.listener is not None:
+            self.listener.stop()  # processes everything queued, then joins
+            self._start()
+
+    def close(self) -> None:
+        _live_handlers.discard(self)
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        self.sink.close()
+        super().close()
+
+    def _after_fork(self) -> None:
+        # the parent's listener thread does not exist here and the queue's
+        # locks may have been held at fork time
+        self.queue = queue.Queue(self.queue_size)
+        self.dropped = {}
+        self._unreported = 0
+        self._start()
+
+
+_live_handlers: "weakref.WeakSet[QueuedHandler]" = weakref.WeakSet()
+
+
+def flush_logs() -> None:
+    """Write out every queued record (worker shutdown, atexit)."""
+    for handler in list(_live_handlers):
+        handler.flush()
+
+
+def _stop_all() -> None:
+    for handler in list(_live_handlers):
+        if handler.listener is not None:
+            handler.listener.stop()
+            handler.listener = None
+
+
+def _after_fork_in_child() -> None:
+    for handler in list(_live_handlers):
+        handler._after_fork()
+
+
+atexit.register(_stop_all)
+os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,190 @@
+# apps/core/infrastructure/metrics/breakdown.py
+"""
+Where a request's time goes: AWS calls (per service/operation, DynamoDB
+consumed capacity) and DB queries.
+
+- instrument_client(client) registers botocore before-call/after-call hooks
+  (clients.py does this for every shared client); DynamoDB requests also get
+  ReturnConsumedCapacity=TOTAL unless the caller set it.
+- track_db_time (connection_created signal) puts db_execute_wrapper on every
+  DB connection; it only counts while a breakdown is open.
+- RequestMetricsMiddleware opens a RequestBreakdown per request. It lives in a
+  ContextVar, so sync views run from ASGI (sync_to_async) still report into
+  it. AWS calls made outside a request (tasks, shell) go straight to the
+  Prometheus collectors with route "-".
+"""
+from __future__ import annotations
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from apps.core.infrastructure.metrics import prometheus
+
+NO_ROUTE = "-"
+_STARTED = "metrics_started"
+_HOOK_ID = "apps.core.metrics"
+
+
+@dataclass
+class AwsCall:
+    service: str
+    operation: str
+    seconds: float
+    error: bool = False
+
+
+@dataclass
+class RequestBreakdown:
+    """Accumulated per request; observed once the route is known."""
+
+    started: float = field(default_factory=perf_counter)
+    aws_calls: List[AwsCall] = field(default_factory=list)
+    consumed_capacity: Dict[str, float] = field(default_factory=dict)  # table -> CU
+    db_queries: int = 0
+    db_seconds: float = 0.0
+
+    @property
+    def aws_seconds(self) -> float:
+        return sum(call.seconds for call in self.aws_calls)
+
+    def by_operation(self) -> Dict[Tuple[str, str], Tuple[int, float]]:
+        ops: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        for call in self.aws_calls:
+            count, seconds = ops.get((call.service, call.operation), (0, 0.0))
+            ops[(call.service, call.operation)] = (count + 1, seconds + call.seconds)
+        return ops
+
+    def server_timing(self, total_seconds: float) -> List[str]:
+        entries = [
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"',
+            f'aws;dur={self.aws_seconds * 1000:.1f};desc="{len(self.aws_calls)} calls"',
+        ]
+        for (service, operation), (count, seconds) in self.by_operation().items():
+            entries.append(
+                f'aws.{service}.{operation};dur={seconds * 1000:.1f};desc="x{count}"'
+            )
+        for table, units in self.consumed_capacity.items():
+            entries.append(f'ddb.{table};desc="{units:g} CU"')
+        entries.append(f"app;dur={total_seconds * 1000:.1f}")
+        return entries
+
+    def observe(self, route: str, method: str, status: int, total: float) -> None:
+        prometheus.observe_request(route, method, status, total, self)
+
+
+_current: ContextVar[Optional[RequestBreakdown]] = ContextVar(
+    "request_breakdown", default=None
+)
+
+
+def begin() -> Any:
+    return _current.set(RequestBreakdown())
+
+
+def end(token) -> Optional[RequestBreakdown]:
+    breakdown = _current.get()
+    _current.reset(token)
+    return breakdown
+
+
+def current() -> Optional[RequestBreakdown]:
+    return _current.get()
+
+
+# ---------- DB ----------
+
+
+def db_execute_wrapper(execute, sql, params, many, context):
+    """connection.execute_wrapper hook; counts into the current breakdown."""
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        breakdown = _current.get()
+        if breakdown is not None:
+            breakdown.db_queries += 1
+            breakdown.db_seconds += perf_counter() - started
+
+
+def track_db_time(sender, connection, **_):
+    if db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_execute_wrapper)
+
+
+# ---------- botocore ----------
+
+
+def _before_call(model, context, **_):
+    context[_STARTED] = (
+        perf_counter(),
+        model.service_model.endpoint_prefix,
+        model.name,
+    )
+
+
+def _record(context, error: bool, parsed=None) -> None:
+    started = context.pop(_STARTED, None)
+    if started is None:
+        return
+    t0, service, operation = started
+    call = AwsCall(service, operation, perf_counter() - t0, error)
+    capacity = _consumed_capacity(parsed) if parsed else {}
+    breakdown = _current.get()
+    if breakdown is None:
+        prometheus.observe_aws_call(NO_ROUTE, call, capacity)
+        return
+    breakdown.aws_calls.append(call)
+    for table, units in capacity.items():
+        breakdown.consumed_capacity[table] = (
+            breakdown.consumed_capacity.get(table, 0.0) + units
+        )
+
+
+def _after_call(context, http_response=None, parsed=None, **_):
+    error = http_response is not None and http_response.status_code >= 300
+    _record(context, error=error, parsed=parsed)
+
+
+def _after_call_error(context, **_):
+    # transport failure after retries; botocore sends no model here
+    _record(context, error=True)
+
+
+def _consumed_capacity(parsed: dict) -> Dict[str, float]:
+    consumed = parsed.get("ConsumedCapacity")
+    if not consumed:
+        return {}
+    items = consumed if isinstance(consumed, list) else [consumed]
+    return {
+        item["TableName"]: float(item.get("CapacityUnits", 0.0))
+        for item in items
+        if "TableName" in item
+    }
+
+
+def _request_consumed_capacity(params, model, **_):
+    shape = model.input_shape
+    if shape is not None and "ReturnConsumedCapacity" in shape.members:
+        params.setdefault("ReturnConsumedCapacity", "TOTAL")
+
+
+def instrument_client(client):
+    """Attach the timing hooks to a botocore client (idempotent)."""
+    events = client.meta.events
+    # first in line: a handler that answers before-call (stubs, caches) would
+    # otherwise short-circuit ours
+    events.register_first(
+        "before-call.*.*", _before_call, unique_id=f"{_HOOK_ID}.before"
+    )
+    events.register("after-call.*.*", _after_call, unique_id=f"{_HOOK_ID}.after")
+    events.register(
+        "after-call-error.*.*", _after_call_error, unique_id=f"{_HOOK_ID}.error"
+    )
+    if client.meta.service_model.endpoint_prefix == "dynamodb":
+        events.register(
+            "provide-client-params.dynamodb.*",
+            _request_consumed_capacity,
+            unique_id=f"{_HOOK_ID}.capacity",
+        )
+    return client
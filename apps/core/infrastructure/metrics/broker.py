@@ -0,0 +1,108 @@
+# apps/core/infrastructure/metrics/broker.py
+"""
+Queue depth and backlog age, read from the broker at scrape time.
+
+- Redis: LLEN per queue list; the oldest message is the list tail, and its
+  age comes from the `sent_at` header task_metrics stamps on publish.
+- SQS: ApproximateNumberOfMessages (backlog age is the CloudWatch metric
+  ApproximateAgeOfOldestMessage; SQS does not expose it per request).
+"""
+from __future__ import annotations
+import json
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+from prometheus_client import CollectorRegistry
+from prometheus_client.core import GaugeMetricFamily
+
+from apps.core.infrastructure.metrics.task_metrics import SENT_AT_HEADER
+
+logger = logging.getLogger(__name__)
+
+QueueSample = Tuple[int, Optional[float]]  # (depth, oldest age in seconds)
+
+
+def redis_queue_samples(client, queues: Iterable[str], now: Optional[float] = None):
+    now = time.time() if now is None else now
+    samples: Dict[str, QueueSample] = {}
+    for queue in queues:
+        depth = client.llen(queue)
+        age = None
+        if depth:
+            raw = client.lindex(queue, -1)
+            try:
+                sent_at = json.loads(raw)["headers"].get(SENT_AT_HEADER)
+                age = max(0.0, now - float(sent_at)) if sent_at is not None else None
+            except (TypeError, ValueError, KeyError):
+                age = None
+        samples[queue] = (depth, age)
+    return samples
+
+
+def sqs_queue_samples(client, queues: Iterable[str], prefix: str = ""):
+    samples: Dict[str, QueueSample] = {}
+    for queue in queues:
+        url = client.get_queue_url(QueueName=f"{prefix}{queue}")["QueueUrl"]
+        attrs = client.get_queue_attributes(
+            QueueUrl=url, AttributeNames=["ApproximateNumberOfMessages"]
+        )["Attributes"]
+        samples[queue] = (int(attrs.get("ApproximateNumberOfMessages", 0)), None)
+    return samples
+
+
+@lru_cache(maxsize=4)
+def _redis_client(url: str):
+    """One client (and connection pool) per broker URL, reused across scrapes."""
+    import redis
+
+    return redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+
+
+def sample_queues() -> Dict[str, QueueSample]:
+    from config.celery import app
+
+    queues = [q.name for q in app.conf.task_queues or ()]
+    url = app.conf.broker_url or ""
+    if url.startswith(("redis://", "rediss://")):
+        return redis_queue_samples(_redis_client(url), queues)
+    if url.startswith("sqs://"):
+        from apps.core.infrastructure.aws.clients import get_sqs_client
+
+        prefix = (app.conf.broker_transport_options or {}).get("queue_name_prefix", "")
+        return sqs_queue_samples(get_sqs_client(), queues, prefix)
+    return {}
+
+
+class BrokerQueueCollector:
+    def describe(self):
+        return []
+
+    def collect(self):
+        depth = GaugeMetricFamily(
+            "celery_queue_depth", "Messages waiting in the broker", labels=["queue"]
+        )
+        age = GaugeMetricFamily(
+            "celery_queue_oldest_message_age_seconds",
+            "Age of the oldest waiting message (Redis broker only)",
+            labels=["queue"],
+        )
+        try:
+            samples = sample_queues()
+        except Exception as exc:  # a scrape must not fail on the broker
+            logger.warning("broker queue sampling failed: %s", exc)
+            samples = {}
+        for queue, (count, oldest) in samples.items():
+            depth.add_metric([queue], count)
+            if oldest is not None:
+                age.add_metric([queue], oldest)
+        yield depth
+        yield age
+
+
+@lru_cache(maxsize=1)
+def broker_registry() -> CollectorRegistry:
+    registry = CollectorRegistry(auto_describe=False)
+    registry.register(BrokerQueueCollector())
+    return registry
@@ -0,0 +1,117 @@
+# apps/core/infrastructure/metrics/prometheus.py
+"""
+Prometheus collectors for the request breakdown, and the /metrics payload.
+
+With several gunicorn workers set PROMETHEUS_MULTIPROC_DIR (an empty, writable
+directory shared by the workers); render() then aggregates every process's
+samples and config/gunicorn.py cleans up after exited workers. Celery queue
+depth/backlog age (metrics/broker.py) is sampled from the broker per scrape.
+"""
+from __future__ import annotations
+import hmac
+import ipaddress
+import os
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from django.conf import settings
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+if TYPE_CHECKING:
+    from apps.core.infrastructure.metrics.breakdown import AwsCall, RequestBreakdown
+
+_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_COUNTS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency, outermost middleware to response",
+    ["route", "method", "status"],
+    buckets=_SECONDS,
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent in DB queries per request",
+    ["route"],
+    buckets=_SECONDS,
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "DB queries per request",
+    ["route"],
+    buckets=_COUNTS,
+)
+HTTP_REQUEST_AWS_CALLS = Histogram(
+    "http_request_aws_calls",
+    "AWS API calls per request",
+    ["route"],
+    buckets=_COUNTS,
+)
+AWS_CALL_SECONDS = Histogram(
+    "aws_call_duration_seconds",
+    "botocore call latency (retries included)",
+    ["route", "service", "operation", "outcome"],
+    buckets=_SECONDS,
+)
+DYNAMODB_CONSUMED_CAPACITY = Counter(
+    "dynamodb_consumed_capacity_units",
+    "DynamoDB capacity units reported by ReturnConsumedCapacity",
+    ["route", "table"],
+)
+
+
+def observe_aws_call(route: str, call: "AwsCall", capacity: Dict[str, float]) -> None:
+    AWS_CALL_SECONDS.labels(
+        route, call.service, call.operation, "error" if call.error else "ok"
+    ).observe(call.seconds)
+    for table, units in capacity.items():
+        DYNAMODB_CONSUMED_CAPACITY.labels(route, table).inc(units)
+
+
+def observe_request(
+    route: str, method: str, status: int, total: float, breakdown: "RequestBreakdown"
+) -> None:
+    HTTP_REQUEST_SECONDS.labels(route, method, str(status)).observe(total)
+    HTTP_REQUEST_DB_SECONDS.labels(route).observe(breakdown.db_seconds)
+    HTTP_REQUEST_DB_QUERIES.labels(route).observe(breakdown.db_queries)
+    HTTP_REQUEST_AWS_CALLS.labels(route).observe(len(breakdown.aws_calls))
+    for call in breakdown.aws_calls:
+        observe_aws_call(route, call, {})
+    for table, units in breakdown.consumed_capacity.items():
+        DYNAMODB_CONSUMED_CAPACITY.labels(route, table).inc(units)
+
+
+def scrape_allowed(request) -> bool:
+    """A client in METRICS_ALLOWED_CIDRS, or `Authorization: Bearer METRICS_TOKEN`."""
+    token = settings.METRICS_TOKEN
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    if token and hmac.compare_digest(header.encode(), f"Bearer {token}".encode()):
+        return True
+    try:
+        addr = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    return any(
+        addr in ipaddress.ip_network(cidr, strict=False)
+        for cidr in settings.METRICS_ALLOWED_CIDRS
+    )
+
+
+def render() -> Tuple[bytes, str]:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        payload = generate_latest(registry)
+    else:
+        payload = generate_latest()
+    if settings.CELERY_QUEUE_METRICS:
+        from apps.core.infrastructure.metrics.broker import broker_registry
+
+        payload += generate_latest(broker_registry())
+    return payload, CONTENT_TYPE_LATEST
@@ -0,0 +1,111 @@
+# apps/core/infrastructure/metrics/task_metrics.py
+"""
+Celery task timing, wired to the signals in config/celery.py:
+
+- before_task_publish: stamp_headers() adds a `sent_at` header (epoch seconds).
+- task_prerun: enqueue-to-start latency (from sent_at, or the ETA if later).
+- task_postrun / task_retry: runtime per outcome, retry count.
+
+Labels are task name and queue (the delivery routing key). Workers expose the
+numbers on CELERY_METRICS_PORT; with prefork set PROMETHEUS_MULTIPROC_DIR so
+the pool children's samples are aggregated.
+"""
+from __future__ import annotations
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, multiprocess
+from prometheus_client import start_http_server as _start_http_server
+
+logger = logging.getLogger(__name__)
+
+SENT_AT_HEADER = "sent_at"
+_WAIT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+_RUN_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 1800.0)
+
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Enqueue (or ETA) to start of execution",
+    ["task", "queue"],
+    buckets=_WAIT_BUCKETS,
+)
+TASK_RUNTIME_SECONDS = Histogram(
+    "celery_task_runtime_seconds",
+    "Task run time by final state",
+    ["task", "queue", "outcome"],
+    buckets=_RUN_BUCKETS,
+)
+TASK_RETRIES = Counter(
+    "celery_task_retries",
+    "Task retries requested",
+    ["task", "queue"],
+)
+
+_running: Dict[str, Tuple[float, str]] = {}  # task_id -> (perf_counter, queue)
+
+
+def stamp_headers(headers: Optional[dict]) -> None:
+    if headers is not None:
+        # overwritten on retry: the wait is measured per delivery
+        headers[SENT_AT_HEADER] = time.time()
+
+
+def task_queue(task) -> str:
+    delivery = getattr(task.request, "delivery_info", None) or {}
+    return delivery.get("routing_key") or "unknown"
+
+
+def _ready_at(request) -> Optional[float]:
+    sent_at = getattr(request, SENT_AT_HEADER, None)
+    if sent_at is None:
+        sent_at = (getattr(request, "headers", None) or {}).get(SENT_AT_HEADER)
+    if sent_at is None:
+        return None
+    ready = float(sent_at)
+    eta = getattr(request, "eta", None)
+    if eta:  # countdown/eta tasks only become runnable then
+        ready = max(ready, datetime.fromisoformat(str(eta)).timestamp())
+    return ready
+
+
+def task_started(task, task_id) -> Optional[float]:
+    """Record the start; returns the queue wait in seconds if known."""
+    queue = task_queue(task)
+    _running[task_id] = (time.perf_counter(), queue)
+    ready = _ready_at(task.request)
+    if ready is None:
+        return None
+    wait = max(0.0, time.time() - ready)
+    TASK_QUEUE_WAIT_SECONDS.labels(task.name, queue).observe(wait)
+    return wait
+
+
+def task_finished(task, task_id, state: Optional[str]) -> Optional[float]:
+    """Record the runtime; returns it in seconds."""
+    started = _running.pop(task_id, None)
+    if started is None:
+        return None
+    t0, queue = started
+    runtime = time.perf_counter() - t0
+    TASK_RUNTIME_SECONDS.labels(task.name, queue, (state or "unknown").lower()).observe(
+        runtime
+    )
+    return runtime
+
+
+def task_retried(task) -> None:
+    TASK_RETRIES.labels(task.name, task_queue(task)).inc()
+
+
+def start_http_server(port: int) -> None:
+    """Serve /metrics from the worker's main process."""
+    registry = None
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    kwargs = {"registry": registry} if registry is not None else {}
+    _start_http_server(port, **kwargs)
+    logger.info("celery metrics on :%s", port)
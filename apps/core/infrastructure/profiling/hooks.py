@@ -0,0 +1,117 @@
+# apps/core/infrastructure/profiling/hooks.py
+"""
+When to profile, and what happens to the result.
+
+A request or task is profiled when PROFILING_ENABLED is on and either it
+carries a valid token (`X-Profile-Token` header / `profile_token` task
+header, see make_token) or it falls into PROFILING_SAMPLE_RATE /
+PROFILING_TASK_SAMPLE_RATE. With PROFILING_ENABLED off no sampler thread is
+ever started and the hooks return after one settings lookup.
+
+Profiles are stored under a generated id (ProfiledViewMixin returns it in
+`X-Profile-Id`); `manage.py profiling get <id>` fetches one.
+"""
+from __future__ import annotations
+import hashlib
+import hmac
+import logging
+import random
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from apps.core.infrastructure.profiling.sampler import SamplingProfiler
+from apps.core.infrastructure.profiling.store import get_profile_store
+
+logger = logging.getLogger(__name__)
+
+TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+TASK_TOKEN_HEADER = "profile_token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+# ---------- tokens ----------
+
+
+def _signature(expires: int) -> str:
+    return hmac.new(
+        settings.PROFILING_SECRET.encode(),
+        f"profile:{expires}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def make_token(ttl: int = 600) -> str:
+    expires = int(time.time()) + ttl
+    return f"{expires}.{_signature(expires)}"
+
+
+def verify_token(token: Optional[str]) -> bool:
+    if not token or not settings.PROFILING_SECRET:
+        return False
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(int(expires)))
+
+
+def should_profile(token: Optional[str], sample_rate: float) -> bool:
+    if not settings.PROFILING_ENABLED:
+        return False
+    if verify_token(token):
+        return True
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+# ---------- start / finish ----------
+
+
+def start() -> SamplingProfiler:
+    return SamplingProfiler(
+        threading.get_ident(), interval=settings.PROFILING_INTERVAL_MS / 1000
+    ).start()
+
+
+def finish(profiler: SamplingProfiler, label: str) -> Optional[str]:
+    """Stop, store, and return the profile id (None if storing failed)."""
+    profile = profiler.stop()
+    profile_id = f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{uuid.uuid4().hex[:12]}"
+    try:
+        location = get_profile_store().save(profile_id, profile.collapsed().encode())
+    except Exception:
+        logger.exception("profile %s for %s could not be stored", profile_id, label)
+        return None
+    logger.info(
+        "profile %s: %s %.1fms samples=%d -> %s",
+        profile_id,
+        label,
+        profile.duration * 1000,
+        profile.sample_count,
+        location,
+    )
+    return profile_id
+
+
+# ---------- celery (task_prerun / task_postrun in config/celery.py) ----------
+
+_task_profilers: Dict[str, SamplingProfiler] = {}
+
+
+def task_started(task, task_id) -> None:
+    if not settings.PROFILING_ENABLED:
+        return
+    request = getattr(task, "request", None)
+    token = getattr(request, TASK_TOKEN_HEADER, None) or (
+        getattr(request, "headers", None) or {}
+    ).get(TASK_TOKEN_HEADER)
+    if should_profile(token, settings.PROFILING_TASK_SAMPLE_RATE):
+        _task_profilers[task_id] = start()
+
+
+def task_finished(task, task_id) -> None:
+    profiler = _task_profilers.pop(task_id, None)
+    if profiler is not None:
+        finish(profiler, f"task {task.name}[{task_id}]")
@@ -0,0 +1,93 @@
+# apps/core/infrastructure/profiling/sampler.py
+"""
+Statistical profiler for one thread, stdlib only.
+
+A daemon thread wakes every `interval` seconds, reads the target thread's
+frame from sys._current_frames() and counts the stack. Nothing is hooked into
+the target (no sys.setprofile), so its cost is the sampling thread's wakeups,
+and only while a profile is running.
+"""
+from __future__ import annotations
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    name = getattr(code, "co_qualname", code.co_name)
+    # ";" separates frames in the collapsed format
+    return f"{module}:{name}:{frame.f_lineno}".replace(";", ":")
+
+
+def _stack(frame, max_depth: int) -> Stack:
+    frames = []
+    while frame is not None and len(frames) < max_depth:
+        frames.append(_frame_label(frame))
+        frame = frame.f_back
+    return tuple(reversed(frames))  # root first
+
+
+@dataclass
+class Profile:
+    samples: Counter = field(default_factory=Counter)
+    interval: float = 0.0
+    duration: float = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded format: `root;...;leaf count` per line."""
+        return "".join(
+            f"{';'.join(stack)} {count}\n"
+            for stack, count in self.samples.most_common()
+        )
+
+
+class SamplingProfiler:
+    def __init__(
+        self,
+        thread_id: Optional[int] = None,
+        *,
+        interval: float = 0.005,
+        max_depth: int = 128,
+    ):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.max_depth = max_depth
+        self._profile = Profile(interval=interval)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._profile.duration = time.perf_counter() - self._started
+        return self._profile
+
+    def _run(self) -> None:
+        samples = self._profile.samples
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:  # target thread exited
+                return
+            samples[_stack(frame, self.max_depth)] += 1
+            del frame
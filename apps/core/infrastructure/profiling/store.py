@@ -0,0 +1,67 @@
+# apps/core/infrastructure/profiling/store.py
+"""Where collapsed-stack profiles go: PROFILING_STORE = "local" | "s3"."""
+from __future__ import annotations
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from django.conf import settings
+
+
+class ProfileStore(Protocol):
+    def save(self, profile_id: str, data: bytes) -> str: ...
+
+    def load(self, profile_id: str) -> bytes: ...
+
+
+class LocalProfileStore:
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _path(self, profile_id: str) -> Path:
+        return self.directory / f"{Path(profile_id).name}.collapsed"
+
+    def save(self, profile_id: str, data: bytes) -> str:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(profile_id)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".profile-")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+        return str(path)
+
+    def load(self, profile_id: str) -> bytes:
+        return self._path(profile_id).read_bytes()
+
+
+class S3ProfileStore:
+    def __init__(self, bucket: str, prefix: str):
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, profile_id: str) -> str:
+        return f"{self.prefix}{profile_id}.collapsed"
+
+    def save(self, profile_id: str, data: bytes) -> str:
+        from apps.core.infrastructure.aws.clients import get_s3_client
+
+        key = self._key(profile_id)
+        get_s3_client().put_object(
+            Bucket=self.bucket, Key=key, Body=data, ContentType="text/plain"
+        )
+        return f"s3://{self.bucket}/{key}"
+
+    def load(self, profile_id: str) -> bytes:
+        from apps.core.infrastructure.aws.clients import get_s3_client
+
+        obj = get_s3_client().get_object(Bucket=self.bucket, Key=self._key(profile_id))
+        return obj["Body"].read()
+
+
+@lru_cache(maxsize=1)
+def get_profile_store() -> ProfileStore:
+    if settings.PROFILING_STORE == "s3":
+        return S3ProfileStore(settings.PROFILING_S3_BUCKET, settings.PROFILING_S3_PREFIX)
+    return LocalProfileStore(settings.PROFILING_DIR)
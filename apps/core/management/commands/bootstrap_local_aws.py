@@ -0,0 +1,152 @@
+# apps/core/management/commands/bootstrap_local_aws.py
+"""
+Provision a local AWS stand-in (moto server) for load tests: the upload
+bucket, the upload-session table, the SQS queue receiving the bucket's
+ObjectCreated events (with a dead-letter queue after EVENTS_MAX_RECEIVES
+deliveries), a Cognito user pool + app client with
+USER_PASSWORD_AUTH, and N confirmed users mirrored into the local users table.
+
+Refuses to run without settings.AWS_ENDPOINT_URL so it can never touch a real
+account. Re-running is safe. The generated pool/client ids are written as
+KEY=value lines (--env-file) for the web and worker containers to source.
+"""
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Dict
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.infrastructure.aws import cognito
+from apps.core.infrastructure.aws.clients import (
+    get_dynamodb_resource,
+    get_s3_client,
+    get_sqs_client,
+)
+from apps.core.services.auth_service import AuthService
+from apps.file_upload.infrastructure.repositories.dynamo_session_repository import (
+    create_session_table,
+)
+
+POOL_NAME = "local-load-test"
+EVENTS_QUEUE = "s3-object-created"
+EVENTS_MAX_RECEIVES = 5
+
+
+def _ignore(exc: ClientError, *codes: str) -> None:
+    if exc.response["Error"]["Code"] not in codes:
+        raise exc
+
+
+class Command(BaseCommand):
+    help = "Create bucket, session table, Cognito pool and load-test users on AWS_ENDPOINT_URL."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--user-prefix", default="loaduser")
+        parser.add_argument("--password", default="Load-test-pass-1!")
+        parser.add_argument("--env-file", help="write the generated settings here")
+
+    def handle(self, *args, **options):
+        if not settings.AWS_ENDPOINT_URL:
+            raise CommandError("AWS_ENDPOINT_URL is not set; refusing to provision real AWS")
+        if not settings.AWS_STORAGE_BUCKET_NAME:
+            raise CommandError("AWS_STORAGE_BUCKET_NAME is not set")
+
+        try:
+            get_s3_client().create_bucket(Bucket=settings.AWS_STORAGE_BUCKET_NAME)
+        except ClientError as exc:
+            _ignore(exc, "BucketAlreadyOwnedByYou", "BucketAlreadyExists")
+        try:
+            create_session_table(get_dynamodb_resource().meta.client)
+        except ClientError as exc:
+            _ignore(exc, "ResourceInUseException")
+        queue_url = self._events_queue(settings.AWS_STORAGE_BUCKET_NAME)
+
+        idp = cognito._client()
+        pool_id, client_id = self._user_pool(idp)
+        for i in range(options["users"]):
+            self._user(idp, pool_id, f"{options['user_prefix']}{i}", options["password"])
+
+        values: Dict[str, str] = {
+            "AWS_ENDPOINT_URL": settings.AWS_ENDPOINT_URL,
+            "AWS_STORAGE_BUCKET_NAME": settings.AWS_STORAGE_BUCKET_NAME,
+            "AWS_COGNITO_USER_POOL_ID": pool_id,
+            "AWS_COGNITO_CLIENT_ID": client_id,
+            "S3_EVENTS_QUEUE_URL": queue_url,
+        }
+        lines = "".join(f"{k}={v}\n" for k, v in values.items())
+        if options["env_file"]:
+            Path(options["env_file"]).write_text(lines)
+        self.stdout.write(lines, ending="")
+        self.stderr.write(f"{options['users']} users ready in pool {pool_id}")
+
+    def _events_queue(self, bucket: str) -> str:
+        sqs = get_sqs_client()
+        queue_url = sqs.create_queue(QueueName=EVENTS_QUEUE)["QueueUrl"]
+        arn = sqs.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["QueueArn"])
+        dlq_url = sqs.create_queue(QueueName=f"{EVENTS_QUEUE}-dlq")["QueueUrl"]
+        dlq = sqs.get_queue_attributes(QueueUrl=dlq_url, AttributeNames=["QueueArn"])
+        # messages the consumer keeps failing on end up there
+        sqs.set_queue_attributes(
+            QueueUrl=queue_url,
+            Attributes={
+                "RedrivePolicy": json.dumps(
+                    {
+                        "deadLetterTargetArn": dlq["Attributes"]["QueueArn"],
+                        "maxReceiveCount": str(EVENTS_MAX_RECEIVES),
+                    }
+                )
+            },
+        )
+        get_s3_client().put_bucket_notification_configuration(
+            Bucket=bucket,
+            NotificationConfiguration={
+                "QueueConfigurations": [
+                    {
+                        "QueueArn": arn["Attributes"]["QueueArn"],
+                        "Events": ["s3:ObjectCreated:*"],
+                    }
+                ]
+            },
+        )
+        return queue_url
+
+    def _user_pool(self, idp) -> tuple[str, str]:
+        pools = idp.list_user_pools(MaxResults=60)["UserPools"]
+        pool_id = next((p["Id"] for p in pools if p["Name"] == POOL_NAME), None)
+        if pool_id is None:
+            pool_id = idp.create_user_pool(PoolName=POOL_NAME)["UserPool"]["Id"]
+        clients = idp.list_user_pool_clients(UserPoolId=pool_id, MaxResults=60)
+        for c in clients["UserPoolClients"]:
+            if c["ClientName"] == POOL_NAME:
+                return pool_id, c["ClientId"]
+        created = idp.create_user_pool_client(
+            UserPoolId=pool_id,
+            ClientName=POOL_NAME,
+            GenerateSecret=False,
+            ExplicitAuthFlows=["ALLOW_USER_PASSWORD_AUTH", "ALLOW_REFRESH_TOKEN_AUTH"],
+        )
+        return pool_id, created["UserPoolClient"]["ClientId"]
+
+    def _user(self, idp, pool_id: str, username: str, password: str) -> None:
+        email = f"{username}@example.com"
+        try:
+            idp.admin_create_user(
+                UserPoolId=pool_id,
+                Username=username,
+                UserAttributes=[{"Name": "email", "Value": email}],
+                MessageAction="SUPPRESS",
+            )
+        except ClientError as exc:
+            _ignore(exc, "UsernameExistsException")
+        idp.admin_set_user_password(
+            UserPoolId=pool_id, Username=username, Password=password, Permanent=True
+        )
+        attrs = idp.admin_get_user(UserPoolId=pool_id, Username=username)["UserAttributes"]
+        sub = next(a["Value"] for a in attrs if a["Name"] == "sub")
+        AuthService()._upsert_user(
+            sub=sub, email=email, username=username, given_name=username
+        )
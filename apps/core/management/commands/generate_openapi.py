@@ -0,0 +1,28 @@
+# apps/core/management/commands/generate_openapi.py
+from __future__ import annotations
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.openapi import write_artifacts
+
+
+class Command(BaseCommand):
+    help = (
+        "Render swagger.json/swagger.yaml (+ .gz/.br) into OPENAPI_SCHEMA_DIR "
+        "so /swagger.json serves a stored artifact. Run at image build time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            help="defaults to settings.OPENAPI_SCHEMA_DIR",
+        )
+
+    def handle(self, *args, **options):
+        directory = Path(options["output_dir"] or settings.OPENAPI_SCHEMA_DIR)
+        for path in write_artifacts(directory):
+            self.stdout.write(f"{path} ({path.stat().st_size} bytes)")
+        self.stdout.write(self.style.SUCCESS("OpenAPI artifacts written"))
@@ -0,0 +1,65 @@
+# apps/core/management/commands/manage_partitions.py
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.core.infrastructure.db.partitioning import maintain_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming monthly partitions and detach those past retention "
+        "for settings.PARTITIONED_TABLES (the beat task runs this daily)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--table",
+            action="append",
+            dest="tables",
+            help="limit to this table (repeatable)",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=None,
+            help="defaults to settings.PARTITION_MONTHS_AHEAD",
+        )
+        parser.add_argument(
+            "--keep-months",
+            type=int,
+            default=None,
+            help="override the per-table retention (0 = keep everything)",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            default=None,
+            help="drop detached partitions instead of keeping them for archiving",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "postgresql":
+            self.stdout.write(self.style.WARNING("not a Postgres database; nothing to do"))
+            return
+        tables = dict(settings.PARTITIONED_TABLES)
+        if options["tables"]:
+            tables = {t: tables.get(t, 0) for t in options["tables"]}
+        if options["keep_months"] is not None:
+            tables = {t: options["keep_months"] for t in tables}
+        report = maintain_partitions(
+            connection,
+            tables,
+            months_ahead=options["months_ahead"],
+            drop=options["drop"],
+        )
+        for table, changes in report.items():
+            self.stdout.write(
+                f"{table}: created={changes['created'] or '-'} "
+                f"detached={changes['detached'] or '-'}"
+            )
+        self.stdout.write(self.style.SUCCESS("partitions up to date"))
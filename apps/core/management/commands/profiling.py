@@ -0,0 +1,35 @@
+# apps/core/management/commands/profiling.py
+from __future__ import annotations
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.infrastructure.profiling.hooks import make_token
+from apps.core.infrastructure.profiling.store import get_profile_store
+
+
+class Command(BaseCommand):
+    help = (
+        "`token`: print an X-Profile-Token for on-demand profiling; "
+        "`get <id>`: print a stored collapsed-stack profile."
+    )
+
+    def add_arguments(self, parser):
+        sub = parser.add_subparsers(dest="subcommand", required=True)
+        token = sub.add_parser("token")
+        token.add_argument("--ttl", type=int, default=600, help="seconds")
+        get = sub.add_parser("get")
+        get.add_argument("profile_id")
+
+    def handle(self, *args, **options):
+        if options["subcommand"] == "token":
+            if not settings.PROFILING_SECRET:
+                raise CommandError("PROFILING_SECRET is not set")
+            self.stdout.write(make_token(options["ttl"]))
+            return
+        try:
+            data = get_profile_store().load(options["profile_id"])
+        except Exception as exc:
+            raise CommandError(f"profile {options['profile_id']}: {exc}") from exc
+        sys.stdout.buffer.write(data)
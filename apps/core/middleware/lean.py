@@ -0,0 +1,196 @@
+"""
+Path-scoped, self-timing wrappers around the stock middleware.
+
+Every class here subclasses the original middleware. Wrappers built with
+``api_exempt`` step aside (``__call__`` and the ``process_*`` hooks) for paths
+under ``settings.LEAN_API_PREFIXES`` so token-authenticated API routes skip the
+session/CSRF/messages/axes machinery the admin needs. With
+``settings.MIDDLEWARE_TIMING`` on, each wrapper reports its own time (excluding
+everything downstream) in ``request.middleware_timings`` and the
+``Server-Timing`` response header; ``view`` is the handler minus process_view.
+"""
+from __future__ import annotations
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from axes.middleware import AxesMiddleware as _AxesMiddleware
+from corsheaders.middleware import CorsMiddleware as _CorsMiddleware
+from django.conf import settings
+from django.contrib.auth.middleware import (
+    AuthenticationMiddleware as _AuthenticationMiddleware,
+)
+from django.contrib.messages.middleware import MessageMiddleware as _MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware as _SessionMiddleware
+from django.middleware.clickjacking import (
+    XFrameOptionsMiddleware as _XFrameOptionsMiddleware,
+)
+from django.middleware.common import CommonMiddleware as _CommonMiddleware
+from django.middleware.csrf import CsrfViewMiddleware as _CsrfViewMiddleware
+from django.middleware.security import SecurityMiddleware as _SecurityMiddleware
+from whitenoise.middleware import WhiteNoiseMiddleware as _WhiteNoiseMiddleware
+
+
+def _timings(request) -> dict:
+    try:
+        return request.middleware_timings
+    except AttributeError:
+        request.middleware_timings = {}
+        return request.middleware_timings
+
+
+class ScopedMiddlewareMixin:
+    skip_on_api = False
+    timing_name = ""
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self._lean_prefixes = (
+            tuple(getattr(settings, "LEAN_API_PREFIXES", ())) if self.skip_on_api else ()
+        )
+        self._timed = getattr(settings, "MIDDLEWARE_TIMING", False)
+        if self._timed:
+            self.get_response = self._timed_downstream(self.get_response)
+
+    def bypass(self, request) -> bool:
+        return bool(self._lean_prefixes) and request.path_info.startswith(
+            self._lean_prefixes
+        )
+
+    def __call__(self, request):
+        if self.bypass(request):
+            return self.get_response(request)
+        if not self._timed:
+            return super().__call__(request)
+        if iscoroutinefunction(self):
+            return self._acall_timed(request)
+        started = perf_counter()
+        response = super().__call__(request)
+        return self._record(request, response, perf_counter() - started)
+
+    async def _acall_timed(self, request):
+        started = perf_counter()
+        response = await super().__call__(request)
+        return self._record(request, response, perf_counter() - started)
+
+    # ---------- timing helpers ----------
+    def _timed_downstream(self, get_response):
+        def mark(request, started):
+            request.__dict__.setdefault("_mw_downstream", {})[self] = (
+                perf_counter() - started
+            )
+
+        if iscoroutinefunction(get_response):
+
+            async def inner(request):
+                started = perf_counter()
+                try:
+                    return await get_response(request)
+                finally:
+                    mark(request, started)
+
+            return markcoroutinefunction(inner)
+
+        def inner(request):
+            started = perf_counter()
+            try:
+                return get_response(request)
+            finally:
+                mark(request, started)
+
+        return inner
+
+    def _record(self, request, response, total: float):
+        downstream = request.__dict__.get("_mw_downstream", {}).pop(self, 0.0)
+        timings = _timings(request)
+        entries = []
+        # the innermost middleware that actually ran exits first and reports
+        # the handler; bypassed wrappers below it cost ~nothing
+        if "view" not in timings:
+            view = downstream - request.__dict__.get("_mw_process_view", 0.0)
+            timings["view"] = view * 1000
+            entries.append(f"view;dur={view * 1000:.3f}")
+        own = total - downstream
+        own += request.__dict__.get("_mw_own_process_view", {}).pop(self, 0.0)
+        timings[self.timing_name] = own * 1000
+        entries.append(f"mw-{self.timing_name};dur={own * 1000:.3f}")
+        existing = response.get("Server-Timing")
+        response["Server-Timing"] = ", ".join(filter(None, [existing, *entries]))
+        return response
+
+
+def _hooks(cls):
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.bypass(request):
+            return None
+        base = super(cls, self).process_view
+        if not self._timed:
+            return base(request, view_func, view_args, view_kwargs)
+        started = perf_counter()
+        try:
+            return base(request, view_func, view_args, view_kwargs)
+        finally:
+            elapsed = perf_counter() - started
+            request._mw_process_view = (
+                request.__dict__.get("_mw_process_view", 0.0) + elapsed
+            )
+            request.__dict__.setdefault("_mw_own_process_view", {})[self] = elapsed
+
+    def process_exception(self, request, exception):
+        if self.bypass(request):
+            return None
+        return super(cls, self).process_exception(request, exception)
+
+    def process_template_response(self, request, response):
+        if self.bypass(request):
+            return response
+        return super(cls, self).process_template_response(request, response)
+
+    return {
+        "process_view": process_view,
+        "process_exception": process_exception,
+        "process_template_response": process_template_response,
+    }
+
+
+def _wrap(middleware_cls, *, skip_on_api: bool):
+    cls = type(
+        middleware_cls.__name__,
+        (ScopedMiddlewareMixin, middleware_cls),
+        {
+            "__module__": __name__,
+            "__doc__": middleware_cls.__doc__,
+            "skip_on_api": skip_on_api,
+            "timing_name": middleware_cls.__name__.removesuffix("Middleware").lower(),
+        },
+    )
+    # only hook what the original implements; the handler registers any
+    # process_* it finds
+    for name, fn in _hooks(cls).items():
+        if hasattr(middleware_cls, name):
+            setattr(cls, name, fn)
+    return cls
+
+
+def api_exempt(middleware_cls):
+    """Skipped on LEAN_API_PREFIXES paths, timed everywhere else."""
+    return _wrap(middleware_cls, skip_on_api=True)
+
+
+def timed(middleware_cls):
+    """Always runs; only adds timing."""
+    return _wrap(middleware_cls, skip_on_api=False)
+
+
+# needed on every route
+SecurityMiddleware = timed(_SecurityMiddleware)
+CorsMiddleware = timed(_CorsMiddleware)
+CommonMiddleware = timed(_CommonMiddleware)
+
+# admin / browser-only concerns
+WhiteNoiseMiddleware = api_exempt(_WhiteNoiseMiddleware)
+AxesMiddleware = api_exempt(_AxesMiddleware)
+SessionMiddleware = api_exempt(_SessionMiddleware)
+CsrfViewMiddleware = api_exempt(_CsrfViewMiddleware)
+AuthenticationMiddleware = api_exempt(_AuthenticationMiddleware)
+MessageMiddleware = api_exempt(_MessageMiddleware)
+XFrameOptionsMiddleware = api_exempt(_XFrameOptionsMiddleware)
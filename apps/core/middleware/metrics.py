@@ -0,0 +1,63 @@
+"""Per-request latency breakdown: Server-Timing header + Prometheus histograms."""
+from __future__ import annotations
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from apps.core.infrastructure.metrics import breakdown
+from apps.core.infrastructure.metrics.breakdown import NO_ROUTE
+
+
+def _route(request) -> str:
+    # the URL pattern, not the path, keeps label cardinality bounded
+    match = getattr(request, "resolver_match", None)
+    return (match.route or match.view_name or NO_ROUTE) if match else NO_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    Outermost middleware. Times the request, collects the AWS calls and DB
+    queries it makes (see infrastructure/metrics/breakdown.py), observes them
+    per route, and with settings.REQUEST_BREAKDOWN_HEADER appends them to
+    Server-Timing (``db``, ``aws``, ``aws.<service>.<Operation>``,
+    ``ddb.<table>`` capacity, ``app`` total).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = settings.REQUEST_BREAKDOWN_HEADER
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = breakdown.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            state = breakdown.end(token)
+        return self.finish(request, response, state)
+
+    async def __acall__(self, request):
+        token = breakdown.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            state = breakdown.end(token)
+        return self.finish(request, response, state)
+
+    def finish(self, request, response, state):
+        total = perf_counter() - state.started
+        state.observe(_route(request), request.method, response.status_code, total)
+        if self.header:
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = ", ".join(
+                filter(None, [existing, *state.server_timing(total)])
+            )
+        return response
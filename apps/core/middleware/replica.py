@@ -0,0 +1,38 @@
+"""Per-request state for the read-replica router (read-your-writes pinning)."""
+from __future__ import annotations
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from apps.core.infrastructure.db.routing import begin_request, end_request
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Installs the request's routing state for ReplicaRouter and, if the request
+    wrote, pins the user to the primary for settings.REPLICA_PIN_SECONDS.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = begin_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            end_request(token)
+
+    async def __acall__(self, request):
+        token = begin_request(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            end_request(token)
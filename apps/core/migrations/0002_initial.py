@@ -15,6 +15,12 @@ class Migration(migrations.Migration):
         ('core', '0001_initial'),
     ]
 
+    # core's first migration only enables pgvector; anything depending on
+    # AUTH_USER_MODEL (resolved to core.__first__) needs the User created here
+    run_before = [
+        ('admin', '0001_initial'),
+    ]
+
     operations = [
         migrations.CreateModel(
             name='User',
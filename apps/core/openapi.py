@@ -0,0 +1,185 @@
+# apps/core/openapi.py
+"""
+Build-time OpenAPI artifact.
+
+`manage.py generate_openapi` renders swagger.json/swagger.yaml once (plus
+gzip/brotli siblings) into settings.OPENAPI_SCHEMA_DIR; `schema_document`
+serves those bytes with a strong ETag. Without an artifact on disk the schema
+is generated on first request and kept in memory for the process lifetime.
+"""
+from __future__ import annotations
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_safe
+from drf_yasg import openapi
+
+try:  # optional: without it only gzip variants are produced
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+SWAGGER_BASE_URL = "http://localhost:8000"
+SCHEMA_URL = f"{SWAGGER_BASE_URL}/api/v1"
+API_INFO = openapi.Info(
+    title="PDF Image Analyzer API",
+    default_version="v1",
+    description=(
+        "API for PDF and image analysis. "
+        "This OpenAPI spec can be used with Orval for frontend code generation."
+    ),
+    license=openapi.License(name="MIT License"),
+)
+
+# url suffix -> (file name, content type), same as drf-yasg's spec renderers
+FORMATS: Dict[str, Tuple[str, str]] = {
+    ".json": ("swagger.json", "application/json"),
+    ".yaml": ("swagger.yaml", "application/yaml"),
+}
+# content-coding -> file suffix, in server preference order
+ENCODINGS: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass(frozen=True)
+class SchemaArtifact:
+    content_type: str
+    digest: str
+    bodies: Dict[str, bytes]  # "identity" | "gzip" | "br" -> bytes
+    source: str  # "file" | "generated"
+
+    def etag(self, encoding: str) -> str:
+        # strong validators must differ per content-coding
+        suffix = "" if encoding == "identity" else f"-{encoding}"
+        return f'"{self.digest}{suffix}"'
+
+
+def generate_schema(fmt: str) -> bytes:
+    """Render the whole API schema (walks every viewset and serializer)."""
+    from drf_yasg.app_settings import swagger_settings
+    from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+
+    generator = swagger_settings.DEFAULT_GENERATOR_CLASS(info=API_INFO, url=SCHEMA_URL)
+    schema = generator.get_schema(request=None, public=True)
+    codec = OpenAPICodecJson if fmt == ".json" else OpenAPICodecYaml
+    return codec(validators=[]).encode(schema)
+
+
+def compress(body: bytes) -> Dict[str, bytes]:
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return variants
+
+
+def write_artifacts(directory: Path) -> List[Path]:
+    """Generate every format into `directory`; files are swapped in atomically."""
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for fmt, (name, _) in FORMATS.items():
+        body = generate_schema(fmt)
+        files = {name: body}
+        for encoding, data in compress(body).items():
+            files[name + ENCODINGS[encoding]] = data
+        for fname, data in files.items():
+            path = directory / fname
+            tmp = path.with_name(f".{fname}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            written.append(path)
+    return written
+
+
+def _build(
+    fmt: str, body: bytes, variants: Dict[str, bytes], source: str
+) -> SchemaArtifact:
+    return SchemaArtifact(
+        content_type=FORMATS[fmt][1],
+        digest=hashlib.sha256(body).hexdigest()[:32],
+        bodies={"identity": body, **variants},
+        source=source,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_artifact(fmt: str) -> SchemaArtifact:
+    name = FORMATS[fmt][0]
+    path = Path(settings.OPENAPI_SCHEMA_DIR) / name
+    try:
+        body = path.read_bytes()
+    except FileNotFoundError:
+        body = generate_schema(fmt)
+        return _build(fmt, body, compress(body), "generated")
+
+    variants = {}
+    for encoding, suffix in ENCODINGS.items():
+        sibling = path.with_name(name + suffix)
+        if sibling.exists():
+            variants[encoding] = sibling.read_bytes()
+    if "gzip" not in variants:
+        variants.update(compress(body))
+    return _build(fmt, body, variants, "file")
+
+
+def _accepted_encodings(header: str) -> List[str]:
+    accepted = []
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.append(coding.strip().lower())
+    return accepted
+
+
+def negotiate_encoding(artifact: SchemaArtifact, accept_encoding: str) -> str:
+    accepted = _accepted_encodings(accept_encoding)
+    for encoding in ENCODINGS:
+        if encoding in artifact.bodies and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
+
+
+def _if_none_match(header: Optional[str], artifact: SchemaArtifact) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return any(artifact.etag(encoding) in tags for encoding in artifact.bodies)
+
+
+@require_safe
+def schema_document(request: HttpRequest, format: str) -> HttpResponse:
+    if format not in FORMATS:
+        raise Http404
+    artifact = get_artifact(format)
+    encoding = negotiate_encoding(
+        artifact, request.META.get("HTTP_ACCEPT_ENCODING", "")
+    )
+
+    if _if_none_match(request.META.get("HTTP_IF_NONE_MATCH"), artifact):
+        response = HttpResponse(status=304)
+    else:
+        body = artifact.bodies[encoding]
+        response = HttpResponse(body, content_type=artifact.content_type)
+        response["Content-Length"] = str(len(body))
+        if encoding != "identity":
+            response["Content-Encoding"] = encoding
+    response["ETag"] = artifact.etag(encoding)
+    response["Cache-Control"] = "public, no-cache"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -0,0 +1,19 @@
+# apps/core/parsers.py
+from __future__ import annotations
+import orjson
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from apps.core.renderers import ORJSONRenderer
+
+
+class ORJSONParser(parsers.JSONParser):
+    """orjson-backed JSONParser; request bodies must be UTF-8 (RFC 8259)."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read() if stream is not None else b"")
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,33 @@
+# apps/core/renderers.py
+from __future__ import annotations
+import orjson
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+_fallback = JSONEncoder()
+
+
+def _default(obj):
+    # orjson covers dataclasses/enums/uuid/datetime natively; leave the rest
+    # (Decimal, lazy strings, querysets, ...) to DRF's encoder
+    return _fallback.default(obj)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    Drop-in for DRF's JSONRenderer backed by orjson.
+
+    Output is compact UTF-8; any requested indent renders as 2 spaces (the only
+    width orjson supports). U+2028/2029 are not escaped: valid JSON, and valid
+    JavaScript since ES2019.
+    """
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        option = self.option
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
@@ -0,0 +1 @@
+from .partition_tasks import manage_partitions  # noqa: F401
@@ -0,0 +1,11 @@
+"""Celery tasks for database maintenance."""
+from celery import shared_task
+from django.db import connection
+
+from apps.core.infrastructure.db.partitioning import maintain_partitions
+
+
+@shared_task(name="apps.core_tasks.manage_partitions")
+def manage_partitions():
+    """Create next months' partitions and detach expired ones (daily beat)."""
+    return maintain_partitions(connection)
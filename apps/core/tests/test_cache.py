@@ -0,0 +1,44 @@
+"""Tests for the shared cache utilities."""
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from apps.core.infrastructure.cache.clients import (
+    CACHE_THROTTLE,
+    cached,
+    get_redis_client,
+    make_key,
+)
+from apps.core.throttling import CachedUserRateThrottle
+
+
+class CacheUtilsTestCase(SimpleTestCase):
+    """Test cases for apps.core.infrastructure.cache."""
+
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_cached_memoizes_per_arguments(self):
+        calls = []
+
+        @cached(60)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(4), 16)
+        self.assertEqual(calls, [3, 4])
+
+    def test_make_key_bounds_length(self):
+        self.assertEqual(make_key("a", 1, None), "a:1:None")
+        self.assertTrue(make_key("x" * 500).startswith("h:"))
+        self.assertLessEqual(len(make_key("x" * 500)), 200)
+
+    def test_redis_client_is_none_for_non_redis_alias(self):
+        self.assertIsNone(get_redis_client("default"))
+
+    def test_throttle_uses_throttle_alias(self):
+        CachedUserRateThrottle.cache.set("probe", 1)
+        self.assertEqual(caches[CACHE_THROTTLE].get("probe"), 1)
+        self.assertIsNone(caches["default"].get("probe"))
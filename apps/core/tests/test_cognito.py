@@ -0,0 +1,94 @@
+"""Tests for Cognito access token verification (tokens minted by moto)."""
+import gzip
+import json
+import os
+from unittest import mock
+
+import boto3
+import moto
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from moto import mock_aws
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.core.authentication import CognitoJWTAuthentication
+from apps.core.infrastructure.aws import cognito
+
+REGION = "us-east-1"
+
+
+def _moto_jwks():
+    path = os.path.join(
+        os.path.dirname(moto.__file__), "cognitoidp", "resources", "jwks-public.json.gz"
+    )
+    with gzip.open(path) as f:
+        return json.load(f)
+
+
+class AccessTokenTestCase(SimpleTestCase):
+    """Only access tokens of this app client and this pool are accepted."""
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        idp = boto3.client("cognito-idp", region_name=REGION)
+        self.pool = idp.create_user_pool(PoolName="app")["UserPool"]["Id"]
+        self.client_id, self.other_client_id = (
+            idp.create_user_pool_client(
+                UserPoolId=self.pool,
+                ClientName=name,
+                ExplicitAuthFlows=["ADMIN_NO_SRP_AUTH"],
+            )["UserPoolClient"]["ClientId"]
+            for name in ("web", "other")
+        )
+        idp.admin_create_user(UserPoolId=self.pool, Username="ada")
+        idp.admin_set_user_password(
+            UserPoolId=self.pool, Username="ada", Password="Passw0rd!x", Permanent=True
+        )
+        self.tokens = {
+            client: idp.admin_initiate_auth(
+                UserPoolId=self.pool,
+                ClientId=client,
+                AuthFlow="ADMIN_NO_SRP_AUTH",
+                AuthParameters={"USERNAME": "ada", "PASSWORD": "Passw0rd!x"},
+            )["AuthenticationResult"]
+            for client in (self.client_id, self.other_client_id)
+        }
+        p = mock.patch.object(cognito, "_jwks", return_value=_moto_jwks())
+        p.start()
+        self.addCleanup(p.stop)
+        settings = override_settings(
+            AWS_REGION=REGION,
+            AWS_COGNITO_USER_POOL_ID=self.pool,
+            AWS_COGNITO_CLIENT_ID=self.client_id,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_own_access_token_is_accepted(self):
+        payload = cognito.verify_access_token(self.tokens[self.client_id]["AccessToken"])
+        self.assertEqual(
+            (payload["token_use"], payload["client_id"]), ("access", self.client_id)
+        )
+
+    def test_other_clients_access_token_is_rejected(self):
+        token = self.tokens[self.other_client_id]["AccessToken"]
+        with self.assertRaisesMessage(ValueError, "another client"):
+            cognito.verify_access_token(token)
+
+    def test_id_token_is_rejected(self):
+        for client in (self.client_id, self.other_client_id):
+            with self.assertRaisesMessage(ValueError, "Not an access token"):
+                cognito.verify_access_token(self.tokens[client]["IdToken"])
+
+    def test_token_of_another_pool_is_rejected(self):
+        token = self.tokens[self.client_id]["AccessToken"]
+        with override_settings(AWS_COGNITO_USER_POOL_ID=f"{REGION}_other"):
+            with self.assertRaisesMessage(ValueError, "Invalid or expired token"):
+                cognito.verify_access_token(token)
+
+    def test_bearer_auth_rejects_an_id_token(self):
+        token = self.tokens[self.other_client_id]["IdToken"]
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        with self.assertRaises(AuthenticationFailed):
+            CognitoJWTAuthentication().authenticate(request)
@@ -0,0 +1,82 @@
+"""Tests for DB pool sizing and stats."""
+from unittest import mock
+
+from django.conf import settings
+from django.db import OperationalError
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core.infrastructure.db import pool
+from config.settings import db_pool_options
+from config.urls import health_db
+
+
+class PoolSizingTestCase(SimpleTestCase):
+    """db_pool_options keeps processes * max_size within the budget."""
+
+    def test_sized_from_threads(self):
+        opts = db_pool_options(processes=4, threads=8, budget=100)
+        self.assertEqual(opts["max_size"], 9)
+        self.assertEqual(opts["min_size"], 4)
+
+    def test_capped_by_budget(self):
+        opts = db_pool_options(processes=16, threads=8, budget=80)
+        self.assertEqual(opts["max_size"], 5)
+        self.assertLessEqual(16 * opts["max_size"], 80)
+
+    def test_single_thread_prefork(self):
+        opts = db_pool_options(processes=8, threads=1, budget=80)
+        self.assertEqual((opts["min_size"], opts["max_size"]), (1, 2))
+
+    def test_checkpointer_pool_shares_the_budget(self):
+        with mock.patch("psycopg_pool.ConnectionPool") as cls:
+            pool.get_checkpointer_pool.__wrapped__()
+        sizes = (settings.DB_POOL_OPTIONS, settings.DB_CHECKPOINTER_POOL_OPTIONS)
+        self.assertEqual(cls.call_args.kwargs["max_size"], sizes[1]["max_size"])
+        self.assertLessEqual(
+            settings.DB_POOL_PROCESSES * sum(o["max_size"] for o in sizes),
+            settings.DB_POOL_BUDGET,
+        )
+
+
+class PoolStatsTestCase(SimpleTestCase):
+    """pool_stats and /health/db expose in-use, waiting and wait time."""
+
+    databases = {"default"}
+
+    def test_derived_stats(self):
+        fake = mock.Mock(closed=False)
+        fake.get_stats.return_value = {
+            "pool_min": 1,
+            "pool_max": 4,
+            "pool_size": 3,
+            "pool_available": 1,
+            "requests_num": 4,
+            "requests_wait_ms": 10,
+        }
+        with mock.patch.object(pool, "get_pool", return_value=fake):
+            stats = pool.pool_stats()
+        self.assertEqual(stats["in_use"], 2)
+        self.assertEqual(stats["wait_ms_avg"], 2.5)
+
+    def test_health_db_without_pool(self):
+        response = health_db(RequestFactory().get("/health/db"))
+        self.assertEqual(response.status_code, 200)
+        self.assertJSONEqual(
+            response.content,
+            {"ok": True, "checkout_ms": mock.ANY, "pool": None},
+        )
+
+    @override_settings(METRICS_ALLOWED_CIDRS=["10.0.0.0/24"], METRICS_TOKEN="")
+    def test_health_db_is_restricted(self):
+        response = health_db(RequestFactory().get("/health/db"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_health_db_error_names_no_host(self):
+        error = OperationalError('connection to server at "db.internal" (10.0.3.7)')
+        with mock.patch("config.urls.probe_checkout", side_effect=error), \
+                self.assertLogs("config.urls", "ERROR"):
+            response = health_db(RequestFactory().get("/health/db"))
+        self.assertEqual(response.status_code, 503)
+        self.assertJSONEqual(
+            response.content, {"ok": False, "error": "database unavailable"}
+        )
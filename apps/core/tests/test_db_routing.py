@@ -0,0 +1,113 @@
+"""Tests for the read-replica router (default + replica SQLite aliases)."""
+import threading
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from apps.core.infrastructure.db.routing import ReplicaRouter, use_replica
+from apps.core.middleware.replica import ReplicaRoutingMiddleware
+from apps.core.viewsets.mixins import ReplicaReadMixin
+
+User = get_user_model()
+
+
+def read_db():
+    return User.objects.all().db
+
+
+class _ListViewSet(ReplicaReadMixin, viewsets.ViewSet):
+    authentication_classes = []
+    permission_classes = []
+
+    def list(self, request):
+        return Response({"db": read_db()})
+
+    def create(self, request):
+        return Response({"db": read_db()})
+
+
+class ReplicaRouterTestCase(SimpleTestCase):
+    """Routing decisions for reads inside and outside use_replica()."""
+
+    def setUp(self):
+        caches["default"].clear()
+        self.rf = RequestFactory()
+
+    def _in_request(self, fn, user=None, **headers):
+        request = self.rf.get("/", **headers)
+        request.user = user or SimpleNamespace(is_authenticated=False)
+        return ReplicaRoutingMiddleware(lambda req: fn())(request)
+
+    def test_reads_stay_on_primary_unless_opted_in(self):
+        self.assertEqual(read_db(), "default")
+        with use_replica():
+            self.assertEqual(read_db(), "replica")
+        self.assertEqual(use_replica()(read_db)(), "replica")
+
+    def test_decorator_is_safe_across_concurrent_calls(self):
+        both_in = threading.Barrier(2)
+        first_out = threading.Event()
+
+        @use_replica()
+        def read(first):
+            both_in.wait(5)  # both calls inside the one decorated function
+            if not first:
+                first_out.wait(5)
+            return read_db()
+
+        def call(first, results):
+            try:
+                results.append(read(first))
+            finally:
+                first_out.set()
+
+        # threads run in their own contexts; with one shared token the first
+        # call to leave reset the other's ("created in a different Context")
+        results = []
+        threads = [threading.Thread(target=call, args=(f, results)) for f in (1, 0)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(results, ["replica", "replica"])
+
+    def test_writes_always_go_to_primary(self):
+        with use_replica():
+            self.assertEqual(ReplicaRouter().db_for_write(User), "default")
+
+    def test_strong_consistency_header_forces_primary(self):
+        with use_replica():
+            self.assertEqual(
+                self._in_request(read_db, HTTP_X_READ_CONSISTENCY="strong"),
+                "default",
+            )
+            self.assertEqual(self._in_request(read_db), "replica")
+
+    def test_read_your_writes_within_request_and_after(self):
+        user = SimpleNamespace(is_authenticated=True, pk=7)
+
+        def write_then_read():
+            ReplicaRouter().db_for_write(User)
+            return read_db()
+
+        with use_replica():
+            self.assertEqual(self._in_request(write_then_read, user), "default")
+            # the next request by the same user is pinned too...
+            self.assertEqual(self._in_request(read_db, user), "default")
+            # ...other users are not
+            other = SimpleNamespace(is_authenticated=True, pk=8)
+            self.assertEqual(self._in_request(read_db, other), "replica")
+            caches["default"].clear()  # pin window elapsed
+            self.assertEqual(self._in_request(read_db, user), "replica")
+
+    def test_viewset_mixin_scopes_list_only(self):
+        factory = APIRequestFactory()
+        view = _ListViewSet.as_view({"get": "list", "post": "create"})
+        self.assertEqual(view(factory.get("/")).data, {"db": "replica"})
+        self.assertEqual(view(factory.post("/")).data, {"db": "default"})
+        self.assertEqual(read_db(), "default")
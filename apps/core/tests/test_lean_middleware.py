@@ -0,0 +1,90 @@
+"""Tests for the lean API middleware chain and bearer auth."""
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import Client, SimpleTestCase, override_settings
+
+from apps.core.models import User
+
+PRESIGN_URL = "/api/v1/file-upload/download/presign"
+
+
+@override_settings(
+    LEAN_API_PREFIXES=["/api/v1/file-upload/"], MIDDLEWARE_TIMING=True
+)
+class LeanMiddlewareTestCase(SimpleTestCase):
+    """Test cases for apps.core.middleware.lean."""
+
+    def setUp(self):
+        service = mock.Mock()
+        service.presign_download.return_value = "https://example.test/obj"
+        patches = [
+            mock.patch(
+                "apps.file_upload.viewsets.upload_viewset.get_file_service",
+                return_value=service,
+            ),
+            mock.patch(
+                "apps.core.infrastructure.aws.cognito.verify_access_token",
+                return_value={"sub": "9f0c6f5e-55d4-4a52-9a3c-3b8f4d1c2e7a"},
+            ),
+            mock.patch(
+                "apps.core.authentication._user_for_sub",
+                return_value=User(pk=1, username="u"),
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _presign(self, **extra):
+        return Client().post(
+            PRESIGN_URL,
+            {"provider": "aws", "key": "a/b.pdf"},
+            content_type="application/json",
+            **extra,
+        )
+
+    def test_api_route_skips_browser_middleware(self):
+        resp = self._presign(HTTP_AUTHORIZATION="Bearer tok")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["url"], "https://example.test/obj")
+        timing = resp["Server-Timing"]
+        self.assertIn("mw-security", timing)
+        self.assertIn("mw-common", timing)
+        self.assertIn("view;dur=", timing)
+        for skipped in ("session", "csrfview", "axes", "messages", "xframeoptions"):
+            self.assertNotIn(f"mw-{skipped};", timing)
+        self.assertNotIn("X-Frame-Options", resp)
+
+    def test_api_route_requires_bearer_token(self):
+        resp = self._presign()
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(resp["WWW-Authenticate"], "Bearer")
+
+    def test_token_without_valid_sub_is_rejected(self):
+        for payload in ({}, {"sub": "not-a-uuid"}):
+            with mock.patch(
+                "apps.core.infrastructure.aws.cognito.verify_access_token",
+                return_value=payload,
+            ):
+                resp = self._presign(HTTP_AUTHORIZATION="Bearer tok")
+            self.assertEqual(resp.status_code, 401)
+            self.assertEqual(resp.json()["detail"], "Invalid token subject")
+
+    def test_axes_wrapper_passes_system_checks(self):
+        out = StringIO()
+        call_command("check", stdout=out, stderr=out)
+        self.assertNotIn("axes.W002", out.getvalue())
+
+    def test_other_routes_keep_full_chain(self):
+        resp = Client().get("/health")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("mw-session", resp["Server-Timing"])
+        self.assertEqual(resp["X-Frame-Options"], "DENY")
+
+    @override_settings(MIDDLEWARE_TIMING=False)
+    def test_no_timing_header_when_disabled(self):
+        resp = self._presign(HTTP_AUTHORIZATION="Bearer tok")
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn("Server-Timing", resp)
@@ -0,0 +1,41 @@
+"""Tests for running against a local AWS stand-in (AWS_ENDPOINT_URL)."""
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.infrastructure.aws import clients, cognito
+from apps.core.infrastructure.aws.warmup import reset_clients
+
+
+class EndpointTestCase(SimpleTestCase):
+    """AWS_ENDPOINT_URL reroutes the shared clients and the JWKS fetch."""
+
+    def setUp(self):
+        reset_clients()
+        self.addCleanup(reset_clients)
+
+    def test_clients_use_endpoint(self):
+        with mock.patch("config.settings.AWS_ENDPOINT_URL", "http://moto:5000"):
+            self.assertEqual(clients.get_s3_client().meta.endpoint_url, "http://moto:5000")
+            self.assertEqual(
+                clients.get_dynamodb_resource().meta.client.meta.endpoint_url,
+                "http://moto:5000",
+            )
+
+    @override_settings(AWS_ENDPOINT_URL="http://moto:5000", AWS_REGION="us-east-1")
+    def test_jwks_request_is_signed_for_cognito(self):
+        with mock.patch.dict(
+            "os.environ", {"AWS_ACCESS_KEY_ID": "k", "AWS_SECRET_ACCESS_KEY": "s"}
+        ):
+            headers = cognito._stand_in_headers("http://moto:5000/pool/.well-known/jwks.json")
+        self.assertIn("/us-east-1/cognito-idp/aws4_request", headers["Authorization"])
+
+    @override_settings(AWS_ENDPOINT_URL="")
+    def test_real_jwks_request_is_plain(self):
+        self.assertEqual(cognito._stand_in_headers("https://example.com/jwks.json"), {})
+
+    @override_settings(AWS_ENDPOINT_URL="")
+    def test_bootstrap_refuses_real_aws(self):
+        with self.assertRaises(CommandError):
+            call_command("bootstrap_local_aws", users=0)
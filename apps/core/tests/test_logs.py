@@ -0,0 +1,101 @@
+"""Tests for the queued logging pipeline."""
+import logging
+import sys
+import threading
+
+from django.test import SimpleTestCase
+
+from apps.core.infrastructure.logs import JSONFormatter, QueuedHandler
+from config.celery import task_failure_handler
+
+
+class _Collecting(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.gate = gate
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.threads.add(threading.get_ident())
+        self.lines.append(self.format(record))
+
+
+def _logger(handler, name):
+    logger = logging.getLogger(f"tests.logs.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+class JSONFormatterTestCase(SimpleTestCase):
+    """Extras and tracebacks serialize; odd values fall back to str()."""
+
+    def test_extra_and_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "x", logging.ERROR, __file__, 1, "failed %s", ("job",), sys.exc_info()
+            )
+        record.data = {"id": 1, "obj": object()}
+        line = JSONFormatter().format(record)
+        self.assertIn('"message":"failed job"', line)
+        self.assertIn('"data":{"id":1,"obj":"<object object', line)
+        self.assertIn("ValueError: boom", line)
+
+
+class QueuedHandlerTestCase(SimpleTestCase):
+    """Formatting and I/O happen on the listener thread; overflow is counted."""
+
+    def test_background_write_and_flush(self):
+        sink = _Collecting()
+        handler = QueuedHandler(sink=sink)
+        self.addCleanup(handler.close)
+        handler.setFormatter(JSONFormatter())
+        args = ["a"]
+        _logger(handler, "bg").info("value %s", args)
+        args.append("b")  # mutated after the call
+        handler.flush()
+        self.assertEqual(len(sink.lines), 1)
+        self.assertIn("value ['a']", sink.lines[0])
+        self.assertNotIn(threading.get_ident(), sink.threads)
+
+    def test_backpressure_drops_and_reports(self):
+        gate = threading.Event()
+        sink = _Collecting(gate)
+        handler = QueuedHandler(queue_size=4, block_seconds=0.01, sink=sink)
+        self.addCleanup(handler.close)
+        logger = _logger(handler, "bp")
+        for i in range(10):
+            logger.info("info %d", i)
+        logger.debug("debug")
+        self.assertGreater(handler.dropped["INFO"], 0)
+        self.assertEqual(handler.dropped["DEBUG"], 1)
+        gate.set()
+        handler.flush()
+        logger.info("after")  # queue drained: the overflow warning follows
+        handler.flush()
+        self.assertIn("logging queue overflow: dropped", sink.lines[-1])
+
+
+class TaskFailureLogTestCase(SimpleTestCase):
+    """The Celery failure handler logs exc_info, not raw objects in extra."""
+
+    def test_extra_is_plain(self):
+        try:
+            raise RuntimeError("task broke")
+        except RuntimeError as exc:
+            exception, tb = exc, exc.__traceback__
+        with self.assertLogs("config.celery", level="ERROR") as logs:
+            task_failure_handler(
+                sender=None, task_id="t-1", exception=exception, traceback=tb
+            )
+        record = logs.records[0]
+        self.assertIs(record.exc_info[2], tb)
+        self.assertTrue(
+            all(isinstance(v, (str, type(None))) for v in record.data.values())
+        )
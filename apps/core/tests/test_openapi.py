@@ -0,0 +1,61 @@
+"""Tests for the stored OpenAPI artifact view."""
+import gzip
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core import openapi
+from apps.core.openapi import get_artifact, schema_document
+
+SPEC = b'{"swagger": "2.0", "paths": {}}'
+
+
+class SchemaDocumentTestCase(SimpleTestCase):
+    """schema_document serves the build-time artifact with conditional GETs."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        override = override_settings(OPENAPI_SCHEMA_DIR=self.dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        get_artifact.cache_clear()
+        self.addCleanup(get_artifact.cache_clear)
+        self.rf = RequestFactory()
+
+    def _get(self, **headers):
+        return schema_document(self.rf.get("/swagger.json", **headers), ".json")
+
+    def test_serves_stored_artifact_with_etag(self):
+        (self.dir / "swagger.json").write_bytes(SPEC)
+        with mock.patch.object(openapi, "generate_schema") as generate:
+            response = self._get()
+        generate.assert_not_called()
+        self.assertEqual(response.content, SPEC)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_negotiates_gzip_and_honours_if_none_match(self):
+        (self.dir / "swagger.json").write_bytes(SPEC)
+        response = self._get(HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), SPEC)
+
+        again = self._get(
+            HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b"")
+        self.assertEqual(again["ETag"], response["ETag"])
+
+    def test_generates_once_when_artifact_missing(self):
+        with mock.patch.object(openapi, "generate_schema", return_value=SPEC) as gen:
+            first = self._get()
+            second = self._get()
+        gen.assert_called_once_with(".json")
+        self.assertEqual(first.content, SPEC)
+        self.assertEqual(first["ETag"], second["ETag"])
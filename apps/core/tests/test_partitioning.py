@@ -0,0 +1,137 @@
+"""Tests for the monthly partition helpers."""
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from django.db import IntegrityError, connection, connections
+from django.test import SimpleTestCase
+from pytest_postgresql.exceptions import ExecutableMissingException
+
+from apps.core.infrastructure.db import partitioning as p
+from apps.jobs.models.job import Job
+
+
+@pytest.fixture
+def pg_connection(request, django_db_blocker):
+    """
+    Django connection to a throwaway Postgres database (pytest-postgresql);
+    skipped where no server binaries are installed (--postgresql-exec).
+    """
+    try:
+        info = request.getfixturevalue("postgresql").info
+    except ExecutableMissingException as exc:
+        pytest.skip(f"no Postgres: {exc}")
+    database = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": info.dbname,
+        "USER": info.user,
+        "PASSWORD": info.password or "",
+        "HOST": info.host,
+        "PORT": info.port,
+    }
+    # filled in with Django's defaults, registered under its own alias
+    connections.settings["pg"] = connections.configure_settings(
+        {"default": database}
+    )["default"]
+    with django_db_blocker.unblock():  # a scratch database, not the test one
+        yield connections["pg"]
+        connections["pg"].close()
+    del connections["pg"]
+    del connections.settings["pg"]
+
+
+class PartitionNamingTestCase(SimpleTestCase):
+    """Month arithmetic, names and DDL for <table>_pYYYY_MM partitions."""
+
+    def test_add_months_crosses_years(self):
+        self.assertEqual(p.add_months(date(2025, 11, 17), 2), date(2026, 1, 1))
+        self.assertEqual(p.add_months(date(2025, 1, 31), -1), date(2024, 12, 1))
+
+    def test_name_round_trip(self):
+        name = p.partition_name("jobs", date(2026, 3, 1))
+        self.assertEqual(name, "jobs_p2026_03")
+        self.assertEqual(p.partition_start("jobs", name), date(2026, 3, 1))
+        self.assertIsNone(p.partition_start("jobs", "jobs_default"))
+        self.assertIsNone(p.partition_start("file", name))
+
+    def test_create_partition_sql_bounds(self):
+        sql = p.create_partition_sql("file", date(2025, 12, 1))
+        self.assertIn('"file_p2025_12" PARTITION OF "file"', sql)
+        self.assertIn(
+            "FROM ('2025-12-01 00:00:00+00') TO ('2026-01-01 00:00:00+00')", sql
+        )
+
+
+class NonPostgresTestCase(SimpleTestCase):
+    """Everything is a no-op on the SQLite test database."""
+
+    def test_maintain_partitions_skips_sqlite(self):
+        self.assertEqual(connection.vendor, "sqlite")
+        self.assertEqual(p.maintain_partitions(connection, {"file": 12}), {})
+
+
+def _at(year, month):
+    return datetime(year, month, 15, tzinfo=timezone.utc)
+
+
+class TestPostgresGuard:
+    """
+    job_id stays unique across partitions, not just within a month. A plain
+    pytest class: SimpleTestCase refuses the fixture's extra alias.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _postgres(self, pg_connection):
+        self.pg = pg_connection
+        with self.pg.schema_editor() as editor:
+            editor.create_model(Job)
+            self.insert("old", _at(2025, 1))
+            p.convert_to_partitioned(editor, "jobs")
+
+    def insert(self, job_id, created_at):
+        with self.pg.cursor() as c:
+            c.execute(
+                "INSERT INTO jobs (job_id, created_at, updated_at, status, tenant, "
+                "bucket, key, page_count, chunk_size, pages_done, ranges_total, "
+                "ranges_done, ranges_failed) "
+                "VALUES (%s, %s, %s, 'pending', '', '', '', 0, 0, 0, 0, 0, 0)",
+                [job_id, created_at, created_at],
+            )
+
+    def assert_duplicate(self, job_id, created_at):
+        with pytest.raises(IntegrityError):
+            self.insert(job_id, created_at)  # autocommit: nothing to roll back
+
+    def test_same_job_id_twice_is_rejected(self):
+        with self.pg.cursor() as c:
+            assert p.is_partitioned(c, "jobs")
+        self.insert("a", _at(2025, 3))
+        self.assert_duplicate("a", _at(2025, 4))  # another month, same job_id
+        self.assert_duplicate("a", _at(2025, 3))
+        self.assert_duplicate("old", _at(2025, 5))  # rows copied by the migration
+
+    def test_claims_follow_deletes_and_partition_moves(self):
+        self.insert("a", _at(2030, 6))  # default partition
+        p.ensure_partitions(self.pg, "jobs", months_ahead=0, today=date(2030, 6, 1))
+        self.assert_duplicate("a", _at(2025, 3))  # moved out of the default
+        with self.pg.cursor() as c:
+            c.execute("DELETE FROM jobs WHERE job_id = 'old'")
+        self.insert("old", _at(2025, 2))
+
+    def test_plain_again_keeps_job_id_unique(self):
+        with self.pg.schema_editor() as editor:
+            p.convert_to_plain(editor, "jobs")
+        with self.pg.cursor() as c:
+            assert p.guards(c, "jobs") == {}
+        self.assert_duplicate("old", _at(2025, 2))
+
+    def test_guard_added_to_a_table_partitioned_without_one(self):
+        with self.pg.cursor() as c:
+            p.drop_guard(c, "jobs_job_id_key_guard")  # as 0002 used to leave it
+            self.insert("old", _at(2025, 2))  # the duplicate it let in
+            c.execute("DELETE FROM jobs WHERE created_at = %s", [_at(2025, 2)])
+        with self.pg.schema_editor() as editor:
+            p.add_missing_guards(editor, "jobs")
+        with self.pg.cursor() as c:
+            assert p.guards(c, "jobs") == {"jobs_job_id_key_guard": ["job_id"]}
+        self.assert_duplicate("old", _at(2025, 3))
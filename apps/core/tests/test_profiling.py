@@ -0,0 +1,107 @@
+"""Tests for the on-demand sampling profiler."""
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from apps.core.infrastructure.profiling import hooks
+from apps.core.infrastructure.profiling.sampler import SamplingProfiler
+from apps.core.infrastructure.profiling.store import get_profile_store
+from apps.core.viewsets.mixins import ProfiledViewMixin
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+class _ProfiledView(ProfiledViewMixin, ViewSet):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def list(self, request):
+        busy_loop(0.03)
+        return Response({"ok": True})
+
+
+class SamplerTestCase(SimpleTestCase):
+    """The sampler records the target thread's stacks in collapsed form."""
+
+    def test_collapsed_stacks(self):
+        profiler = SamplingProfiler(interval=0.001).start()
+        busy_loop(0.05)
+        profile = profiler.stop()
+        self.assertGreater(profile.sample_count, 5)
+        line = profile.collapsed().splitlines()[0]
+        self.assertIn("busy_loop", line)
+        self.assertRegex(line, r" \d+$")
+
+
+@override_settings(PROFILING_SECRET="s3cret")
+class TokenTestCase(SimpleTestCase):
+    """Profile tokens are HMAC-signed and expire."""
+
+    def test_round_trip(self):
+        self.assertTrue(hooks.verify_token(hooks.make_token(60)))
+
+    def test_rejects_expired_and_tampered(self):
+        self.assertFalse(hooks.verify_token(hooks.make_token(-1)))
+        expires, _, sig = hooks.make_token(60).partition(".")
+        self.assertFalse(hooks.verify_token(f"{int(expires) + 1}.{sig}"))
+        self.assertFalse(hooks.verify_token("garbage"))
+
+    def test_disabled_ignores_token(self):
+        with override_settings(PROFILING_ENABLED=False):
+            self.assertFalse(hooks.should_profile(hooks.make_token(60), 1.0))
+
+
+class ProfiledViewTestCase(SimpleTestCase):
+    """Profiled requests/tasks are stored and retrievable by id."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        overrides = override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SECRET="s3cret",
+            PROFILING_SAMPLE_RATE=0.0,
+            PROFILING_TASK_SAMPLE_RATE=0.0,
+            PROFILING_INTERVAL_MS=1,
+            PROFILING_STORE="local",
+            PROFILING_DIR=self.dir,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        get_profile_store.cache_clear()
+        self.addCleanup(get_profile_store.cache_clear)
+
+    def test_view_with_token(self):
+        view = _ProfiledView.as_view({"get": "list"})
+        response = view(
+            RequestFactory().get("/x", HTTP_X_PROFILE_TOKEN=hooks.make_token())
+        )
+        profile_id = response[hooks.PROFILE_ID_HEADER]
+        self.assertIn(b"busy_loop", get_profile_store().load(profile_id))
+
+    def test_view_without_token_not_profiled(self):
+        response = _ProfiledView.as_view({"get": "list"})(RequestFactory().get("/x"))
+        self.assertNotIn(hooks.PROFILE_ID_HEADER, response)
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+    def test_task_header(self):
+        task = SimpleNamespace(
+            name="apps.jobs_tasks.demo",
+            request=SimpleNamespace(headers={hooks.TASK_TOKEN_HEADER: hooks.make_token()}),
+        )
+        hooks.task_started(task, "t-1")
+        busy_loop(0.02)
+        hooks.task_finished(task, "t-1")
+        [path] = self.dir.glob("*.collapsed")
+        self.assertIn(b"busy_loop", path.read_bytes())
@@ -0,0 +1,36 @@
+"""Tests for the orjson renderer and parser."""
+import io
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from apps.core.parsers import ORJSONParser
+from apps.core.renderers import ORJSONRenderer
+
+
+class ORJSONTestCase(SimpleTestCase):
+    """Test cases for ORJSONRenderer / ORJSONParser."""
+
+    def test_round_trip(self):
+        data = {"a": [1, 2, {"b": "ü"}], "n": None}
+        raw = ORJSONRenderer().render(data)
+        self.assertEqual(ORJSONParser().parse(io.BytesIO(raw)), data)
+
+    def test_falls_back_to_drf_encoder(self):
+        raw = ORJSONRenderer().render({"d": Decimal("1.50"), "u": uuid.UUID(int=1)})
+        self.assertEqual(
+            raw, b'{"d":1.5,"u":"00000000-0000-0000-0000-000000000001"}'
+        )
+
+    def test_indent_from_media_type(self):
+        raw = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+        self.assertEqual(raw, b'{\n  "a": 1\n}')
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{nope"))
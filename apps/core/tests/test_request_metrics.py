@@ -0,0 +1,116 @@
+"""Tests for the per-request AWS/DB breakdown and /metrics."""
+import boto3
+from botocore.stub import Stubber
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from prometheus_client import REGISTRY
+
+from apps.core.infrastructure.metrics import breakdown
+from apps.core.middleware.metrics import RequestMetricsMiddleware
+from config.urls import metrics
+
+
+def _dynamodb():
+    client = boto3.client(
+        "dynamodb",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    return breakdown.instrument_client(client)
+
+
+class AwsHooksTestCase(SimpleTestCase):
+    """botocore hooks time each operation and collect consumed capacity."""
+
+    def test_records_call_and_capacity(self):
+        client = _dynamodb()
+        token = breakdown.begin()
+        try:
+            with Stubber(client) as stub:
+                stub.add_response(
+                    "put_item",
+                    {"ConsumedCapacity": {"TableName": "sessions", "CapacityUnits": 1.0}},
+                    {
+                        "TableName": "sessions",
+                        "Item": {"pk": {"S": "a"}},
+                        "ReturnConsumedCapacity": "TOTAL",  # injected
+                    },
+                )
+                client.put_item(TableName="sessions", Item={"pk": {"S": "a"}})
+            state = breakdown.current()
+        finally:
+            breakdown.end(token)
+        self.assertEqual(len(state.aws_calls), 1)
+        self.assertEqual(
+            (state.aws_calls[0].service, state.aws_calls[0].operation),
+            ("dynamodb", "PutItem"),
+        )
+        self.assertEqual(state.consumed_capacity, {"sessions": 1.0})
+
+    def test_outside_request_goes_to_prometheus(self):
+        client = _dynamodb()
+        labels = {
+            "route": "-",
+            "service": "dynamodb",
+            "operation": "DescribeTable",
+            "outcome": "error",
+        }
+        before = REGISTRY.get_sample_value("aws_call_duration_seconds_count", labels) or 0
+        with Stubber(client) as stub:
+            stub.add_client_error("describe_table", http_status_code=404)
+            with self.assertRaises(client.exceptions.ClientError):
+                client.describe_table(TableName="missing")
+        after = REGISTRY.get_sample_value("aws_call_duration_seconds_count", labels)
+        self.assertEqual(after, before + 1)
+
+
+@override_settings(REQUEST_BREAKDOWN_HEADER=True)
+class RequestMetricsMiddlewareTestCase(SimpleTestCase):
+    """The middleware reports DB and AWS time in Server-Timing and histograms."""
+
+    databases = {"default"}
+
+    def test_server_timing_breakdown(self):
+        client = _dynamodb()
+
+        def view(request):
+            # the test connection may predate the connection_created receiver
+            breakdown.track_db_time(None, connection)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            with Stubber(client) as stub:
+                stub.add_response("list_tables", {"TableNames": []})
+                client.list_tables()
+            return HttpResponse("ok")
+
+        response = RequestMetricsMiddleware(view)(RequestFactory().get("/x"))
+        timing = response["Server-Timing"]
+        self.assertIn("db;dur=", timing)
+        self.assertIn('desc="1 queries"', timing)
+        self.assertIn("aws.dynamodb.ListTables;dur=", timing)
+        self.assertIn("app;dur=", timing)
+
+    @override_settings(CELERY_QUEUE_METRICS=False)  # no broker in tests
+    def test_metrics_endpoint(self):
+        RequestMetricsMiddleware(lambda r: HttpResponse("ok"))(RequestFactory().get("/x"))
+        response = metrics(RequestFactory().get("/metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"http_request_duration_seconds_bucket", response.content)
+        self.assertIn(b"http_request_db_queries_count", response.content)
+
+    @override_settings(
+        CELERY_QUEUE_METRICS=False,
+        METRICS_ALLOWED_CIDRS=["10.0.0.0/24"],
+        METRICS_TOKEN="s3cret",
+    )
+    def test_metrics_endpoint_is_restricted(self):
+        rf = RequestFactory()
+        self.assertEqual(metrics(rf.get("/metrics")).status_code, 403)  # 127.0.0.1
+        self.assertEqual(
+            metrics(rf.get("/metrics", REMOTE_ADDR="10.0.0.7")).status_code, 200
+        )
+        for auth, status in (("Bearer s3cret", 200), ("Bearer nope", 403)):
+            response = metrics(rf.get("/metrics", HTTP_AUTHORIZATION=auth))
+            self.assertEqual(response.status_code, status, auth)
@@ -0,0 +1,99 @@
+"""Tests for Celery task timing and broker queue sampling."""
+import json
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+from prometheus_client import REGISTRY
+
+from apps.core.infrastructure.metrics import task_metrics
+from apps.core.infrastructure.metrics import broker
+from apps.core.infrastructure.metrics.broker import redis_queue_samples
+from config.celery import app
+
+
+def _task(name="apps.jobs_tasks.demo", **request):
+    request.setdefault("delivery_info", {"routing_key": "jobs"})
+    return SimpleNamespace(name=name, request=SimpleNamespace(**request))
+
+
+def _sample(metric, **labels):
+    return REGISTRY.get_sample_value(metric, labels) or 0
+
+
+class TaskMetricsTestCase(SimpleTestCase):
+    """Queue wait comes from the sent_at header; runtime is labelled by outcome."""
+
+    def test_publish_stamps_sent_at(self):
+        headers = {}
+        task_metrics.stamp_headers(headers)
+        self.assertAlmostEqual(headers["sent_at"], time.time(), delta=1)
+
+    def test_wait_and_runtime(self):
+        task = _task(name="apps.jobs_tasks.wait_demo", sent_at=time.time() - 2)
+        labels = {"task": task.name, "queue": "jobs"}
+        wait = task_metrics.task_started(task, "id-1")
+        self.assertGreaterEqual(wait, 2)
+        self.assertGreaterEqual(_sample("celery_task_queue_wait_seconds_sum", **labels), 2)
+        task_metrics.task_finished(task, "id-1", "SUCCESS")
+        self.assertEqual(
+            _sample("celery_task_runtime_seconds_count", outcome="success", **labels), 1
+        )
+
+    def test_eta_counts_from_eta(self):
+        eta = time.time() - 1
+        task = _task(
+            name="apps.jobs_tasks.eta_demo",
+            sent_at=eta - 60,  # published a minute before its countdown ended
+            eta=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(eta)),
+        )
+        wait = task_metrics.task_started(task, "id-2")
+        task_metrics.task_finished(task, "id-2", "SUCCESS")
+        self.assertLess(wait, 10)
+
+    def test_unknown_sent_at(self):
+        task = _task(name="apps.jobs_tasks.no_header", delivery_info=None)
+        self.assertIsNone(task_metrics.task_started(task, "id-3"))
+        self.assertIsNotNone(task_metrics.task_finished(task, "id-3", "FAILURE"))
+        self.assertEqual(
+            _sample(
+                "celery_task_runtime_seconds_count",
+                task=task.name,
+                queue="unknown",
+                outcome="failure",
+            ),
+            1,
+        )
+
+
+class _FakeRedis:
+    def __init__(self, lists):
+        self.lists = lists
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lindex(self, key, index):
+        return self.lists[key][index]
+
+
+class RedisQueueSamplesTestCase(SimpleTestCase):
+    """Depth is LLEN; backlog age is the tail message's sent_at."""
+
+    def test_depth_and_age(self):
+        message = json.dumps({"headers": {"sent_at": 1000.0}, "body": ""})
+        client = _FakeRedis({"jobs": ["newer", message], "analytics": []})
+        samples = redis_queue_samples(client, ["jobs", "analytics"], now=1030.0)
+        self.assertEqual(samples, {"jobs": (2, 30.0), "analytics": (0, None)})
+
+    def test_scrapes_reuse_one_client(self):
+        broker._redis_client.cache_clear()
+        self.addCleanup(broker._redis_client.cache_clear)
+        previous = app.conf.broker_url
+        app.conf.broker_url = "redis://broker:6379/0"
+        self.addCleanup(setattr, app.conf, "broker_url", previous)
+        with mock.patch("redis.Redis.from_url", return_value=_FakeRedis({})) as new:
+            broker.sample_queues()
+            broker.sample_queues()
+        new.assert_called_once()
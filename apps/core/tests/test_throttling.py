@@ -0,0 +1,91 @@
+"""Tests for the token bucket throttles."""
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.core import throttling
+from apps.core.throttling import (
+    IPTokenBucketThrottle,
+    LocalTokenBucket,
+    TokenBucketThrottle,
+    parse_bucket_rate,
+)
+
+RATES = {"probe.ip": "2/min"}
+
+
+class ProbeView(APIView):
+    permission_classes = []
+    throttle_classes = [IPTokenBucketThrottle]
+    throttle_scope = "probe"
+
+    def get(self, request):
+        return Response({"ok": True})
+
+
+def _rf_settings(rates):
+    return override_settings(REST_FRAMEWORK={"DEFAULT_THROTTLE_RATES": rates})
+
+
+class TokenBucketTestCase(SimpleTestCase):
+    """Test cases for apps.core.throttling token buckets."""
+
+    def setUp(self):
+        throttling._local_bucket = LocalTokenBucket()
+        TokenBucketThrottle._redis_down_until = 0.0
+
+    def test_parse_bucket_rate(self):
+        self.assertEqual(parse_bucket_rate("30/min"), (30, 0.5))
+        self.assertEqual(parse_bucket_rate("5/s"), (5, 5.0))
+
+    def test_local_bucket_refills_over_time(self):
+        now = [0.0]
+        bucket = LocalTokenBucket(clock=lambda: now[0])
+        self.assertEqual(bucket.consume("k", 2, 1.0), (True, 0.0))
+        self.assertEqual(bucket.consume("k", 2, 1.0), (True, 0.0))
+        allowed, wait = bucket.consume("k", 2, 1.0)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 1.0)
+        now[0] = 1.0
+        self.assertTrue(bucket.consume("k", 2, 1.0)[0])
+
+    def test_view_returns_429_with_retry_after(self):
+        view = ProbeView.as_view()
+        rf = APIRequestFactory()
+        with _rf_settings(RATES):
+            codes = [view(rf.get("/probe")).status_code for _ in range(2)]
+            resp = view(rf.get("/probe"))
+        self.assertEqual(codes, [200, 200])
+        self.assertEqual(resp.status_code, 429)
+        self.assertIn("Retry-After", resp)
+
+    def test_other_ip_has_its_own_bucket(self):
+        view = ProbeView.as_view()
+        rf = APIRequestFactory()
+        with _rf_settings(RATES):
+            for _ in range(3):
+                view(rf.get("/probe"))
+            resp = view(rf.get("/probe", REMOTE_ADDR="10.9.9.9"))
+        self.assertEqual(resp.status_code, 200)
+
+    def test_redis_error_falls_back_to_local_bucket(self):
+        client = mock.Mock()
+        client.register_script.return_value.side_effect = RedisConnectionError()
+        rf = APIRequestFactory()
+        with _rf_settings(RATES), mock.patch.object(
+            throttling, "get_redis_client", return_value=client
+        ), mock.patch.object(TokenBucketThrottle, "_script", None):
+            codes = [ProbeView.as_view()(rf.get("/probe")).status_code for _ in range(3)]
+            # breaker open: redis is not retried on the following requests
+            self.assertEqual(client.register_script.return_value.call_count, 1)
+        self.assertEqual(codes, [200, 200, 429])
+
+    def test_unscoped_view_is_not_limited(self):
+        with _rf_settings(RATES):
+            throttle = IPTokenBucketThrottle()
+            request = APIRequestFactory().get("/x")
+            self.assertTrue(throttle.allow_request(request, object()))
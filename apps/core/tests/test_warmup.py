@@ -0,0 +1,67 @@
+"""Tests for the AWS warm-up hook."""
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.infrastructure.aws import clients, warmup
+
+CALLS = []
+
+
+def warm_ok(connect=True):
+    CALLS.append(("ok", connect))
+
+
+def warm_broken(connect=True):
+    raise RuntimeError("no route to host")
+
+
+STEPS = [f"{__name__}.warm_ok", f"{__name__}.warm_broken"]
+
+
+@override_settings(AWS_WARMUP=True, AWS_WARMUP_CONNECT=False, AWS_WARMUP_STEPS=STEPS)
+class WarmupTestCase(SimpleTestCase):
+    """warm_up runs each configured step once per process and times it."""
+
+    def setUp(self):
+        CALLS.clear()
+        patcher = mock.patch.multiple(warmup, _warmed_pid=None, last_report=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_steps_once_and_reports_timings(self):
+        report = warmup.warm_up("test")
+        self.assertEqual(CALLS, [("ok", False)])
+        self.assertEqual(set(report.steps), {"ok", "broken"})
+        self.assertIn("RuntimeError", report.errors["broken"])
+        self.assertIs(warmup.last_report, report)
+
+        self.assertIsNone(warmup.warm_up("test"))
+        self.assertEqual(len(CALLS), 1)
+
+    def test_forked_process_drops_inherited_clients(self):
+        warmup._warmed_pid = -1  # warmed by a parent process
+        with mock.patch.object(warmup, "reset_clients") as reset:
+            self.assertIsNotNone(warmup.warm_up("post_fork"))
+        reset.assert_called_once_with()
+
+    @override_settings(AWS_WARMUP=False)
+    def test_disabled(self):
+        self.assertIsNone(warmup.warm_up("test"))
+        self.assertEqual(CALLS, [])
+
+    def test_ready_trigger_is_gunicorn_only(self):
+        self.assertTrue(warmup.should_warm_on_ready(["/usr/bin/gunicorn"]))
+        for argv in (
+            ["manage.py", "migrate"],
+            ["/usr/bin/celery", "worker"],  # pool processes: worker_process_init
+            ["-c"],
+            ["/app/benchmarks/bench_upload_api.py"],
+        ):
+            self.assertFalse(warmup.should_warm_on_ready(argv), argv)
+
+    def test_round_trips_fail_fast(self):
+        with mock.patch.object(clients.settings, "AWS_WARMUP_TIMEOUT", 0.5):
+            config = clients.get_warmup_client("s3").meta.config
+        self.assertEqual((config.connect_timeout, config.read_timeout), (0.5, 0.5))
+        self.assertEqual(config.retries["total_max_attempts"], 1)
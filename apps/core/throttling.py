@@ -0,0 +1,171 @@
+# apps/core/throttling.py
+from __future__ import annotations
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+from redis.exceptions import RedisError
+from rest_framework.throttling import AnonRateThrottle, BaseThrottle, UserRateThrottle
+
+from apps.core.infrastructure.cache.clients import CACHE_THROTTLE, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# lazy, thread-local proxy like django.core.cache.cache, but on the throttle alias
+throttle_cache = ConnectionProxy(caches, CACHE_THROTTLE)
+
+
+class CachedAnonRateThrottle(AnonRateThrottle):
+    cache = throttle_cache
+
+
+class CachedUserRateThrottle(UserRateThrottle):
+    cache = throttle_cache
+
+
+# ---------------------------
+# Token bucket
+# ---------------------------
+# Refill is computed from Redis' own clock so web nodes with skewed clocks
+# share one bucket. Returns {allowed, seconds_to_wait}.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local refill = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill)
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  wait = (1 - tokens) / refill
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / refill * 1000) + 1000)
+return {allowed, tostring(wait)}
+"""
+
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_bucket_rate(rate: str) -> Tuple[int, float]:
+    """'30/min' -> (capacity=30, refill=0.5 tokens/s); same syntax as DRF rates."""
+    num, period = rate.split("/")
+    capacity = int(num)
+    return capacity, capacity / _PERIODS[period[0]]
+
+
+class LocalTokenBucket:
+    """In-process fallback used while Redis is unreachable (per-worker limits)."""
+
+    def __init__(self, max_keys: int = 10_000, clock=time.monotonic):
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, capacity: int, refill: float) -> Tuple[bool, float]:
+        now = self._clock()
+        with self._lock:
+            tokens, ts = self._buckets.pop(key, (float(capacity), now))
+            tokens = min(capacity, tokens + max(0.0, now - ts) * refill)
+            if tokens >= 1:
+                tokens -= 1
+                allowed, wait = True, 0.0
+            else:
+                allowed, wait = False, (1 - tokens) / refill
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, wait
+
+
+_local_bucket = LocalTokenBucket()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Atomic Redis token bucket keyed by ``view.throttle_scope`` + identity.
+
+    Rates come from REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]["<scope>.<kind>"].
+    Views without a scope (or without a configured rate) are not limited.
+    If Redis errors, the bucket falls back to process memory and Redis is
+    skipped for REDIS_RETRY_AFTER seconds so an outage doesn't add a socket
+    timeout to every request.
+    """
+
+    kind = ""
+    REDIS_RETRY_AFTER = 5.0
+    _script = None
+    _redis_down_until = 0.0
+
+    def __init__(self):
+        self._wait: Optional[float] = None
+
+    def get_ident_key(self, request) -> Optional[str]:
+        raise NotImplementedError(".get_ident_key() must be overridden")
+
+    def get_rate(self, view) -> Optional[str]:
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return None
+        rates = settings.REST_FRAMEWORK.get("DEFAULT_THROTTLE_RATES", {})
+        return rates.get(f"{scope}.{self.kind}")
+
+    def allow_request(self, request, view) -> bool:
+        rate = self.get_rate(view)
+        ident = self.get_ident_key(request) if rate else None
+        if not ident:
+            return True
+        capacity, refill = parse_bucket_rate(rate)
+        key = f"tb:{view.throttle_scope}:{ident}"
+        allowed, self._wait = self._consume(key, capacity, refill)
+        return allowed
+
+    def wait(self) -> Optional[float]:
+        return self._wait
+
+    def _consume(self, key: str, capacity: int, refill: float) -> Tuple[bool, float]:
+        cls = TokenBucketThrottle
+        client = get_redis_client(CACHE_THROTTLE)
+        if client is not None and time.monotonic() >= cls._redis_down_until:
+            try:
+                if cls._script is None:
+                    cls._script = client.register_script(TOKEN_BUCKET_LUA)
+                allowed, wait = cls._script(keys=[key], args=[capacity, refill])
+                return bool(int(allowed)), float(wait)
+            except RedisError as exc:
+                cls._redis_down_until = time.monotonic() + self.REDIS_RETRY_AFTER
+                logger.warning(
+                    "token bucket: redis unavailable, using local buckets",
+                    extra={"data": {"error": str(exc)}},
+                )
+        return _local_bucket.consume(key, capacity, refill)
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """Per authenticated user; anonymous requests are left to the IP bucket."""
+
+    kind = "user"
+
+    def get_ident_key(self, request) -> Optional[str]:
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return None
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    kind = "ip"
+
+    def get_ident_key(self, request) -> Optional[str]:
+        return f"ip:{self.get_ident(request)}"
@@ -0,0 +1,62 @@
+# apps/core/viewsets/mixins.py
+from __future__ import annotations
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+from apps.core.infrastructure.db.routing import use_replica
+from apps.core.infrastructure.profiling import hooks as profiling
+
+
+class ReplicaReadMixin:
+    """
+    Runs the listed read-only actions inside use_replica(); the router still
+    falls back to the primary for pinned users and `X-Read-Consistency: strong`.
+    """
+
+    replica_actions = ("list",)
+
+    def initial(self, request, *args, **kwargs):
+        self._replica_scope = None
+        if (
+            getattr(self, "action", None) in self.replica_actions
+            and request.method in SAFE_METHODS
+        ):
+            self._replica_scope = use_replica()
+            self._replica_scope.__enter__()
+        super().initial(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # runs on success and error paths alike (APIView.dispatch)
+        scope = getattr(self, "_replica_scope", None)
+        if scope is not None:
+            scope.__exit__(None, None, None)
+            self._replica_scope = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class ProfiledViewMixin:
+    """
+    Samples the view thread (auth, permissions, handler) when the request is
+    picked by profiling.should_profile, and returns the stored profile's id in
+    `X-Profile-Id`. Starting here rather than in middleware keeps the sampler
+    on the thread that actually runs the view under ASGI.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        self._profiler = None
+        if settings.PROFILING_ENABLED and profiling.should_profile(
+            request.META.get(profiling.TOKEN_HEADER), settings.PROFILING_SAMPLE_RATE
+        ):
+            self._profiler = profiling.start()
+        super().initial(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        profiler = getattr(self, "_profiler", None)
+        if profiler is not None:
+            self._profiler = None
+            label = f"{request.method} {request.path} ({getattr(self, 'action', None)})"
+            profile_id = profiling.finish(profiler, label)
+            if profile_id:
+                response[profiling.PROFILE_ID_HEADER] = profile_id
+        return response
@@ -1,11 +1,22 @@
 from __future__ import annotations
+from django.conf import settings
 from apps.file_upload.domain.ports.downloader import FileDownloader
 from apps.file_upload.infrastructure.aws.s3_downloader import S3Downloader
+from apps.file_upload.infrastructure.local.local_downloader import LocalDownloader
 from apps.file_upload.domain.models.types import ProviderEnum
 
 
 class DownloaderFactory:
+    def __init__(self, storage: str | None = None):
+        # settings.FILE_STORAGE == "local" serves "aws" requests from disk too,
+        # so clients run unchanged against a dev box
+        self._storage = storage or settings.FILE_STORAGE
+
     def for_provider(self, provider: str) -> FileDownloader:
+        if provider == ProviderEnum.LOCAL.value or (
+            provider == ProviderEnum.AWS.value and self._storage == "local"
+        ):
+            return LocalDownloader()
         if provider == ProviderEnum.AWS.value:
             return S3Downloader()
         raise NotImplementedError(f"Downloader not implemented for provider={provider}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Callable
+from django.conf import settings
 from apps.file_upload.domain.models.dto import UploadCtx
 from apps.file_upload.domain.models.types import ProviderEnum
 from apps.file_upload.domain.ports.uploader import FileUploader
@@ -10,6 +11,12 @@ from apps.file_upload.infrastructure.aws.s3_single_uploader import (
 from apps.file_upload.infrastructure.aws.s3_multi_uploader import (
     S3MultiPartFileUploader,
 )
+from apps.file_upload.infrastructure.local.local_single_uploader import (
+    LocalSingleFileUploader,
+)
+from apps.file_upload.infrastructure.local.local_multi_uploader import (
+    LocalMultiPartFileUploader,
+)
 
 
 class UploaderFactory:
@@ -17,13 +24,27 @@ class UploaderFactory:
         self,
         s3_single: Callable[[], FileUploader] = lambda: S3SingleFileUploader(),
         s3_multi: Callable[[], FileUploader] = lambda: S3MultiPartFileUploader(),
+        local_single: Callable[[], FileUploader] = lambda: LocalSingleFileUploader(),
+        local_multi: Callable[[], FileUploader] = lambda: LocalMultiPartFileUploader(),
         threshold_bytes: int = THRESHOLD,
+        storage: str | None = None,
     ):
         self._s3_single = s3_single
         self._s3_multi = s3_multi
+        self._local_single = local_single
+        self._local_multi = local_multi
         self._threshold = threshold_bytes
+        # settings.FILE_STORAGE == "local" serves "aws" requests from disk too,
+        # so clients run unchanged against a dev box
+        self._storage = storage or settings.FILE_STORAGE
 
     def for_ctx(self, ctx: UploadCtx) -> FileUploader:
+        if ctx.provider == ProviderEnum.LOCAL.value or (
+            ctx.provider == ProviderEnum.AWS.value and self._storage == "local"
+        ):
+            if ctx.file_meta.size_bytes > self._threshold:
+                return self._local_multi()
+            return self._local_single()
         if ctx.provider == ProviderEnum.AWS.value:
             if ctx.file_meta.size_bytes > self._threshold:
                 return self._s3_multi()
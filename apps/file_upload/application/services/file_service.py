@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Sequence
 from functools import lru_cache
+from django.conf import settings
 
 from apps.file_upload.domain.models.dto import (
     UploadCtx,
@@ -26,6 +27,9 @@ from apps.file_upload.domain.validators.empty_key_validator import EmptyKeyValid
 from apps.file_upload.infrastructure.repositories.dynamo_session_repository import (
     DynamoSessionRepository,
 )
+from apps.file_upload.infrastructure.repositories.local_session_repository import (
+    LocalSessionRepository,
+)
 
 
 @dataclass
@@ -84,10 +88,25 @@ def get_file_service() -> FileService:
     return FileService(
         uploader_factory=UploaderFactory(),
         downloader_factory=DownloaderFactory(),
-        sessions=DynamoSessionRepository(),
+        sessions=(
+            LocalSessionRepository()
+            if settings.FILE_STORAGE == "local"
+            else DynamoSessionRepository()
+        ),
     )
 
 
+def warm_file_service(connect: bool = True) -> None:
+    """AWS warm-up step (settings.AWS_WARMUP_STEPS)."""
+    from apps.core.infrastructure.aws.clients import get_warmup_client
+
+    service = get_file_service()
+    table = getattr(service.sessions, "table", None)
+    if connect and table is not None:
+        # the table is reachable; fails fast if not
+        get_warmup_client("dynamodb").describe_table(TableName=table.name)
+
+
 # (optional) test helper to reset the singleton between tests
 def _reset_singleton_for_tests() -> None:
     get_file_service.cache_clear()  # pragma: no cover
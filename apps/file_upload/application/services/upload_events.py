@@ -0,0 +1,69 @@
+# apps/file_upload/application/services/upload_events.py
+from __future__ import annotations
+import logging
+import re
+from typing import Callable, Sequence
+
+from django.db.models import Case, CharField, Value, When
+from django.utils import timezone
+
+from apps.file_upload.domain.models.dto import StoredObject
+from apps.file_upload.domain.models.types import UploadStatus
+from apps.file_upload.domain.ports.repository import SessionRepository
+from apps.file_upload.models import File, FileStatus
+
+logger = logging.getLogger(__name__)
+
+# keys are <prefix><session_id>/<name> (domain/logic/key_builder.py)
+_SESSION_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def session_id_for_key(key: str) -> str | None:
+    parts = key.rsplit("/", 2)
+    if len(parts) < 2 or not _SESSION_ID.match(parts[-2]):
+        return None
+    return parts[-2]
+
+
+def mark_files_available(objects: Sequence[StoredObject]) -> None:
+    now = timezone.now()
+    by_bucket: dict[str, list[StoredObject]] = {}
+    for obj in objects:
+        by_bucket.setdefault(obj.bucket, []).append(obj)
+    for bucket, objs in by_bucket.items():
+        # one UPDATE per bucket (one per batch in practice)
+        File.objects.filter(
+            bucket=bucket,
+            key__in=[o.key for o in objs],
+            status=FileStatus.UPLOADING,
+        ).update(
+            status=FileStatus.AVAILABLE,
+            available_at=now,
+            etag=Case(
+                *(When(key=o.key, then=Value(o.etag)) for o in objs),
+                output_field=CharField(),
+            ),
+        )
+
+
+def objects_created(
+    objects: Sequence[StoredObject],
+    *,
+    sessions: SessionRepository,
+    enqueue: Callable[[StoredObject], None],
+) -> None:
+    """
+    Objects landed in the bucket: mark them available and start processing.
+    No client callback is involved, so this also covers uploads whose client
+    never called upload/complete.
+    """
+    mark_files_available(objects)
+    for obj in objects:
+        session_id = session_id_for_key(obj.key)
+        if session_id:
+            try:
+                sessions.mark_available(session_id, obj.bucket, obj.key)
+                sessions.set_status(session_id, UploadStatus.AVAILABLE.value)
+            except KeyError:
+                logger.info("No upload session for %s", obj.key)
+        enqueue(obj)
@@ -49,3 +49,13 @@ class CompletionPayload:
     mpu_upload_id: Optional[str] = None
     parts: Optional[Sequence[dict]] = None  # [{"PartNumber": n, "ETag": "..."}]
     checksum: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """An object that landed in storage (from an S3 ObjectCreated event)."""
+
+    bucket: str
+    key: str
+    etag: str
+    size_bytes: int = 0
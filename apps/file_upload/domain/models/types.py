@@ -6,6 +6,7 @@ class ProviderEnum(str, Enum):
     AWS = "aws"
     AZURE = "azure"
     GCP = "gcp"
+    LOCAL = "local"
 
 
 class UploadStatus(str, Enum):
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Annotated, Any, List, Mapping, Optional
+
+from pydantic import (
+    AfterValidator,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
+from typing_extensions import NotRequired, TypedDict
+
+from apps.file_upload.domain.models.dto import CompletionPayload
+from apps.file_upload.domain.models.types import ProviderEnum
+
+# S3 limits: part numbers 1..10000, at most 10000 parts per upload
+MAX_PARTS = 10_000
+
+# a part ETag is the hex MD5 of the part, S3 returns it quoted
+ETag = Annotated[
+    str, StringConstraints(pattern=r'^("[0-9a-fA-F]{32}"|[0-9a-fA-F]{32})$')
+]
+
+
+class CompletionPartSchema(TypedDict):
+    PartNumber: Annotated[int, Field(ge=1, le=MAX_PARTS)]
+    ETag: ETag
+
+
+def _strictly_increasing(parts: List[CompletionPartSchema]) -> List[CompletionPartSchema]:
+    # one pass covers both "unique" and "ordered", which is what S3 requires
+    prev = 0
+    for i, part in enumerate(parts):
+        n = part["PartNumber"]
+        if n <= prev:
+            raise ValueError(
+                f"PartNumber must be unique and strictly increasing "
+                f"(parts[{i}]={n} after {prev})"
+            )
+        prev = n
+    return parts
+
+
+Parts = Annotated[
+    List[CompletionPartSchema],
+    Field(max_length=MAX_PARTS),
+    AfterValidator(_strictly_increasing),
+]
+
+
+class CompletionPayloadSchema(TypedDict):
+    """
+    Request body of POST upload/complete. TypedDicts validate in pydantic-core
+    without building a model (or a DRF serializer) per part.
+    """
+
+    __pydantic_config__ = ConfigDict(str_strip_whitespace=True)  # type: ignore[misc]
+
+    provider: ProviderEnum
+    bucket: Annotated[str, StringConstraints(min_length=1)]
+    key: Annotated[str, StringConstraints(min_length=1)]
+    session_id: Annotated[str, StringConstraints(min_length=1)]
+    mpu_upload_id: NotRequired[Optional[str]]
+    parts: NotRequired[Parts]
+    checksum: NotRequired[str]
+
+
+completion_payload_adapter: TypeAdapter[CompletionPayloadSchema] = TypeAdapter(
+    CompletionPayloadSchema
+)
+
+
+def parse_completion_payload(data: Mapping[str, Any]) -> CompletionPayload:
+    """Validate a raw request body; raises pydantic.ValidationError."""
+    d = completion_payload_adapter.validate_python(data)
+    return CompletionPayload(
+        provider=d["provider"],
+        bucket=d["bucket"],
+        key=d["key"],
+        session_id=d["session_id"],
+        mpu_upload_id=d.get("mpu_upload_id"),
+        parts=d.get("parts"),
+        checksum=d.get("checksum"),
+    )
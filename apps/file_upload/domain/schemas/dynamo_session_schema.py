@@ -77,7 +77,7 @@ class FileUploadSessionSchema(BaseModel):
         return v
 
     def to_dynamo(self) -> Dict[str, Any]:
-        data = self.model_dump(by_name=True)
+        data = self.model_dump(by_alias=True)
         return {k: v for k, v in data.items() if v is not None}
 
     @classmethod
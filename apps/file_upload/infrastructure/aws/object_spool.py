@@ -0,0 +1,184 @@
+# apps/file_upload/infrastructure/aws/object_spool.py
+"""
+Worker-local disk cache of S3 objects.
+
+The page-range tasks of one document, and their retries, land on the same
+workers. Without a cache each of them downloads the whole object again.
+ObjectSpool keeps objects under OBJECT_SPOOL_DIR, keyed by (bucket, key,
+etag), so a changed object is a new entry and never a stale hit:
+
+    with get_object_spool().open(bucket, key, etag) as data:  # mmap
+        header = data[:1024]
+
+- Population downloads to a temp file in the spool (IfMatch on the etag),
+  then os.replace()s it into place. Readers never see a partial file.
+- Single flight: a miss takes an exclusive flock on one of LOCK_STRIPES lock
+  files for the entry, then checks again. Concurrent tasks on the host,
+  across pool processes, wait for one download instead of each doing their
+  own.
+- LRU: a hit bumps the file's mtime. After a download, the oldest entries
+  are unlinked until the spool is under OBJECT_SPOOL_MAX_BYTES. Open mmaps
+  keep their pages, because unlink doesn't free an open file.
+
+Counters (object_spool_*) are exported by the worker metrics server
+(CELERY_METRICS_PORT). The hit rate is hits / (hits + misses).
+"""
+from __future__ import annotations
+import fcntl
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Optional, Union
+
+from prometheus_client import Counter
+
+from config import settings
+from apps.core.infrastructure.aws.clients import get_s3_client
+
+LOCK_STRIPES = 256
+ENTRY_SUFFIX = ".obj"
+COPY_CHUNK = 1024 * 1024
+STALE_PART_SECONDS = 3600  # temp files of downloads killed midway
+
+SPOOL_REQUESTS = Counter(
+    "object_spool_requests",
+    "Spool lookups: hit, miss (downloaded) or shared (another task downloaded it)",
+    ["result"],
+)
+SPOOL_BYTES_SAVED = Counter(
+    "object_spool_bytes_saved", "Bytes served from the spool instead of S3"
+)
+SPOOL_BYTES_DOWNLOADED = Counter(
+    "object_spool_bytes_downloaded", "Bytes downloaded into the spool"
+)
+SPOOL_EVICTIONS = Counter("object_spool_evictions", "Entries evicted (LRU)")
+
+
+class ObjectSpool:
+    def __init__(self, root: str, max_bytes: int, s3=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.s3 = s3 or get_s3_client()
+        os.makedirs(os.path.join(root, ".locks"), exist_ok=True)
+
+    def path_for(self, bucket: str, key: str, etag: str) -> str:
+        etag = etag.strip('"')  # HEAD quotes it, S3 events don't
+        name = hashlib.sha256(f"{bucket}\n{key}\n{etag}".encode()).hexdigest()
+        return os.path.join(self.root, name[:2], name + ENTRY_SUFFIX)
+
+    def fetch(self, bucket: str, key: str, etag: Optional[str] = None) -> str:
+        """
+        Local path of the object, downloaded if needed. The entry can be evicted
+        once this returns. Prefer `open`, whose mmap outlives eviction.
+        """
+        if etag is None:
+            etag = self.s3.head_object(Bucket=bucket, Key=key)["ETag"]
+        path = self.path_for(bucket, key, etag)
+        if self._touch(path):
+            SPOOL_REQUESTS.labels("hit").inc()
+            SPOOL_BYTES_SAVED.inc(os.path.getsize(path))
+            return path
+
+        with self._entry_lock(path):
+            if self._touch(path):  # downloaded while we waited for the lock
+                SPOOL_REQUESTS.labels("shared").inc()
+                SPOOL_BYTES_SAVED.inc(os.path.getsize(path))
+                return path
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as out:  # owns fd even if get_object raises
+                    # get_object, not download_fileobj: s3transfer rejects IfMatch
+                    body = self.s3.get_object(Bucket=bucket, Key=key, IfMatch=etag)
+                    with body["Body"] as data:
+                        shutil.copyfileobj(data, out, COPY_CHUNK)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        SPOOL_REQUESTS.labels("miss").inc()
+        SPOOL_BYTES_DOWNLOADED.inc(os.path.getsize(path))
+        self.evict(keep=path)
+        return path
+
+    @contextmanager
+    def open(
+        self, bucket: str, key: str, etag: Optional[str] = None
+    ) -> Iterator[Union[mmap.mmap, bytes]]:
+        """Read-only mmap of the object (b"" when empty)."""
+        for attempt in (1, 2):
+            path = self.fetch(bucket, key, etag)
+            try:
+                f = open(path, "rb")
+            except FileNotFoundError:  # evicted in between: fetch again
+                if attempt == 2:
+                    raise
+                continue
+            break
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Unlink least recently used entries down to max_bytes; returns count."""
+        with open(os.path.join(self.root, ".locks", "evict.lock"), "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0  # another process is evicting
+            entries, total = [], 0
+            for shard in os.scandir(self.root):
+                if not shard.is_dir() or shard.name.startswith("."):
+                    continue
+                for entry in os.scandir(shard.path):
+                    stat = entry.stat()
+                    if entry.name.endswith(ENTRY_SUFFIX):
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+                    elif time.time() - stat.st_mtime > STALE_PART_SECONDS:
+                        _unlink(entry.path)
+            evicted = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                _unlink(path)
+                total -= size
+                evicted += 1
+            SPOOL_EVICTIONS.inc(evicted)
+            return evicted
+
+    def _touch(self, path: str) -> bool:
+        try:
+            os.utime(path)  # mtime is the LRU clock (atime is often off)
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextmanager
+    def _entry_lock(self, path: str) -> Iterator[None]:
+        stripe = int(os.path.basename(path)[:2], 16) % LOCK_STRIPES
+        with open(os.path.join(self.root, ".locks", f"{stripe:02x}.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file closes
+            yield
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def get_object_spool() -> ObjectSpool:
+    return ObjectSpool(settings.OBJECT_SPOOL_DIR, settings.OBJECT_SPOOL_MAX_BYTES)
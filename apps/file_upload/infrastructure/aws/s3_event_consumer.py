@@ -0,0 +1,162 @@
+# apps/file_upload/infrastructure/aws/s3_event_consumer.py
+"""
+Long-poll consumer for S3 ObjectCreated notifications delivered to SQS.
+
+One poll is one ReceiveMessage (up to 10 messages, WaitTimeSeconds long poll),
+so an object is picked up within a round trip of landing. The records of the
+whole batch go to the handler in one call, deduplicated by (bucket, key,
+etag): S3 delivers at least once and the same object can show up twice in a
+batch, or again after a redelivery.
+
+When the batch call raises, the objects are handed over again one at a time.
+Messages are deleted (DeleteMessageBatch) once all their objects went through;
+the others become visible again after the queue's visibility timeout, and the
+queue's redrive policy moves a message that keeps failing to its dead-letter
+queue. One bad object never holds up the rest of its batch. The handler must
+be idempotent: objects of a failed batch call may run twice.
+
+`run` is the long-running loop: a failed poll (SQS, the dedup cache, the
+handler's database) is logged and retried with a backoff, never fatal.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set
+from urllib.parse import unquote_plus
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.infrastructure.aws.clients import get_sqs_client
+from apps.file_upload.domain.models.dto import StoredObject
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 10  # SQS maximum per ReceiveMessage / DeleteMessageBatch
+DEDUP_PREFIX = "s3evt"
+MAX_BACKOFF_SECONDS = 30
+
+
+def parse_records(body: str) -> Iterator[StoredObject]:
+    """ObjectCreated records of one message (plain S3 or SNS-wrapped)."""
+    doc = json.loads(body)
+    if "Message" in doc and "Records" not in doc:  # S3 -> SNS -> SQS
+        doc = json.loads(doc["Message"])
+    for record in doc.get("Records", ()):  # s3:TestEvent has none
+        if not record.get("eventName", "").startswith("ObjectCreated:"):
+            continue
+        s3 = record["s3"]
+        yield StoredObject(
+            bucket=s3["bucket"]["name"],
+            key=unquote_plus(s3["object"]["key"]),  # keys arrive URL-encoded
+            etag=s3["object"].get("eTag", "").strip('"'),
+            size_bytes=int(s3["object"].get("size", 0)),
+        )
+
+
+def _dedup_key(obj: StoredObject) -> str:
+    # keys may be long or contain spaces; cache keys must not
+    ident = hashlib.sha1(f"{obj.bucket}\n{obj.key}".encode()).hexdigest()
+    return f"{DEDUP_PREFIX}:{ident}:{obj.etag}"
+
+
+@dataclass
+class S3EventConsumer:
+    handler: Callable[[Sequence[StoredObject]], None]
+    queue_url: str = ""
+    wait_seconds: Optional[int] = None
+    sqs: object = None
+
+    def __post_init__(self):
+        self.queue_url = self.queue_url or settings.S3_EVENTS_QUEUE_URL
+        if self.wait_seconds is None:
+            self.wait_seconds = settings.S3_EVENTS_WAIT_SECONDS
+        self.sqs = self.sqs or get_sqs_client()
+
+    def run(self, stop: Callable[[], bool], report=None) -> None:
+        """poll_once until stop(); failures are logged and retried after a backoff."""
+        delay = 0
+        while not stop():
+            try:
+                handled = self.poll_once()
+            except Exception:
+                delay = min(max(1, delay * 2), MAX_BACKOFF_SECONDS)
+                logger.exception("S3 event poll failed; retrying in %ss", delay)
+                for _ in range(delay):  # in steps, so a stop is not kept waiting
+                    if stop():
+                        return
+                    time.sleep(1)
+                continue
+            delay = 0
+            if handled and report:
+                report(handled)
+
+    def poll_once(self) -> int:
+        """Receive, handle and delete one batch; returns new objects handled."""
+        messages = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=BATCH_SIZE,
+            WaitTimeSeconds=self.wait_seconds,
+        ).get("Messages", [])
+        if not messages:
+            return 0
+
+        objects: Dict[str, StoredObject] = {}
+        carried: Dict[str, List[str]] = {}  # message id -> its objects' dedup keys
+        for message in messages:
+            try:
+                found = list(parse_records(message["Body"]))
+            except (ValueError, KeyError, TypeError):
+                # not an S3 event: deleting it beats redelivering it forever
+                logger.warning("Dropping malformed S3 event %s", message["MessageId"])
+                found = []
+            carried[message["MessageId"]] = [_dedup_key(obj) for obj in found]
+            objects.update(zip(carried[message["MessageId"]], found))
+        seen = cache.get_many(list(objects))
+        new = {key: obj for key, obj in objects.items() if key not in seen}
+        failed = self._handle(new)
+        done = {key: 1 for key in new if key not in failed}
+        if done:
+            cache.set_many(done, timeout=settings.S3_EVENTS_DEDUP_TTL)
+        self._delete(
+            [m for m in messages if failed.isdisjoint(carried[m["MessageId"]])]
+        )
+        return len(done)
+
+    def _handle(self, objects: Dict[str, StoredObject]) -> Set[str]:
+        """Dedup keys of the objects the handler failed on."""
+        if not objects:
+            return set()
+        try:
+            self.handler(list(objects.values()))
+            return set()
+        except Exception:
+            logger.exception(
+                "S3 event batch failed; handling its %d objects one by one",
+                len(objects),
+            )
+        failed = set()
+        for key, obj in objects.items():
+            try:
+                self.handler([obj])
+            except Exception:
+                logger.exception("S3 event for s3://%s/%s failed", obj.bucket, obj.key)
+                failed.add(key)
+        return failed
+
+    def _delete(self, messages: List[dict]) -> None:
+        if not messages:
+            return
+        resp = self.sqs.delete_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[
+                {"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]}
+                for i, m in enumerate(messages)
+            ],
+        )
+        for failed in resp.get("Failed", ()):
+            # redelivered later and then skipped by the dedup cache
+            logger.warning("SQS delete failed: %s", failed)
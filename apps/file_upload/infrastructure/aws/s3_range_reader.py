@@ -0,0 +1,232 @@
+# apps/file_upload/infrastructure/aws/s3_range_reader.py
+"""
+Seekable, read-only file object over an S3 object, fetched by byte range.
+
+Parsers that seek (a PDF's trailer and xref table sit at the end; pages are
+read by offset) get only the bytes they touch, so a multi-GB object is never
+downloaded to reach one page:
+
+    with S3RangeReader(bucket, key) as f:
+        f.seek(-1024, io.SEEK_END)
+        tail = f.read()
+
+The object is read in blocks of `block_size`. Blocks are kept in an LRU of
+`max_blocks`, so re-reads (xref, then the objects it points to) cost nothing.
+Missing blocks of one read are fetched with a single ranged GetObject.
+
+Read-ahead adapts to the access pattern. Each sequential read doubles the
+window up to `max_readahead` blocks, prefetched concurrently on a shared
+thread pool. A seek elsewhere resets it, so random access doesn't pay for
+bytes it never uses. Every GET carries IfMatch on the ETag seen at open, so
+an object replaced mid-read fails instead of mixing versions.
+
+Not safe for concurrent reads of one instance, like any file object. Open one
+reader per thread.
+"""
+from __future__ import annotations
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from config import settings
+from apps.core.infrastructure.aws.clients import get_s3_client
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid = 0
+_executor_lock = threading.Lock()
+
+
+def get_prefetch_executor() -> ThreadPoolExecutor:
+    """Process-wide prefetch pool, created after fork (threads don't survive it)."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.S3_RANGE_PREFETCH_WORKERS,
+                thread_name_prefix="s3-range",
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _done(data: bytes) -> Future:
+    future: Future = Future()
+    future.set_result(data)
+    return future
+
+
+class S3RangeReader(io.RawIOBase):
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        *,
+        s3=None,
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        block_size: Optional[int] = None,
+        max_blocks: Optional[int] = None,
+        max_readahead: Optional[int] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        super().__init__()
+        self.bucket = bucket or settings.AWS_STORAGE_BUCKET_NAME
+        self.key = key
+        self.s3 = s3 or get_s3_client()
+        self.block_size = block_size or settings.S3_RANGE_BLOCK_SIZE
+        self.max_blocks = max_blocks or settings.S3_RANGE_CACHE_BLOCKS
+        # prefetched blocks must not evict the ones being read
+        self.max_readahead = min(
+            settings.S3_RANGE_MAX_READAHEAD if max_readahead is None else max_readahead,
+            self.max_blocks // 2,
+        )
+        self._executor = executor
+        if size is None or etag is None:
+            head = self.s3.head_object(Bucket=self.bucket, Key=self.key)
+            size, etag = head["ContentLength"], head["ETag"]
+        self.size, self.etag = size, etag
+        self._pos = 0
+        self._blocks: "OrderedDict[int, Future]" = OrderedDict()
+        self._lock = threading.Lock()  # _blocks is shared with prefetch threads
+        self._window = 0
+        self._next_block = 0
+        self.stats: Dict[str, int] = {"requests": 0, "bytes_fetched": 0, "hits": 0}
+
+    # -- io.RawIOBase ---------------------------------------------------------
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError("negative seek position")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        end = min(self.size, self._pos + len(view))
+        if self._pos >= end:
+            return 0
+        first, last = self._pos // self.block_size, (end - 1) // self.block_size
+        blocks = self._get_blocks(first, last)
+        written = 0
+        for index in range(first, last + 1):
+            start = index * self.block_size
+            chunk = memoryview(blocks[index])[
+                max(self._pos, start) - start : end - start
+            ]
+            view[written : written + len(chunk)] = chunk
+            written += len(chunk)
+        self._pos = end
+        return written
+
+    def readall(self) -> bytes:
+        return self.read(max(0, self.size - self._pos))
+
+    def close(self) -> None:
+        with self._lock:
+            for future in self._blocks.values():
+                future.cancel()
+            self._blocks.clear()
+        super().close()
+
+    # -- blocks ---------------------------------------------------------------
+
+    def _get_blocks(self, first: int, last: int) -> Dict[int, bytes]:
+        with self._lock:
+            cached = {
+                i: self._blocks[i] for i in range(first, last + 1) if i in self._blocks
+            }
+            for i in cached:
+                self._blocks.move_to_end(i)
+        self._read_ahead(first, last)
+
+        blocks: Dict[int, bytes] = {}
+        for index, future in cached.items():
+            try:
+                blocks[index] = future.result()
+                self.stats["hits"] += 1
+            except Exception:
+                pass  # a failed prefetch is fetched again below
+        missing = [i for i in range(first, last + 1) if i not in blocks]
+        while missing:
+            # one GET per contiguous run of missing blocks
+            run_end = 0
+            while (
+                run_end + 1 < len(missing)
+                and missing[run_end + 1] == missing[run_end] + 1
+            ):
+                run_end += 1
+            fetched = self._fetch(missing[0], missing[run_end])
+            blocks.update(fetched)
+            self._store({i: _done(data) for i, data in fetched.items()})
+            missing = missing[run_end + 1 :]
+        return blocks
+
+    def _read_ahead(self, first: int, last: int) -> None:
+        if first in (self._next_block, self._next_block - 1):
+            self._window = min(self.max_readahead, max(1, self._window * 2))
+        else:
+            self._window = 0
+        self._next_block = last + 1
+        stop = min(last + 1 + self._window, self.block_count)
+        with self._lock:
+            todo = [i for i in range(last + 1, stop) if i not in self._blocks]
+        if not todo:
+            return
+        executor = self._executor or get_prefetch_executor()
+        self._store(
+            {i: executor.submit(lambda i=i: self._fetch(i, i)[i]) for i in todo}
+        )
+
+    def _store(self, futures: Dict[int, Future]) -> None:
+        with self._lock:
+            self._blocks.update(futures)
+            for index in futures:
+                self._blocks.move_to_end(index)
+            while len(self._blocks) > self.max_blocks:
+                _, evicted = self._blocks.popitem(last=False)
+                evicted.cancel()
+
+    def _fetch(self, first: int, last: int) -> Dict[int, bytes]:
+        start = first * self.block_size
+        end = min(self.size, (last + 1) * self.block_size) - 1
+        body = self.s3.get_object(
+            Bucket=self.bucket,
+            Key=self.key,
+            Range=f"bytes={start}-{end}",
+            IfMatch=self.etag,
+        )["Body"]
+        try:
+            data = body.read()
+        finally:
+            body.close()
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_fetched"] += len(data)
+        return {
+            i: data[(i - first) * self.block_size : (i - first + 1) * self.block_size]
+            for i in range(first, last + 1)
+        }
+
+    @property
+    def block_count(self) -> int:
+        return -(-self.size // self.block_size)
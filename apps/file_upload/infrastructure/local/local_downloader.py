@@ -0,0 +1,11 @@
+from __future__ import annotations
+from django.conf import settings
+from apps.file_upload.domain.ports.downloader import FileDownloader
+from apps.file_upload.infrastructure.local.storage import sign_url
+
+
+class LocalDownloader(FileDownloader):
+    """Signed GET URL served by the local-object view."""
+
+    def presign_get(self, bucket: str, key: str, expires: int = 900) -> str:
+        return sign_url("get", bucket or settings.LOCAL_STORAGE_BUCKET, key, expires=expires)
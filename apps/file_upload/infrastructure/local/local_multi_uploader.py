@@ -0,0 +1,58 @@
+from __future__ import annotations
+import uuid
+from django.conf import settings
+from apps.file_upload.domain.models.dto import UploadCtx, UploadPlan, CompletionPayload
+from apps.file_upload.domain.models.types import UploadType
+from apps.file_upload.domain.logic.partitioning import plan_part_size
+from apps.file_upload.domain.logic.key_builder import key_for_multipart
+from apps.file_upload.infrastructure.local.storage import (
+    LocalStorage,
+    get_local_storage,
+    sign_url,
+)
+
+
+class LocalMultiPartFileUploader:
+    def __init__(self, storage: LocalStorage | None = None):
+        self.storage = storage or get_local_storage()
+
+    def plan(self, ctx: UploadCtx) -> UploadPlan:
+        session_id = uuid.uuid4().hex
+        bucket = settings.LOCAL_STORAGE_BUCKET
+        key = key_for_multipart(ctx.prefix, session_id, ctx.file_meta.filename)
+
+        mpu_upload_id = uuid.uuid4().hex
+        self.storage.create_multipart(mpu_upload_id)
+
+        part_size, total_parts = plan_part_size(ctx.file_meta.size_bytes)
+        part_urls = [
+            sign_url("part", bucket, key, expires=3600, upload_id=mpu_upload_id, part=i)
+            for i in range(1, total_parts + 1)
+        ]
+
+        return UploadPlan(
+            upload_type=UploadType.MULTI_PART,
+            upload_id=session_id,
+            bucket=bucket,
+            key=key,
+            part_size=part_size,
+            total_parts=total_parts,
+            part_urls=part_urls,
+            complete_url_payload={
+                "bucket": bucket,
+                "key": key,
+                "session_id": session_id,
+                "mpu_upload_id": mpu_upload_id,
+                "parts": [],
+            },
+        )
+
+    def complete(self, payload: CompletionPayload) -> None:
+        if not payload.mpu_upload_id or not payload.parts:
+            raise ValueError("multipart completion requires mpu_upload_id and parts")
+        self.storage.complete_multipart(
+            payload.mpu_upload_id,
+            payload.bucket,
+            payload.key,
+            [(p["PartNumber"], p["ETag"]) for p in payload.parts],
+        )
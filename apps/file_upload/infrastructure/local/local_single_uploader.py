@@ -0,0 +1,38 @@
+from __future__ import annotations
+import uuid
+from django.conf import settings
+from apps.file_upload.domain.models.dto import UploadCtx, UploadPlan, CompletionPayload
+from apps.file_upload.domain.models.types import UploadType
+from apps.file_upload.domain.logic.key_builder import key_for_single
+from apps.file_upload.infrastructure.local.storage import (
+    LocalStorage,
+    get_local_storage,
+    sign_url,
+)
+
+
+class LocalSingleFileUploader:
+    def __init__(self, storage: LocalStorage | None = None):
+        self.storage = storage or get_local_storage()
+
+    def plan(self, ctx: UploadCtx) -> UploadPlan:
+        session_id = uuid.uuid4().hex
+        bucket = settings.LOCAL_STORAGE_BUCKET
+        key = key_for_single(ctx.prefix, session_id, 1, ctx.file_meta.filename)
+        return UploadPlan(
+            upload_type=UploadType.SINGLE_PART,
+            upload_id=session_id,
+            bucket=bucket,
+            key=key,
+            put_url=sign_url("put", bucket, key, expires=3600),
+            complete_url_payload={
+                "bucket": bucket,
+                "key": key,
+                "session_id": session_id,
+            },
+        )
+
+    def complete(self, payload: CompletionPayload) -> None:
+        # unlike S3 the check is free, so do it
+        if not self.storage.exists(payload.bucket, payload.key):
+            raise ValueError(f"object not uploaded: {payload.key}")
@@ -0,0 +1,191 @@
+# apps/file_upload/infrastructure/local/storage.py
+"""
+Object storage on the local filesystem for the "local" provider (dev, tests,
+benchmarks: no network, no AWS).
+
+Objects live at <root>/<bucket>/<key>, multipart parts at
+<root>/.parts/<upload_id>/<n>. Every write streams into a temp file next to
+its target and is renamed into place, so readers never see a partial object.
+Parts are assembled with os.sendfile (kernel-side copy, nothing buffered in
+Python). Clients reach the storage through HMAC-signed, expiring URLs
+(sign_url) served by apps.file_upload.viewsets.local_storage.
+"""
+from __future__ import annotations
+import hashlib
+import hmac
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.urls import reverse
+
+CHUNK = 1024 * 1024
+PARTS_DIR = ".parts"
+
+
+class InvalidKey(ValueError):
+    pass
+
+
+# ---------- signed URLs ----------
+
+
+def _signature(op: str, bucket: str, key: str, upload: str, part: str, exp: str) -> str:
+    msg = "\n".join((op, bucket, key, upload, part, exp))
+    return hmac.new(
+        settings.LOCAL_STORAGE_SECRET.encode(), msg.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def sign_url(
+    op: str,
+    bucket: str,
+    key: str,
+    *,
+    expires: int = 3600,
+    upload_id: str = "",
+    part: Optional[int] = None,
+) -> str:
+    """URL for `op` ("put", "part" or "get") on one object, valid `expires` s."""
+    exp = str(int(time.time()) + expires)
+    part_s = str(part) if part is not None else ""
+    params = {"op": op, "exp": exp}
+    if upload_id:
+        params.update(upload=upload_id, part=part_s)
+    params["sig"] = _signature(op, bucket, key, upload_id, part_s, exp)
+    path = reverse("local-object", kwargs={"bucket": bucket, "key": key})
+    return f"{settings.LOCAL_STORAGE_URL.rstrip('/')}{path}?{urlencode(params)}"
+
+
+def verify_url(bucket: str, key: str, params: Dict[str, str]) -> bool:
+    exp = params.get("exp", "")
+    if not exp.isdigit() or int(exp) < time.time():
+        return False
+    expected = _signature(
+        params.get("op", ""),
+        bucket,
+        key,
+        params.get("upload", ""),
+        params.get("part", ""),
+        exp,
+    )
+    return hmac.compare_digest(params.get("sig", ""), expected)
+
+
+# ---------- storage ----------
+
+
+def _append(dst: BinaryIO, src: BinaryIO) -> None:
+    size = os.fstat(src.fileno()).st_size
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+    except (AttributeError, OSError):  # no sendfile, or not to a file (macOS)
+        src.seek(offset)
+        dst.seek(0, os.SEEK_END)
+        shutil.copyfileobj(src, dst, CHUNK)
+
+
+@dataclass(frozen=True)
+class LocalStorage:
+    root: Path
+
+    def _within(self, path: Path) -> Path:
+        path = path.resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise InvalidKey(f"path escapes the storage root: {path}")
+        return path
+
+    def object_path(self, bucket: str, key: str) -> Path:
+        if not bucket or bucket.startswith(".") or "/" in bucket or not key:
+            raise InvalidKey(f"invalid bucket/key: {bucket!r}/{key!r}")
+        return self._within(self.root / bucket / key)
+
+    def part_path(self, upload_id: str, number: int) -> Path:
+        return self._within(self.root / PARTS_DIR / upload_id / f"{int(number):05d}")
+
+    def _write(self, path: Path, stream: BinaryIO) -> str:
+        """Stream into `path` atomically; return the hex MD5 (S3-style ETag)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.md5(usedforsecurity=False)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := stream.read(CHUNK):
+                    digest.update(chunk)
+                    out.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return digest.hexdigest()
+
+    def put_object(self, bucket: str, key: str, stream: BinaryIO) -> str:
+        return self._write(self.object_path(bucket, key), stream)
+
+    def exists(self, bucket: str, key: str) -> bool:
+        return self.object_path(bucket, key).is_file()
+
+    def open(self, bucket: str, key: str) -> BinaryIO:
+        return self.object_path(bucket, key).open("rb")
+
+    # ---- multipart ----
+    def create_multipart(self, upload_id: str) -> None:
+        self._within(self.root / PARTS_DIR / upload_id).mkdir(parents=True, exist_ok=True)
+
+    def put_part(self, upload_id: str, number: int, stream: BinaryIO) -> str:
+        path = self.part_path(upload_id, number)
+        if not path.parent.is_dir():
+            raise KeyError(f"no multipart upload {upload_id}")
+        etag = self._write(path, stream)
+        path.with_suffix(".etag").write_text(etag)
+        return etag
+
+    def complete_multipart(
+        self, upload_id: str, bucket: str, key: str, parts: Sequence[Tuple[int, str]]
+    ) -> None:
+        """
+        Concatenate `parts` ((number, etag), ascending) into bucket/key. Like
+        S3, only the listed parts are used and each ETag must match.
+        """
+        numbers = [n for n, _ in parts]
+        if not numbers or numbers != sorted(set(numbers)):
+            raise ValueError("parts must be listed once each, in ascending order")
+        paths = []
+        for number, etag in parts:
+            path = self.part_path(upload_id, number)
+            stored = path.with_suffix(".etag")
+            if not stored.is_file() or stored.read_text() != etag.strip('"'):
+                raise ValueError(f"part {number}: missing or ETag mismatch")
+            paths.append(path)
+
+        target = self.object_path(bucket, key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for path in paths:
+                    with path.open("rb") as src:
+                        _append(out, src)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.abort_multipart(upload_id)
+
+    def abort_multipart(self, upload_id: str) -> None:
+        shutil.rmtree(self._within(self.root / PARTS_DIR / upload_id), ignore_errors=True)
+
+
+def get_local_storage() -> LocalStorage:
+    return LocalStorage(Path(settings.LOCAL_STORAGE_ROOT))
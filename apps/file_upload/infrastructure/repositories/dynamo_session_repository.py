@@ -13,6 +13,36 @@ from apps.core.infrastructure.aws.clients import get_dynamodb_table
 TABLE_NAME = "file_upload_session"
 
 
+def create_session_table(dynamodb_client, table_name: str = TABLE_NAME) -> None:
+    """
+    Create the session table with the key layout documented on
+    FileUploadSessionSchema (PK/SK plus GSI1-3). Used against local stand-ins
+    (moto, DynamoDB Local) by tests and benchmarks; production tables are
+    provisioned outside the app.
+    """
+    keys = ("PK", "SK", "GSI1PK", "GSI1SK", "GSI2PK", "GSI2SK", "GSI3PK", "GSI3SK")
+    dynamodb_client.create_table(
+        TableName=table_name,
+        BillingMode="PAY_PER_REQUEST",
+        AttributeDefinitions=[{"AttributeName": k, "AttributeType": "S"} for k in keys],
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": f"GSI{i}",
+                "KeySchema": [
+                    {"AttributeName": f"GSI{i}PK", "KeyType": "HASH"},
+                    {"AttributeName": f"GSI{i}SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+            for i in (1, 2, 3)
+        ],
+    )
+
+
 class DynamoSessionRepository(SessionRepository):
     def __init__(self, table_name: str = TABLE_NAME):
         self.table = get_dynamodb_table(table_name)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+from django.conf import settings
+from apps.file_upload.domain.models.dto import FileMeta, UploadCtx, UploadPlan
+from apps.file_upload.domain.models.types import UploadStatus, UploadType
+from apps.file_upload.domain.ports.repository import SessionRepository
+
+
+class LocalSessionRepository(SessionRepository):
+    """
+    Upload sessions as one JSON file each under <LOCAL_STORAGE_ROOT>/.sessions,
+    the "local" provider's stand-in for DynamoSessionRepository. Writes are
+    atomic (temp file + rename); there is no locking, which is fine for one
+    client completing its own upload.
+    """
+
+    def __init__(self, root: str | Path | None = None):
+        self.dir = Path(root or settings.LOCAL_STORAGE_ROOT) / ".sessions"
+
+    # ---------- helpers ----------
+    def _now_ts(self) -> int:
+        return int(datetime.now(timezone.utc).timestamp())
+
+    def _path(self, session_id: str) -> Path:
+        if not session_id.isalnum():
+            raise KeyError(f"session not found: {session_id}")
+        return self.dir / f"{session_id}.json"
+
+    def _load(self, session_id: str) -> dict:
+        try:
+            return json.loads(self._path(session_id).read_text())
+        except FileNotFoundError:
+            raise KeyError(f"session not found: {session_id}") from None
+
+    def _save(self, item: dict) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.dir, prefix=".tmp-")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(item, fh)
+        os.replace(tmp, self._path(item["upload_id"]))
+
+    def _update(self, session_id: str, **fields) -> None:
+        item = self._load(session_id)
+        item.update(fields)
+        self._save(item)
+
+    # ---------- required API ----------
+    def create_session(self, ctx: UploadCtx, plan: UploadPlan) -> None:
+        if self._path(plan.upload_id).exists():
+            raise ValueError(f"session exists: {plan.upload_id}")
+        self._save(
+            {
+                "upload_id": plan.upload_id,
+                "provider": getattr(ctx.provider, "value", ctx.provider),
+                "user_sub": ctx.user_sub,
+                "project_id": ctx.project_id,
+                "bucket": plan.bucket,
+                "key": plan.key,
+                "status": UploadStatus.UPLOADING.value,
+                "started_at": self._now_ts(),
+                "total_parts": plan.total_parts,
+                "part_size": plan.part_size,
+                "bytes_total": ctx.file_meta.size_bytes,
+                "content_type": ctx.file_meta.content_type,
+            }
+        )
+
+    def set_status(self, session_id: str, status: str) -> None:
+        self._update(session_id, status=status)
+
+    def mark_available(self, session_id: str, bucket: str, key: str) -> None:
+        self._update(session_id, completed_at=self._now_ts())
+
+    def mark_error(self, session_id: str, code: str, message: str) -> None:
+        self._update(
+            session_id,
+            status=UploadStatus.ERROR.value,
+            error_code=code,
+            error_message=message,
+        )
+
+    def save_multipart_id(self, session_id: str, mpu_upload_id: str) -> None:
+        self._update(session_id, mpu_id=mpu_upload_id)
+
+    def get_ctx(self, session_id: str) -> UploadCtx:
+        item = self._load(session_id)
+        return UploadCtx(
+            provider=item["provider"],
+            user_sub=item["user_sub"],
+            project_id=item.get("project_id", "default"),
+            prefix="/".join(item["key"].split("/")[:-1]) + "/",
+            file_meta=FileMeta(
+                filename=item["key"].split("/")[-1],
+                content_type=item["content_type"],
+                size_bytes=int(item["bytes_total"]),
+            ),
+        )
+
+    def get_plan(self, session_id: str) -> UploadPlan:
+        item = self._load(session_id)
+        return UploadPlan(
+            upload_type=(
+                UploadType.MULTI_PART if item.get("total_parts") else UploadType.SINGLE_PART
+            ),
+            upload_id=session_id,
+            bucket=item["bucket"],
+            key=item["key"],
+            part_size=item.get("part_size"),
+            total_parts=item.get("total_parts"),
+        )
+
+    def get_multipart_id(self, session_id: str) -> Optional[str]:
+        return self._load(session_id).get("mpu_id")
+
+    def abort_multipart(self, session_id: str) -> Optional[dict]:
+        from apps.file_upload.infrastructure.local.storage import get_local_storage
+
+        mpu_id = self.get_multipart_id(session_id)
+        if mpu_id:
+            get_local_storage().abort_multipart(mpu_id)
+        return None
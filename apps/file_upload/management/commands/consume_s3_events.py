@@ -0,0 +1,49 @@
+# apps/file_upload/management/commands/consume_s3_events.py
+from __future__ import annotations
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.file_upload.application.services.file_service import get_file_service
+from apps.file_upload.application.services.upload_events import objects_created
+from apps.file_upload.infrastructure.aws.s3_event_consumer import S3EventConsumer
+from apps.file_upload.tasks.file_tasks import process_file_upload
+
+
+class Command(BaseCommand):
+    help = (
+        "Long-poll S3_EVENTS_QUEUE_URL for S3 ObjectCreated events: mark files "
+        "and sessions available and queue process_file_upload on file_upload."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queue-url", default="")
+        parser.add_argument("--once", action="store_true", help="one poll, then exit")
+
+    def handle(self, *args, **options):
+        queue_url = options["queue_url"] or settings.S3_EVENTS_QUEUE_URL
+        if not queue_url:
+            raise CommandError("S3_EVENTS_QUEUE_URL is not set")
+        sessions = get_file_service().sessions
+        consumer = S3EventConsumer(
+            handler=lambda objs: objects_created(
+                objs,
+                sessions=sessions,
+                enqueue=lambda o: process_file_upload.delay(o.bucket, o.key, o.etag),
+            ),
+            queue_url=queue_url,
+        )
+
+        if options["once"]:
+            self._report(consumer.poll_once())
+            return
+
+        stopping = []
+        # finish the batch in hand; a long poll returns within WaitTimeSeconds
+        signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+        consumer.run(lambda: bool(stopping), self._report)
+
+    def _report(self, handled: int) -> None:
+        if handled:
+            self.stdout.write(f"{handled} objects queued for processing")
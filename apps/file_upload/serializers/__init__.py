@@ -5,6 +5,8 @@ from .serializers import (
     CompletionPayloadSerializer,
     CompletionPartSerializer,
     DownloadRequestSerializer,
+    plan_response_data,
+    validate_completion_payload,
 )
 
 __all__ = [
@@ -14,4 +16,6 @@ __all__ = [
     "CompletionPayloadSerializer",
     "CompletionPartSerializer",
     "DownloadRequestSerializer",
+    "plan_response_data",
+    "validate_completion_payload",
 ]
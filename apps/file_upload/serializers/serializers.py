@@ -1,6 +1,12 @@
 # apps/file_upload/interfaces/django/serializers.py
 from __future__ import annotations
+from typing import Any, Dict, Mapping
+import pydantic
 from rest_framework import serializers
+from apps.file_upload.domain.models.dto import CompletionPayload, UploadPlan
+from apps.file_upload.domain.schemas.completion_schema import (
+    parse_completion_payload,
+)
 from apps.file_upload.domain.models.types import ProviderEnum, UploadType
 from apps.file_upload.fields import EnumField
 
@@ -25,6 +31,8 @@ class CompletionPartSerializer(serializers.Serializer):
 
 
 class CompletionPayloadSerializer(serializers.Serializer):
+    """Documents the completion body; the view uses validate_completion_payload."""
+
     provider = EnumField(ProviderEnum)
     bucket = serializers.CharField()
     key = serializers.CharField()
@@ -36,7 +44,24 @@ class CompletionPayloadSerializer(serializers.Serializer):
     checksum = serializers.CharField(required=False, allow_blank=True)
 
 
+def validate_completion_payload(data: Mapping[str, Any]) -> CompletionPayload:
+    """
+    Fast path for CompletionPayloadSerializer (up to 10k parts): pydantic-core
+    validates the whole body in one call, errors come back in DRF's shape.
+    """
+    try:
+        return parse_completion_payload(data)
+    except pydantic.ValidationError as exc:
+        detail: Dict[str, Any] = {}
+        for err in exc.errors(include_url=False):
+            field = ".".join(str(p) for p in err["loc"]) or "non_field_errors"
+            detail.setdefault(field, []).append(err["msg"])
+        raise serializers.ValidationError(detail)
+
+
 class UploadPlanResponseSerializer(serializers.Serializer):
+    """Documents the plan response; the view builds it with plan_response_data."""
+
     upload_type = EnumField(UploadType)
     upload_id = serializers.CharField()
     bucket = serializers.CharField()
@@ -50,8 +75,27 @@ class UploadPlanResponseSerializer(serializers.Serializer):
     complete_url_payload = serializers.DictField(required=False, allow_null=True)
 
 
+def plan_response_data(plan: UploadPlan) -> Dict[str, Any]:
+    """
+    Plain-dict twin of UploadPlanResponseSerializer for the hot path: no
+    per-part field objects, the renderer encodes part_urls as-is.
+    """
+    return {
+        "upload_type": UploadType(plan.upload_type).value,
+        "upload_id": plan.upload_id,
+        "bucket": plan.bucket,
+        "key": plan.key,
+        "part_size": plan.part_size,
+        "total_parts": plan.total_parts,
+        "put_url": plan.put_url,
+        "part_urls": list(plan.part_urls) if plan.part_urls is not None else None,
+        "complete_url_payload": plan.complete_url_payload,
+    }
+
+
 class DownloadRequestSerializer(serializers.Serializer):
     provider = EnumField(ProviderEnum)
     bucket = serializers.CharField(required=False, allow_blank=True)
     key = serializers.CharField()
     expires = serializers.IntegerField(required=False, min_value=60, default=900)
+
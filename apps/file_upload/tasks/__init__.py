@@ -0,0 +1 @@
+from .file_tasks import process_file_upload  # noqa: F401
@@ -1,10 +1,25 @@
-# """Celery tasks for file upload operations."""
+"""Celery tasks for file upload operations."""
+from celery import shared_task
+from django.utils import timezone
 
-# from celery import shared_task
+from apps.file_upload.models import File, FileStatus
 
 
-# @shared_task
-# def process_file_upload(file_id):
-#     """Process file upload asynchronously."""
-#     # TODO: Implement file processing task
-#     pass
+@shared_task(name="apps.file_upload_tasks.process_file_upload")
+def process_file_upload(bucket, key, etag=""):
+    """
+    Post-upload processing of one stored object (fanned out by
+    `manage.py consume_s3_events`). Keyed by (bucket, key) rather than File id:
+    the S3 event is the trigger, whether or not a File row exists yet.
+    """
+    files = File.objects.filter(bucket=bucket, key=key).exclude(status=FileStatus.DONE)
+    if etag:
+        # a newer upload to the same key carries a different etag
+        files = files.filter(etag__in=("", etag))
+    ids = list(files.values_list("pk", flat=True))
+    File.objects.filter(pk__in=ids).update(status=FileStatus.PROCESSING)
+    # processing steps hook in here
+    File.objects.filter(pk__in=ids).update(
+        status=FileStatus.DONE, processed_at=timezone.now()
+    )
+    return len(ids)
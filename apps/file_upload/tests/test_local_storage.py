@@ -0,0 +1,120 @@
+"""The "local" storage provider: filesystem objects behind signed URLs."""
+import tempfile
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlsplit
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.infrastructure.aws.warmup import reset_clients
+from apps.core.models import User
+from apps.file_upload.infrastructure.local.storage import (
+    InvalidKey,
+    LocalStorage,
+    sign_url,
+)
+from apps.file_upload.viewsets.upload_viewset import UploadViewSet
+
+MB = 1024 * 1024
+
+
+def _plan_body(size_bytes, provider="aws"):
+    return {
+        "provider": provider,
+        "user_sub": "ignored",
+        "prefix": "tests/",
+        "file_meta": {
+            "filename": "a.bin",
+            "content_type": "application/octet-stream",
+            "size_bytes": size_bytes,
+        },
+    }
+
+
+class LocalStorageApiTestCase(SimpleTestCase):
+    """Upload API with FILE_STORAGE=local: no AWS anywhere in the flow."""
+
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = Path(root.name)
+        settings = override_settings(FILE_STORAGE="local", LOCAL_STORAGE_ROOT=root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        patches = [
+            mock.patch(
+                "apps.core.infrastructure.aws.cognito.verify_access_token",
+                return_value={"sub": "9f0c6f5e-55d4-4a52-9a3c-3b8f4d1c2e7a"},
+            ),
+            mock.patch(
+                "apps.core.authentication._user_for_sub",
+                return_value=User(pk=1, username="tester"),
+            ),
+            mock.patch.object(UploadViewSet, "throttle_classes", []),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        reset_clients()
+        self.addCleanup(reset_clients)
+
+    def _post(self, action, body):
+        resp = self.client.post(
+            f"/api/v1/file-upload/{action}",
+            body,
+            content_type="application/json",
+            HTTP_AUTHORIZATION="Bearer t",
+        )
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return resp.json()
+
+    def _put(self, url, data):
+        resp = self.client.put(url, data, content_type="application/octet-stream")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return resp["ETag"]
+
+    def _get(self, url):
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        return b"".join(resp.streaming_content)
+
+    def test_single_part_flow(self):
+        plan = self._post("upload/plan", _plan_body(MB))
+        self._put(plan["put_url"], b"hello")
+        self._post("upload/complete", {**plan["complete_url_payload"], "provider": "aws"})
+
+        url = self._post("download/presign", {"provider": "aws", "key": plan["key"]})["url"]
+        self.assertEqual(self._get(url), b"hello")
+
+    def test_multipart_flow_concatenates_parts(self):
+        plan = self._post("upload/plan", _plan_body(200 * MB, provider="local"))
+        self.assertEqual(len(plan["part_urls"]), 10)
+        chunks = [b"a" * 3, b"b" * 4, b"c" * 5]
+        parts = [
+            {"PartNumber": n, "ETag": self._put(url, chunk)}
+            for n, (url, chunk) in enumerate(zip(plan["part_urls"], chunks), start=1)
+        ]
+        payload = plan["complete_url_payload"]
+        self._post("upload/complete", {**payload, "provider": "local", "parts": parts})
+
+        self.assertEqual(
+            (self.root / payload["bucket"] / payload["key"]).read_bytes(), b"".join(chunks)
+        )
+        self.assertFalse((self.root / ".parts" / payload["mpu_upload_id"]).exists())
+
+    def test_bad_signatures_are_rejected(self):
+        url = sign_url("put", "uploads", "k/a.bin")
+        tampered = url.replace("k/a.bin", "k/b.bin")
+        self.assertEqual(self.client.put(tampered, b"x").status_code, 403)
+        # a PUT URL does not allow reading
+        self.assertEqual(self.client.get(url).status_code, 403)
+        expired = sign_url("get", "uploads", "k/a.bin", expires=-1)
+        self.assertEqual(self.client.get(expired).status_code, 403)
+        self.assertEqual(urlsplit(url).path, "/api/v1/file-upload/local/uploads/k/a.bin")
+
+    def test_keys_cannot_escape_the_root(self):
+        storage = LocalStorage(self.root)
+        with self.assertRaises(InvalidKey):
+            storage.object_path("uploads", "../../etc/passwd")
+        with self.assertRaises(InvalidKey):
+            storage.object_path(".parts", "x")
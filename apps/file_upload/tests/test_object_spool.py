@@ -0,0 +1,98 @@
+"""Worker-local object spool: hits, new ETags, LRU bound, single flight."""
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from django.test import SimpleTestCase
+from moto import mock_aws
+from prometheus_client import REGISTRY
+
+from apps.core.infrastructure.aws.clients import get_s3_client
+from apps.core.infrastructure.aws.warmup import reset_clients
+from apps.file_upload.infrastructure.aws.object_spool import ObjectSpool
+
+BUCKET = "test-object-spool"
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class ObjectSpoolTestCase(SimpleTestCase):
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        reset_clients()
+        self.addCleanup(reset_clients)
+        self.s3 = get_s3_client()
+        self.s3.create_bucket(Bucket=BUCKET)
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.spool = ObjectSpool(root.name, max_bytes=2500, s3=self.s3)
+
+    def put(self, key, body):
+        return self.s3.put_object(Bucket=BUCKET, Key=key, Body=body)["ETag"]
+
+    def test_second_read_is_a_hit(self):
+        etag = self.put("doc.pdf", b"%PDF" + b"x" * 996)
+        saved = sample("object_spool_bytes_saved_total")
+        with mock.patch.object(self.s3, "get_object", wraps=self.s3.get_object) as get:
+            with self.spool.open(BUCKET, "doc.pdf", etag) as data:
+                self.assertEqual(data[:4], b"%PDF")
+            with self.spool.open(BUCKET, "doc.pdf", etag) as data:
+                self.assertEqual(len(data), 1000)
+        get.assert_called_once()
+        self.assertEqual(sample("object_spool_bytes_saved_total") - saved, 1000)
+
+    def test_new_etag_is_a_new_entry(self):
+        old = self.put("doc.pdf", b"old")
+        self.spool.fetch(BUCKET, "doc.pdf", old)
+        self.put("doc.pdf", b"new")
+        with open(self.spool.fetch(BUCKET, "doc.pdf"), "rb") as f:  # etag by HEAD
+            self.assertEqual(f.read(), b"new")
+
+    def test_least_recently_used_is_evicted(self):
+        etags = {k: self.put(k, k.encode() * 1000) for k in "abc"}  # 1000 bytes each
+        a = self.spool.fetch(BUCKET, "a", etags["a"])
+        b = self.spool.fetch(BUCKET, "b", etags["b"])
+        past = time.time() - 60
+        os.utime(a, (past, past))
+        os.utime(b, (past + 1, past + 1))
+        self.spool.fetch(BUCKET, "a", etags["a"])  # hit: a is recent again
+        c = self.spool.fetch(BUCKET, "c", etags["c"])
+        self.assertEqual([os.path.exists(p) for p in (a, b, c)], [True, False, True])
+
+    def test_concurrent_misses_download_once(self):
+        etag = self.put("doc.pdf", b"x" * 1000)
+        download = self.s3.get_object
+
+        def slow_download(**kwargs):
+            time.sleep(0.2)
+            return download(**kwargs)
+
+        paths, fetch = [], self.spool.fetch
+        with mock.patch.object(self.s3, "get_object", side_effect=slow_download) as get:
+            threads = [
+                threading.Thread(target=lambda: paths.append(fetch(BUCKET, "doc.pdf", etag)))
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(len(set(paths)), 1)
+
+    def test_failed_download_leaves_no_fd_or_part(self):
+        etag = self.put("doc.pdf", b"old")
+        self.put("doc.pdf", b"new")  # IfMatch on the old etag fails
+        fds = len(os.listdir("/proc/self/fd"))
+        with self.assertRaises(ClientError):
+            self.spool.fetch(BUCKET, "doc.pdf", etag)
+        self.assertEqual(len(os.listdir("/proc/self/fd")), fds)
+        shard = os.path.dirname(self.spool.path_for(BUCKET, "doc.pdf", etag))
+        self.assertEqual(os.listdir(shard), [])
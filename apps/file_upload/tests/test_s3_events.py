@@ -0,0 +1,150 @@
+"""S3 ObjectCreated events from SQS drive post-upload processing."""
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from moto import mock_aws
+
+from apps.core.infrastructure.aws.clients import get_s3_client, get_sqs_client
+from apps.core.infrastructure.aws.warmup import reset_clients
+from apps.file_upload.application.services.upload_events import objects_created
+from apps.file_upload.infrastructure.aws.s3_event_consumer import S3EventConsumer
+
+BUCKET = "test-uploads"
+SESSION = "0123456789abcdef0123456789abcdef"
+KEY = f"tests/{SESSION}/0001__a b.pdf"
+
+
+class S3EventConsumerTestCase(SimpleTestCase):
+    """Real S3 notifications into a moto SQS queue, consumed in batches."""
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        reset_clients()
+        self.addCleanup(reset_clients)
+        self.addCleanup(cache.clear)
+        files = mock.patch(
+            "apps.file_upload.application.services.upload_events.mark_files_available"
+        )
+        self.mark_files_available = files.start()
+        self.addCleanup(files.stop)
+
+        s3, sqs = get_s3_client(), get_sqs_client()
+        s3.create_bucket(Bucket=BUCKET)
+        self.queue_url = sqs.create_queue(QueueName="events")["QueueUrl"]
+        arn = sqs.get_queue_attributes(QueueUrl=self.queue_url, AttributeNames=["QueueArn"])
+        s3.put_bucket_notification_configuration(
+            Bucket=BUCKET,
+            NotificationConfiguration={
+                "QueueConfigurations": [
+                    {
+                        "QueueArn": arn["Attributes"]["QueueArn"],
+                        "Events": ["s3:ObjectCreated:*"],
+                    }
+                ]
+            },
+        )
+        self.sessions = mock.Mock()
+        self.enqueued = []
+        self.consumer = S3EventConsumer(
+            handler=lambda objs: objects_created(
+                objs, sessions=self.sessions, enqueue=self.enqueued.append
+            ),
+            queue_url=self.queue_url,
+            wait_seconds=0,
+        )
+
+    def _drain(self):
+        handled = 0
+        while True:
+            attrs = get_sqs_client().get_queue_attributes(
+                QueueUrl=self.queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+            )
+            if attrs["Attributes"]["ApproximateNumberOfMessages"] == "0":
+                return handled
+            handled += self.consumer.poll_once()
+
+    def test_object_created_marks_file_and_session_and_fans_out(self):
+        get_s3_client().put_object(Bucket=BUCKET, Key=KEY, Body=b"%PDF")
+
+        self.assertEqual(self._drain(), 1)
+
+        (obj,) = self.enqueued
+        self.assertEqual((obj.bucket, obj.key, obj.size_bytes), (BUCKET, KEY, 4))
+        self.mark_files_available.assert_called_once_with([obj])
+        self.sessions.set_status.assert_called_once_with(SESSION, "available")
+
+    def test_duplicate_deliveries_are_processed_once(self):
+        get_s3_client().put_object(Bucket=BUCKET, Key=KEY, Body=b"x")
+        self._drain()
+        # S3 delivers at least once: replay the same record twice in one batch
+        body = json.dumps(
+            {
+                "Records": [
+                    {
+                        "eventName": "ObjectCreated:Put",
+                        "s3": {
+                            "bucket": {"name": BUCKET},
+                            "object": {"key": KEY, "eTag": self.enqueued[0].etag},
+                        },
+                    }
+                ]
+            }
+        )
+        for _ in range(2):
+            get_sqs_client().send_message(QueueUrl=self.queue_url, MessageBody=body)
+
+        self.assertEqual(self._drain(), 0)
+        self.assertEqual(len(self.enqueued), 1)
+
+    def test_failing_object_does_not_hold_up_its_batch(self):
+        for key in ("tests/ok.pdf", "tests/poison.pdf"):
+            get_s3_client().put_object(Bucket=BUCKET, Key=key, Body=b"x")
+        handled = []
+
+        def handler(objs):
+            if any(o.key == "tests/poison.pdf" for o in objs):
+                raise RuntimeError("boom")
+            handled.extend(o.key for o in objs)
+
+        self.consumer.handler = handler
+        with self.assertLogs(S3EventConsumer.__module__, "ERROR"):
+            self.assertEqual(self.consumer.poll_once(), 1)
+        self.assertEqual(handled, ["tests/ok.pdf"])
+        # only the poison message stays, for redelivery (and the DLQ)
+        attrs = get_sqs_client().get_queue_attributes(
+            QueueUrl=self.queue_url,
+            AttributeNames=["ApproximateNumberOfMessagesNotVisible"],
+        )
+        self.assertEqual(attrs["Attributes"]["ApproximateNumberOfMessagesNotVisible"], "1")
+
+    def test_loop_keeps_going_after_failures(self):
+        get_s3_client().put_object(Bucket=BUCKET, Key=KEY, Body=b"x")
+        handler, calls, polls = self.consumer.handler, [], []
+
+        def flaky_handler(objs):
+            calls.append(objs)
+            if len(calls) == 1:
+                raise ConnectionError("database went away")
+            handler(objs)
+
+        sqs = self.consumer.sqs
+        receive = sqs.receive_message
+
+        def flaky_receive(**kwargs):
+            polls.append(kwargs)
+            if len(polls) == 1:
+                raise ConnectionError("network")
+            return receive(**kwargs)
+
+        self.consumer.handler = flaky_handler
+        with mock.patch.object(sqs, "receive_message", side_effect=flaky_receive), \
+                mock.patch(f"{S3EventConsumer.__module__}.time.sleep") as sleep, \
+                self.assertLogs(S3EventConsumer.__module__, "ERROR"):
+            self.consumer.run(lambda: len(polls) >= 3)
+        sleep.assert_called_once_with(1)  # backoff after the failed receive
+        self.assertEqual([o.key for o in self.enqueued], [KEY])
+        self.assertEqual(len(calls), 2)  # the batch call, then the object alone
@@ -0,0 +1,71 @@
+"""Ranged S3 reads: exact bytes, GETs only for what is read, read-ahead."""
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+from django.test import SimpleTestCase
+from moto import mock_aws
+
+from apps.core.infrastructure.aws.clients import get_s3_client
+from apps.core.infrastructure.aws.warmup import reset_clients
+from apps.file_upload.infrastructure.aws.s3_range_reader import S3RangeReader
+
+BUCKET = "test-range-reader"
+KB = 1024
+DATA = random.Random(7).randbytes(100 * KB + 123)  # 101 blocks of 1 KiB
+
+
+class S3RangeReaderTestCase(SimpleTestCase):
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        reset_clients()
+        self.addCleanup(reset_clients)
+        self.s3 = get_s3_client()
+        self.s3.create_bucket(Bucket=BUCKET)
+        self.s3.put_object(Bucket=BUCKET, Key="doc.pdf", Body=DATA)
+        self.executor = ThreadPoolExecutor(4)
+        self.addCleanup(self.executor.shutdown)
+
+    def open(self, **kwargs):
+        options = {"block_size": KB, "max_blocks": 16, "max_readahead": 4}
+        reader = S3RangeReader(
+            BUCKET, "doc.pdf", s3=self.s3, executor=self.executor, **{**options, **kwargs}
+        )
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_random_reads_match_the_object(self):
+        reader, rng = self.open(), random.Random(1)
+        for _ in range(50):
+            offset, size = rng.randrange(len(DATA)), rng.randrange(1, 5 * KB)
+            reader.seek(offset)
+            self.assertEqual(reader.read(size), DATA[offset : offset + size])
+        self.assertEqual(reader.seek(0, io.SEEK_END), len(DATA))
+        self.assertEqual(reader.read(), b"")
+
+    def test_seek_to_tail_fetches_only_the_tail(self):
+        """A parser reading the trailer of a large file costs one small GET."""
+        reader = self.open()
+        reader.seek(-100, io.SEEK_END)
+        self.assertEqual(reader.read(), DATA[-100:])
+        reader.seek(-50, io.SEEK_END)
+        reader.read()
+        self.assertEqual(reader.stats["requests"], 1)
+        self.assertEqual(reader.stats["bytes_fetched"], len(DATA) % KB)
+
+    def test_sequential_reads_prefetch_each_block_once(self):
+        reader = self.open()
+        self.assertEqual(b"".join(iter(lambda: reader.read(KB), b"")), DATA)
+        self.assertEqual(reader.stats["bytes_fetched"], len(DATA))
+        self.assertGreater(reader.stats["hits"], 50)  # served by read-ahead
+
+    def test_replaced_object_fails_instead_of_mixing_versions(self):
+        reader = self.open()
+        reader.read(KB)
+        self.s3.put_object(Bucket=BUCKET, Key="doc.pdf", Body=b"new" * KB)
+        reader.seek(50 * KB)
+        with self.assertRaises(ClientError):
+            reader.read(KB)
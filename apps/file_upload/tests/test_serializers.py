@@ -0,0 +1,95 @@
+"""Tests for file upload serializers."""
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+
+from apps.file_upload.domain.models.dto import CompletionPayload, UploadPlan
+from apps.file_upload.domain.models.types import ProviderEnum, UploadType
+from apps.file_upload.serializers import (
+    CompletionPayloadSerializer,
+    UploadPlanResponseSerializer,
+    plan_response_data,
+    validate_completion_payload,
+)
+
+
+class PlanResponseTestCase(SimpleTestCase):
+    """plan_response_data must stay in sync with UploadPlanResponseSerializer."""
+
+    def _assert_matches_serializer(self, plan):
+        expected = UploadPlanResponseSerializer(
+            {f: getattr(plan, f) for f in UploadPlanResponseSerializer().fields}
+        ).data
+        self.assertEqual(plan_response_data(plan), dict(expected))
+
+    def test_multipart_plan(self):
+        self._assert_matches_serializer(
+            UploadPlan(
+                upload_type=UploadType.MULTI_PART,
+                upload_id="u1",
+                bucket="b",
+                key="k",
+                part_size=10,
+                total_parts=3,
+                part_urls=("p1", "p2", "p3"),
+                complete_url_payload={"session_id": "u1", "parts": []},
+            )
+        )
+
+    def test_single_part_plan(self):
+        self._assert_matches_serializer(
+            UploadPlan(
+                upload_type=UploadType.SINGLE_PART,
+                upload_id="u1",
+                bucket="b",
+                key="k",
+                put_url="https://put",
+            )
+        )
+
+
+class CompletionPayloadTestCase(SimpleTestCase):
+    """validate_completion_payload: fast path for CompletionPayloadSerializer."""
+
+    def _body(self, parts):
+        return {
+            "provider": "aws",
+            "bucket": "b",
+            "key": "k",
+            "session_id": "s",
+            "mpu_upload_id": "mpu",
+            "parts": parts,
+        }
+
+    def test_builds_completion_payload(self):
+        parts = [
+            {"PartNumber": 1, "ETag": '"' + "a" * 32 + '"'},
+            {"PartNumber": 2, "ETag": "B" * 32},
+        ]
+        payload = validate_completion_payload(self._body(parts))
+        self.assertIsInstance(payload, CompletionPayload)
+        self.assertEqual(payload.provider, ProviderEnum.AWS)
+        self.assertEqual(list(payload.parts), parts)
+
+    def test_matches_serializer_on_valid_input(self):
+        body = self._body([{"PartNumber": i, "ETag": "c" * 32} for i in (1, 2, 5)])
+        ser = CompletionPayloadSerializer(data=body)
+        ser.is_valid(raise_exception=True)
+        expected = CompletionPayload(**ser.validated_data)
+        payload = validate_completion_payload(body)
+        self.assertEqual(payload.provider, expected.provider)
+        self.assertEqual(list(payload.parts), [dict(p) for p in expected.parts])
+
+    def test_rejects_duplicate_and_unordered_parts(self):
+        for numbers in ((1, 1), (2, 1)):
+            with self.assertRaises(ValidationError) as ctx:
+                validate_completion_payload(
+                    self._body([{"PartNumber": n, "ETag": "a" * 32} for n in numbers])
+                )
+            self.assertIn("parts", ctx.exception.detail)
+
+    def test_rejects_malformed_etag(self):
+        with self.assertRaises(ValidationError) as ctx:
+            validate_completion_payload(
+                self._body([{"PartNumber": 1, "ETag": "not-an-etag"}])
+            )
+        self.assertIn("parts.0.ETag", ctx.exception.detail)
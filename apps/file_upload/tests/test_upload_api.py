@@ -0,0 +1,132 @@
+"""Upload API against moto: end-to-end flow and AWS round trips per request."""
+import re
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from moto import mock_aws
+
+from apps.core.infrastructure.aws.clients import get_dynamodb_resource, get_s3_client
+from apps.core.infrastructure.aws.warmup import reset_clients
+from apps.core.models import User
+from apps.file_upload.infrastructure.repositories.dynamo_session_repository import (
+    create_session_table,
+)
+from apps.file_upload.viewsets.upload_viewset import UploadViewSet
+
+BUCKET = "test-uploads"
+MB = 1024 * 1024
+
+# AWS calls per request; lower these when a change saves a round trip
+# (benchmarks/bench_upload_api.py tracks the same numbers with latencies)
+AWS_CALL_BUDGET = {
+    "plan single": 3,  # PutItem, Query + UpdateItem (status)
+    "plan multipart": 6,  # + CreateMultipartUpload, Query + UpdateItem (mpu id)
+    "complete single": 6,
+    "complete multipart": 7,
+    "presign": 0,
+}
+
+
+def _plan_body(size_bytes):
+    return {
+        "provider": "aws",
+        "user_sub": "ignored",
+        "prefix": "tests/",
+        "file_meta": {
+            "filename": "a.bin",
+            "content_type": "application/octet-stream",
+            "size_bytes": size_bytes,
+        },
+    }
+
+
+@override_settings(REQUEST_BREAKDOWN_HEADER=True)
+class UploadApiTestCase(SimpleTestCase):
+    """Real views, service and repositories; moto stands in for S3/DynamoDB."""
+
+    def setUp(self):
+        patches = [
+            mock_aws(),
+            mock.patch("moto.s3.models.S3_UPLOAD_PART_MIN_SIZE", 1),
+            mock.patch("config.settings.AWS_STORAGE_BUCKET_NAME", BUCKET),
+            mock.patch(
+                "apps.core.infrastructure.aws.cognito.verify_access_token",
+                return_value={"sub": "9f0c6f5e-55d4-4a52-9a3c-3b8f4d1c2e7a"},
+            ),
+            mock.patch(
+                "apps.core.authentication._user_for_sub",
+                return_value=User(pk=1, username="tester"),
+            ),
+            mock.patch.object(UploadViewSet, "throttle_classes", []),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        reset_clients()
+        self.addCleanup(reset_clients)
+        get_s3_client().create_bucket(Bucket=BUCKET)
+        create_session_table(get_dynamodb_resource().meta.client)
+
+    def _post(self, action, body):
+        resp = self.client.post(
+            f"/api/v1/file-upload/{action}",
+            body,
+            content_type="application/json",
+            HTTP_AUTHORIZATION="Bearer t",
+        )
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return resp
+
+    def _aws_calls(self, resp):
+        match = re.search(r'\baws;dur=[\d.]+;desc="(\d+) calls"', resp["Server-Timing"])
+        return int(match.group(1))
+
+    def test_single_part_flow(self):
+        resp = self._post("upload/plan", _plan_body(MB))
+        plan = resp.json()
+        self.assertEqual(plan["upload_type"], "single_part")
+        self.assertLessEqual(self._aws_calls(resp), AWS_CALL_BUDGET["plan single"])
+
+        resp = self._post(
+            "upload/complete",
+            {
+                "provider": "aws",
+                "bucket": plan["bucket"],
+                "key": plan["key"],
+                "session_id": plan["upload_id"],
+            },
+        )
+        self.assertLessEqual(self._aws_calls(resp), AWS_CALL_BUDGET["complete single"])
+
+    def test_multipart_flow(self):
+        resp = self._post("upload/plan", _plan_body(200 * MB))
+        plan = resp.json()
+        self.assertEqual(plan["total_parts"], len(plan["part_urls"]))
+        self.assertLessEqual(self._aws_calls(resp), AWS_CALL_BUDGET["plan multipart"])
+
+        payload = plan["complete_url_payload"]
+        s3 = get_s3_client()
+        parts = [
+            {
+                "PartNumber": i,
+                "ETag": s3.upload_part(
+                    Bucket=BUCKET,
+                    Key=plan["key"],
+                    UploadId=payload["mpu_upload_id"],
+                    PartNumber=i,
+                    Body=b"x",
+                )["ETag"],
+            }
+            for i in range(1, plan["total_parts"] + 1)
+        ]
+        resp = self._post("upload/complete", {**payload, "provider": "aws", "parts": parts})
+        self.assertLessEqual(
+            self._aws_calls(resp), AWS_CALL_BUDGET["complete multipart"]
+        )
+        head = s3.head_object(Bucket=BUCKET, Key=plan["key"])
+        self.assertEqual(head["ContentLength"], plan["total_parts"])
+
+    def test_presign_is_local(self):
+        resp = self._post("download/presign", {"provider": "aws", "key": "tests/a.bin"})
+        self.assertIn(BUCKET, resp.json()["url"])
+        self.assertEqual(self._aws_calls(resp), AWS_CALL_BUDGET["presign"])
@@ -1,9 +1,12 @@
 from django.urls import path
 from apps.file_upload.viewsets.upload_viewset import UploadViewSet
+from apps.file_upload.viewsets.local_storage import local_object
 
 v = UploadViewSet.as_view
 urlpatterns = [
     path("upload/plan", v({"post": "plan"}), name="upload-plan"),
     path("upload/complete", v({"post": "complete"}), name="upload-complete"),
     path("download/presign", v({"post": "presign_download"}), name="download-presign"),
+    # signed object URLs of the "local" storage provider (settings.FILE_STORAGE)
+    path("local/<str:bucket>/<path:key>", local_object, name="local-object"),
 ]
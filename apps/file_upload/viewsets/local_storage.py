@@ -0,0 +1,58 @@
+# apps/file_upload/viewsets/local_storage.py
+"""
+Object endpoint for the "local" storage provider: the URLs that sign_url hands
+out in upload plans and download presigns land here instead of on S3.
+
+The signature is the only credential (as with an S3 presigned URL), so the
+view is plain Django: no authentication classes, no CSRF. Uploads stream from
+the request into the storage in 1 MiB chunks; downloads are a FileResponse,
+which WSGI servers send with wsgi.file_wrapper (sendfile, zero-copy).
+"""
+from __future__ import annotations
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseNotAllowed,
+    HttpResponseNotFound,
+)
+from django.views.decorators.csrf import csrf_exempt
+
+from apps.file_upload.infrastructure.local.storage import (
+    InvalidKey,
+    get_local_storage,
+    verify_url,
+)
+
+OPS = {"GET": ("get",), "HEAD": ("get",), "PUT": ("put", "part")}
+
+
+@csrf_exempt
+def local_object(request, bucket: str, key: str):
+    if request.method not in OPS:
+        return HttpResponseNotAllowed(list(OPS))
+    params = request.GET.dict()
+    if params.get("op") not in OPS[request.method] or not verify_url(bucket, key, params):
+        return HttpResponseForbidden("invalid or expired signature")
+
+    storage = get_local_storage()
+    try:
+        if request.method == "PUT":
+            if params["op"] == "part":
+                etag = storage.put_part(params["upload"], int(params["part"]), request)
+            else:
+                etag = storage.put_object(bucket, key, request)
+            response = HttpResponse(status=200)
+            response["ETag"] = f'"{etag}"'
+            return response
+        if not storage.exists(bucket, key):
+            return HttpResponseNotFound()
+        if request.method == "HEAD":
+            response = HttpResponse()
+            response["Content-Length"] = storage.object_path(bucket, key).stat().st_size
+            return response
+        return FileResponse(storage.open(bucket, key), filename=key.rsplit("/", 1)[-1])
+    except InvalidKey:
+        return HttpResponseForbidden("invalid key")
+    except KeyError:
+        return HttpResponseNotFound("no such upload")
@@ -4,25 +4,52 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework import status
+from rest_framework.settings import api_settings
+from drf_yasg.utils import swagger_auto_schema
 from apps.file_upload.serializers import (
     UploadPlanRequestSerializer,
     UploadPlanResponseSerializer,
     CompletionPayloadSerializer,
     DownloadRequestSerializer,
+    plan_response_data,
+    validate_completion_payload,
 )
 from apps.file_upload.domain.models.dto import (
     UploadCtx,
     FileMeta,
-    CompletionPayload,
     DownloadCtx,
 )
 from apps.file_upload.application.services.file_service import get_file_service
+from apps.core.authentication import CognitoJWTAuthentication
+from apps.core.throttling import IPTokenBucketThrottle, UserTokenBucketThrottle
+from apps.core.viewsets.mixins import ProfiledViewMixin
 
 
-class UploadViewSet(ViewSet):
-    def __init__(self):
+class UploadViewSet(ProfiledViewMixin, ViewSet):
+    # served through the lean middleware chain (settings.LEAN_API_PREFIXES):
+    # no session, so bearer tokens only
+    authentication_classes = [CognitoJWTAuthentication]
+    # plan/presign hit S3 + DynamoDB on every call; token buckets keep one
+    # retry-looping client from draining the shared botocore pool
+    throttle_classes = [
+        *api_settings.DEFAULT_THROTTLE_CLASSES,
+        UserTokenBucketThrottle,
+        IPTokenBucketThrottle,
+    ]
+    throttle_scopes = {"plan": "upload_plan", "presign_download": "download_presign"}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.file_service = get_file_service()
 
+    @property
+    def throttle_scope(self):
+        return self.throttle_scopes.get(getattr(self, "action", None))
+
+    @swagger_auto_schema(
+        request_body=UploadPlanRequestSerializer,
+        responses={200: UploadPlanResponseSerializer},
+    )
     def plan(self, request: Request):
         ser = UploadPlanRequestSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
@@ -38,29 +65,17 @@ class UploadViewSet(ViewSet):
             file_meta=FileMeta(**d["file_meta"]),
         )
         plan = self.file_service.plan_upload(ctx)
+        # hot path: plain dict straight to the renderer (up to 10k part URLs)
+        return Response(plan_response_data(plan), status=status.HTTP_200_OK)
 
-        out = UploadPlanResponseSerializer(
-            {
-                "upload_type": plan.upload_type,  # Enum—Serializer handles to_representation
-                "upload_id": plan.upload_id,
-                "bucket": plan.bucket,
-                "key": plan.key,
-                "part_size": plan.part_size,
-                "total_parts": plan.total_parts,
-                "put_url": plan.put_url,
-                "part_urls": plan.part_urls,
-                "complete_url_payload": plan.complete_url_payload,
-            }
-        ).data
-        return Response(out, status=status.HTTP_200_OK)
-
+    @swagger_auto_schema(request_body=CompletionPayloadSerializer)
     def complete(self, request):
-        ser = CompletionPayloadSerializer(data=request.data)
-        ser.is_valid(raise_exception=True)
-        payload = CompletionPayload(**ser.validated_data)
+        # hot path: one pydantic-core pass instead of a serializer per part
+        payload = validate_completion_payload(request.data)
         self.file_service.complete_upload(payload)
         return Response({"status": "ok"}, status=status.HTTP_200_OK)
 
+    @swagger_auto_schema(request_body=DownloadRequestSerializer)
     def presign_download(self, request):
         ser = DownloadRequestSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
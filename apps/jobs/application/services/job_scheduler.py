@@ -0,0 +1,98 @@
+"""
+Fair-share dispatch of page-range waves (domain/logic/fair_share.py).
+
+JobService queues a job's ranges here instead of sending them to the broker;
+`schedule` admits waves as chords on the lane's queue, and each wave's chord
+body (merge_page_ranges) calls `wave_finished`, which frees its slots, queues
+the job's next wave and schedules again. Beat runs `schedule` periodically as
+a safety net for lost wakeups.
+"""
+from celery import chord
+from django.conf import settings
+
+from apps.jobs.domain.logic import fair_share
+from apps.jobs.infrastructure.repositories.scheduler_state import get_scheduler_state
+from apps.jobs.interfaces.tasks.job_tasks import (
+    analyze_page_range,
+    merge_page_ranges,
+    release_wave,
+)
+from config.celery import QUEUE_JOBS, QUEUE_JOBS_PRIORITY
+
+DEFAULT_TENANT = "default"
+
+
+def submit(job_id, bucket, key, tenant, ranges):
+    """Queue ranges of a job's document for tenant and schedule; returns the lane."""
+    lane = fair_share.lane_for(len(ranges), settings.JOBS_PRIORITY_MAX_RANGES)
+    job = {"job_id": job_id, "bucket": bucket, "key": key}
+    fair_share.submit(get_scheduler_state(), lane, tenant or DEFAULT_TENANT, job, ranges)
+    schedule()
+    return lane
+
+
+def wave_finished(wave):
+    """`wave` as built by _dispatch_wave, handed back by the chord body."""
+    fair_share.finish_wave(
+        get_scheduler_state(),
+        wave["lane"],
+        wave["tenant"],
+        wave["job"],
+        wave["admitted"],
+        wave["rest"],
+    )
+    schedule()
+
+
+def schedule():
+    """
+    Admit what fits; returns the number of waves sent. One process drains at
+    a time: a caller that finds the lock taken leaves a dirty mark for the
+    holder to pick up, and the holder re-checks the mark after unlocking.
+    """
+    state = get_scheduler_state()
+    limits = {
+        fair_share.PRIORITY: fair_share.LaneLimits(
+            settings.JOBS_SCHED_PRIORITY_CAPACITY, settings.JOBS_SCHED_TENANT_CAPACITY
+        ),
+        fair_share.BULK: fair_share.LaneLimits(
+            settings.JOBS_SCHED_BULK_CAPACITY, settings.JOBS_SCHED_TENANT_CAPACITY
+        ),
+    }
+    admitted = 0
+    state.mark_dirty()
+    while True:
+        with state.lock() as held:
+            if not held:
+                return admitted
+            while state.take_dirty():
+                admitted += fair_share.drain(
+                    state, _dispatch_wave, limits, settings.JOBS_SCHED_WAVE_RANGES
+                )
+        if not state.is_dirty():
+            return admitted
+
+
+def _dispatch_wave(lane, tenant, job, wave, rest):
+    queue = QUEUE_JOBS_PRIORITY if lane == fair_share.PRIORITY else QUEUE_JOBS
+    job_id = job["job_id"]
+    header = [
+        analyze_page_range.s(job_id, job["bucket"], job["key"], first, last).set(
+            queue=queue
+        )
+        for first, last in wave
+    ]
+    done = {
+        "lane": lane,
+        "tenant": tenant,
+        "job": job,
+        "admitted": len(wave),
+        "ranges": wave,
+        "rest": rest,
+    }
+    body = merge_page_ranges.s(job_id, wave=done).set(queue=queue)
+    # a header task killed outright (hard time limit, lost worker) skips the
+    # body; the errback records the wave failed, frees the slots and queues
+    # the next wave
+    body.link_error(release_wave.si(done))
+    chord(header)(body)
@@ -1,24 +1,139 @@
 """Services for job operations."""
+import uuid
+
+from django.conf import settings
+
+from apps.jobs.application.services import job_scheduler
+
+from apps.jobs.domain.logic.page_ranges import split_pages
+from apps.jobs.infrastructure.aws.result_store import (
+    is_pointer,
+    iter_records,
+    summary_of,
+)
+from apps.jobs.infrastructure.job_events import publish_job_event
+from apps.jobs.infrastructure.job_progress import flush_progress
+from apps.jobs.infrastructure.repositories.django_job_repository import (
+    get_job_repository,
+)
 
 
 class JobService:
-    """Service for handling job operations."""
-    
+    """
+    Service for handling job operations.
+
+    A job analyzes the pages of one document in chords: one
+    analyze_page_range task per page range (fan-out), then merge_page_ranges
+    folds their results into Job.result (fan-in). Ranges reach the broker in
+    waves admitted fair-share across tenants (job_scheduler.py).
+
+    Readers pass `tenant` (the requesting user's pk) to see only that tenant's
+    jobs: another tenant's job is a KeyError, like an unknown one. Tasks pass
+    none.
+    """
+
+    @staticmethod
+    def get_document(file_id, tenant):
+        """Bucket and key of tenant's uploaded file; KeyError if not theirs."""
+        return get_job_repository().get_document(str(file_id), tenant)
+
     @staticmethod
     def create_job(job_data):
-        """Create a new job."""
-        # TODO: Implement job creation
-        pass
-    
+        """
+        Create a job for job_data = {"bucket", "key", "page_count",
+        optional "chunk_size", "tenant"} and queue its ranges; returns the job id.
+        """
+        page_count = int(job_data["page_count"])
+        chunk_size = int(job_data.get("chunk_size") or settings.JOBS_PAGE_CHUNK_SIZE)
+        ranges = split_pages(page_count, chunk_size)
+        job_id = uuid.uuid4().hex
+        repo = get_job_repository()
+        repo.create_job(
+            job_id,
+            bucket=job_data["bucket"],
+            key=job_data["key"],
+            page_count=page_count,
+            chunk_size=chunk_size,
+            ranges_total=len(ranges),
+            tenant=job_data.get("tenant", ""),
+        )
+        repo.start_ranges(job_id)
+        JobService.publish_status(job_id)
+        job_scheduler.submit(
+            job_id, job_data["bucket"], job_data["key"], job_data.get("tenant"), ranges
+        )
+        return job_id
+
     @staticmethod
-    def get_job_status(job_id):
-        """Get job status from microservice."""
-        # TODO: Implement job status check
-        pass
-    
+    def retry_failed_ranges(job_id, tenant=None):
+        """Re-run only the ranges a finished job failed; returns how many."""
+        repo = get_job_repository()
+        job = repo.get_job(job_id, tenant)
+        summary = summary_of(repo.get_result(job_id))
+        failed = [tuple(r) for r in summary.get("failed_ranges", [])]
+        if job["status"] != "partial" or not failed:
+            return 0
+        repo.start_ranges(job_id, retried=len(failed))
+        JobService.publish_status(job_id)
+        job_scheduler.submit(job_id, job["bucket"], job["key"], job["tenant"], failed)
+        return len(failed)
+
+    @staticmethod
+    def get_job_status(job_id, tenant=None):
+        """Status and progress of a job."""
+        job = get_job_repository().get_job(job_id, tenant)
+        finished = job["ranges_done"] + job["ranges_failed"]
+        progress = finished / job["ranges_total"] if job["ranges_total"] else 0.0
+        if job["page_count"]:  # pages move it between range completions
+            progress = max(progress, min(1.0, job["pages_done"] / job["page_count"]))
+        return {
+            "job_id": job_id,
+            "status": job["status"],
+            "ranges_total": job["ranges_total"],
+            "ranges_done": job["ranges_done"],
+            "ranges_failed": job["ranges_failed"],
+            "pages_done": job["pages_done"],
+            "progress": progress,
+            "error_message": job["error_message"],
+        }
+
+    @staticmethod
+    def list_jobs(offset=0, limit=50, tenant=None):
+        """Newest jobs first; status and progress only, never the result."""
+        return get_job_repository().list_jobs(offset, limit, tenant)
+
+    @staticmethod
+    def get_result_page(job_id, offset=0, limit=100, tenant=None):
+        """
+        Page records offset..offset+limit plus the result summary. Offloaded
+        results are read with one ranged GET of the blocks holding the page.
+        """
+        repo = get_job_repository()
+        repo.get_job(job_id, tenant)  # KeyError for unknown jobs
+        result = repo.get_result(job_id, tenant)
+        if is_pointer(result):
+            count = result["records"]
+            records = list(iter_records(result, offset, limit))
+        else:
+            pages = (result or {}).get("pages", [])
+            count, records = len(pages), pages[offset : offset + limit]
+        return {
+            "job_id": job_id,
+            "count": count,
+            "offset": offset,
+            "limit": limit,
+            "results": records,
+            "summary": summary_of(result),
+        }
+
+    @staticmethod
+    def publish_status(job_id):
+        """Push the current status to stream listeners (Redis pub/sub)."""
+        publish_job_event(job_id, JobService.get_job_status(job_id))
+
     @staticmethod
     def update_job_status(job_id, status, result=None):
         """Update job status."""
-        # TODO: Implement job status update
-        pass
-
+        flush_progress(job_id)  # a final status never overtakes its counters
+        get_job_repository().finish(job_id, status, result)
+        JobService.publish_status(job_id)
@@ -0,0 +1,101 @@
+"""
+Fair-share admission of page ranges across tenants.
+
+Jobs don't reach the broker whole. Their ranges wait in a per-tenant queue of
+a lane and are admitted in waves (one chord of up to `wave` ranges). `drain`
+walks a lane's tenants round-robin, one wave per tenant per pass, and stops a
+tenant at `tenant_capacity` ranges in flight and the lane at `capacity`. A
+tenant with 10,000 pages therefore holds a bounded slice of the broker queue,
+and everyone else's next wave lands right behind its current one instead of
+behind all of its pages.
+
+A job has at most one wave in flight: the rest of its ranges ride along with
+the wave and go back to the end of the tenant's queue when it finishes
+(`finish_wave`), so a tenant's own jobs alternate too and one merge per job
+runs at a time. Small jobs (`lane_for`) use the priority lane, which has its
+own capacity and Celery queue and is drained first.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+
+from apps.jobs.domain.ports.scheduler_state import SchedulerState
+
+PRIORITY = "priority"
+BULK = "bulk"
+LANES = (PRIORITY, BULK)
+
+# SchedulerState.acquire results when nothing was granted
+TENANT_FULL = 0
+LANE_FULL = -1
+
+# dispatch(lane, tenant, job, wave, rest); job is the entry without its ranges
+Dispatch = Callable[[str, str, dict, List[list], List[list]], None]
+
+
+@dataclass(frozen=True)
+class LaneLimits:
+    capacity: int  # ranges in flight in the lane, all tenants together
+    tenant_capacity: int  # ranges in flight per tenant
+
+
+def lane_for(range_count: int, priority_max_ranges: int) -> str:
+    return PRIORITY if range_count <= priority_max_ranges else BULK
+
+
+def submit(
+    state: SchedulerState, lane: str, tenant: str, job: dict, ranges: Sequence
+) -> None:
+    """Queue ranges of job ({"job_id", ...}, carried along to dispatch)."""
+    state.push(lane, tenant, {**job, "ranges": [list(r) for r in ranges]})
+
+
+def drain(
+    state: SchedulerState, dispatch: Dispatch, limits: Dict[str, LaneLimits], wave: int
+) -> int:
+    """Admit waves until every lane is full or empty; returns how many."""
+    admitted = 0
+    for lane in LANES:
+        limit = limits[lane]
+        progressed = True
+        while progressed:
+            progressed = False
+            for tenant in state.tenants(lane):
+                entry = state.pop(lane, tenant)
+                if entry is None:
+                    state.retire(lane, tenant)
+                    continue
+                ranges = entry["ranges"]
+                granted = state.acquire(
+                    lane,
+                    tenant,
+                    min(wave, len(ranges)),
+                    limit.tenant_capacity,
+                    limit.capacity,
+                )
+                if granted <= 0:
+                    state.push(lane, tenant, entry, front=True)
+                    if granted == LANE_FULL:
+                        progressed = False
+                        break
+                    continue
+                state.rotate(lane, tenant)
+                job = {k: v for k, v in entry.items() if k != "ranges"}
+                dispatch(lane, tenant, job, ranges[:granted], ranges[granted:])
+                admitted += 1
+                progressed = True
+    return admitted
+
+
+def finish_wave(
+    state: SchedulerState,
+    lane: str,
+    tenant: str,
+    job: dict,
+    admitted: int,
+    rest: Sequence,
+) -> None:
+    """A wave's chord ended: free its slots and queue the job's next wave."""
+    state.release(lane, tenant, admitted)
+    if rest:
+        submit(state, lane, tenant, job, rest)
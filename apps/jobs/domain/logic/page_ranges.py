@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import Iterable, List, Optional, Tuple
+
+PageRange = Tuple[int, int]  # 1-based, inclusive
+
+
+def split_pages(page_count: int, chunk_size: int) -> List[PageRange]:
+    """[(1, 25), (26, 50), ...] covering page_count pages."""
+    if page_count < 1 or chunk_size < 1:
+        raise ValueError("page_count and chunk_size must be positive")
+    return [
+        (first, min(first + chunk_size - 1, page_count))
+        for first in range(1, page_count + 1, chunk_size)
+    ]
+
+
+def page_stubs(bucket: str, key: str, first: int, last: int) -> List[dict]:
+    """Default settings.JOBS_PAGE_ANALYZER: one empty record per page."""
+    return [{"page": n} for n in range(first, last + 1)]
+
+
+def merge_range_results(previous: Optional[dict], results: Iterable[dict]) -> dict:
+    """
+    Fold per-range task results into a job result:
+
+        {"pages": [{"page": 1, ...}, ...], "failed_ranges": [[26, 50], ...]}
+
+    A range result is {"first", "last", "pages"} or {"first", "last", "error"}.
+    `previous` is the job's result before a retry of its failed ranges; the
+    re-run ranges replace whatever it held for them.
+    """
+    results = list(results)
+    rerun = {(r["first"], r["last"]) for r in results}
+    pages = [
+        p
+        for p in (previous or {}).get("pages", [])
+        if not any(first <= p["page"] <= last for first, last in rerun)
+    ]
+    failed = [
+        list(r) for r in (previous or {}).get("failed_ranges", []) if tuple(r) not in rerun
+    ]
+    errors = dict((previous or {}).get("errors", {}))
+    for r in results:
+        name = f"{r['first']}-{r['last']}"
+        errors.pop(name, None)
+        if "error" in r:
+            failed.append([r["first"], r["last"]])
+            errors[name] = r["error"]
+        else:
+            pages.extend(r["pages"])
+    pages.sort(key=lambda p: p["page"])
+    failed.sort()
+    return {"pages": pages, "failed_ranges": failed, "errors": errors}
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Protocol
+
+
+class JobRepository(Protocol):
+    def create_job(
+        self,
+        job_id: str,
+        *,
+        bucket: str,
+        key: str,
+        page_count: int,
+        chunk_size: int,
+        ranges_total: int,
+        tenant: str = "",
+    ) -> None: ...
+    def get_job(self, job_id: str, tenant: Optional[str] = None) -> dict:
+        """
+        Status, progress counters and document of job_id; KeyError if unknown,
+        or if tenant is given and the job belongs to another tenant.
+        """
+        ...
+
+    def list_jobs(
+        self, offset: int, limit: int, tenant: Optional[str] = None
+    ) -> List[dict]:
+        """Newest first (of tenant's jobs, if given), same fields as get_job."""
+        ...
+
+    def get_result(self, job_id: str, tenant: Optional[str] = None) -> Optional[dict]: ...
+    def get_document(self, file_id: str, tenant: str) -> dict:
+        """{"bucket", "key"} of an uploaded file of tenant's; KeyError otherwise."""
+        ...
+
+    def start_ranges(self, job_id: str, retried: int = 0) -> None:
+        """Ranges dispatched: status running; `retried` failed ranges run again."""
+        ...
+
+    def add_progress(self, deltas: Dict[str, Dict[str, int]]) -> None:
+        """
+        Add {job_id: {counter: n}} to the counters (pages_done, ranges_done,
+        ranges_failed) of all those jobs at once. n < 0 takes back pages of a
+        failed attempt.
+        """
+        ...
+
+    def set_progress(
+        self, job_id: str, *, pages_done: int, ranges_done: int, ranges_failed: int
+    ) -> None:
+        """Overwrite the counters (recounted after a wave's results were lost)."""
+        ...
+
+    def finish(
+        self, job_id: str, status: str, result: Optional[dict], error: str = ""
+    ) -> None: ...
@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import ContextManager, List, Optional, Protocol
+
+
+class SchedulerState(Protocol):
+    """
+    Queues and in-flight counters of the fair-share scheduler
+    (domain/logic/fair_share.py). Entries are {"job_id", ..., "ranges"} dicts.
+    """
+
+    def push(self, lane: str, tenant: str, entry: dict, front: bool = False) -> None:
+        """Queue entry for tenant; the tenant joins the lane's rotation."""
+        ...
+
+    def pop(self, lane: str, tenant: str) -> Optional[dict]: ...
+    def tenants(self, lane: str) -> List[str]:
+        """Tenants with queued entries, in round-robin order."""
+        ...
+
+    def rotate(self, lane: str, tenant: str) -> None:
+        """Move tenant to the back of the rotation."""
+        ...
+
+    def retire(self, lane: str, tenant: str) -> None:
+        """Drop tenant from the rotation if its queue is empty."""
+        ...
+
+    def acquire(
+        self, lane: str, tenant: str, count: int, tenant_capacity: int, capacity: int
+    ) -> int:
+        """
+        Atomically take up to `count` in-flight slots; returns how many, or
+        TENANT_FULL / LANE_FULL (fair_share.py) when none are free.
+        """
+        ...
+
+    def release(self, lane: str, tenant: str, count: int) -> None: ...
+    def in_flight(self, lane: str, tenant: Optional[str] = None) -> int: ...
+    def lock(self) -> ContextManager[bool]:
+        """Non-blocking drain lock; yields whether it was acquired."""
+        ...
+
+    def mark_dirty(self) -> None:
+        """Ask the lock holder (or the next drainer) for another pass."""
+        ...
+
+    def take_dirty(self) -> bool: ...
+    def is_dirty(self) -> bool: ...
@@ -0,0 +1,241 @@
+# apps/jobs/infrastructure/aws/result_store.py
+"""
+Large job results live in S3, not in the jobs table.
+
+A result whose JSON is above JOBS_RESULT_INLINE_MAX_BYTES is written as
+gzip-compressed NDJSON (one page record per line) and Job.result keeps only a
+pointer plus summary:
+
+    {"storage": "s3", "bucket", "records", "bytes", "raw_bytes",
+     "parts": [{"key", "first_page", "last_page", "records", "bytes",
+                "index": [[byte_offset, first_record], ...]}, ...],
+     "summary": {...}}
+
+Each part is an object of its own, a series of gzip members of
+JOBS_RESULT_RECORDS_PER_BLOCK records each (still one valid .gz file).
+`index` maps members to records, so a page of records is one ranged GET per
+part it touches, inflated member by member; nothing ever holds the whole
+result in memory.
+
+Jobs merge one wave of ranges at a time (`add_ranges`). Once offloaded, a
+wave only writes new parts for its own pages; the stored parts are never read
+back. Parts are kept in page order and never span a failed range or another
+part, so a later re-run of a failed range slots in between them.
+"""
+from __future__ import annotations
+import bisect
+import gzip
+import tempfile
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import orjson
+from django.conf import settings
+
+from apps.core.infrastructure.aws.clients import get_s3_client
+from apps.jobs.domain.logic.page_ranges import merge_range_results
+
+READ_CHUNK = 256 * 1024
+
+
+def is_pointer(result: Optional[dict]) -> bool:
+    return bool(result) and result.get("storage") == "s3"
+
+
+def summary_of(result: Optional[dict]) -> dict:
+    """Everything but the page records, without touching S3."""
+    if is_pointer(result):
+        return result["summary"]
+    return {k: v for k, v in (result or {}).items() if k != "pages"}
+
+
+def _bucket() -> str:
+    return settings.JOBS_RESULT_BUCKET or settings.AWS_STORAGE_BUCKET_NAME
+
+
+def store_result(job_id: str, result: Dict[str, Any], s3=None) -> Dict[str, Any]:
+    """`result` as is when small, else written to S3 and replaced by a pointer."""
+    if len(orjson.dumps(result)) <= settings.JOBS_RESULT_INLINE_MAX_BYTES:
+        return result
+    summary = {k: v for k, v in result.items() if k != "pages"}
+    parts = _write_parts(
+        job_id, result.get("pages", []), summary.get("failed_ranges", []), s3
+    )
+    return _pointer(_bucket(), parts, summary)
+
+
+def add_ranges(
+    job_id: str, previous: Optional[dict], results: Iterable[dict], s3=None
+) -> Dict[str, Any]:
+    """
+    `merge_range_results(previous, results)`, stored. An offloaded `previous`
+    gets new parts for the pages of `results` only; parts of ranges that ran
+    again (a redelivered wave) are replaced.
+    """
+    results = list(results)
+    if is_pointer(previous) and "parts" not in previous:
+        previous = load_result(previous, s3)  # single-object pointer, pre-parts
+    if not is_pointer(previous):
+        return store_result(job_id, merge_range_results(previous, results), s3)
+
+    reran = _runs([r["first"], r["last"]] for r in results)
+    parts = [p for p in previous["parts"] if not _within(p, reran)]
+    merged = merge_range_results(previous["summary"], results)
+    pages = merged.pop("pages")
+    gaps = merged["failed_ranges"] + [[p["first_page"], p["last_page"]] for p in parts]
+    parts += _write_parts(job_id, pages, gaps, s3)
+    return _pointer(previous["bucket"], parts, merged)
+
+
+def _runs(ranges: Iterable[Sequence[int]]) -> List[List[int]]:
+    """Adjacent page ranges joined: [[1, 25], [26, 50]] -> [[1, 50]]."""
+    runs: List[List[int]] = []
+    for first, last in sorted(ranges):
+        if runs and first <= runs[-1][1] + 1:
+            runs[-1][1] = max(runs[-1][1], last)
+        else:
+            runs.append([first, last])
+    return runs
+
+
+def _within(part: dict, runs: List[List[int]]) -> bool:
+    return any(f <= part["first_page"] and part["last_page"] <= l for f, l in runs)
+
+
+def _split(pages: List[dict], gaps: Iterable[Sequence[int]]) -> Iterator[List[dict]]:
+    """Sorted pages cut wherever one of the gaps (page ranges) falls between two."""
+    starts = sorted(first for first, _ in gaps)
+    segment: List[dict] = []
+    for page in pages:
+        if segment and bisect.bisect_left(starts, page["page"]) > bisect.bisect_right(
+            starts, segment[-1]["page"]
+        ):
+            yield segment
+            segment = []
+        segment.append(page)
+    if segment:
+        yield segment
+
+
+def _write_parts(
+    job_id: str, pages: List[dict], gaps: Iterable[Sequence[int]], s3=None
+) -> List[dict]:
+    s3 = s3 or get_s3_client()
+    return [_write_part(job_id, segment, s3) for segment in _split(pages, gaps)]
+
+
+def _write_part(job_id: str, pages: List[dict], s3) -> dict:
+    per_block = settings.JOBS_RESULT_RECORDS_PER_BLOCK
+    first_page, last_page = pages[0]["page"], pages[-1]["page"]
+    key = f"{settings.JOBS_RESULT_PREFIX}{job_id}/{first_page}-{last_page}.ndjson.gz"
+    index, raw_bytes = [], 0
+    with tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024) as buf:
+        for first in range(0, len(pages), per_block):
+            block = b"".join(
+                orjson.dumps(record) + b"\n" for record in pages[first : first + per_block]
+            )
+            index.append([buf.tell(), first])
+            raw_bytes += len(block)
+            buf.write(gzip.compress(block, compresslevel=6, mtime=0))
+        size = buf.tell()
+        buf.seek(0)
+        s3.upload_fileobj(
+            buf, _bucket(), key, ExtraArgs={"ContentType": "application/x-ndjson"}
+        )
+    return {
+        "key": key,
+        "first_page": first_page,
+        "last_page": last_page,
+        "records": len(pages),
+        "bytes": size,
+        "raw_bytes": raw_bytes,
+        "index": index,
+    }
+
+
+def _pointer(bucket: str, parts: List[dict], summary: dict) -> Dict[str, Any]:
+    parts = sorted(parts, key=lambda p: p["first_page"])
+    return {
+        "storage": "s3",
+        "bucket": bucket,
+        "records": sum(p["records"] for p in parts),
+        "bytes": sum(p["bytes"] for p in parts),
+        "raw_bytes": sum(p["raw_bytes"] for p in parts),
+        "parts": parts,
+        "summary": summary,
+    }
+
+
+def _records(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """Records of a byte stream of whole gzip members (NDJSON inside)."""
+    inflate = zlib.decompressobj(wbits=31)
+    pending = b""
+    for chunk in chunks:
+        while chunk:
+            pending += inflate.decompress(chunk)
+            chunk = b""
+            if inflate.eof:  # member boundary: the rest starts a new member
+                chunk = inflate.unused_data
+                inflate = zlib.decompressobj(wbits=31)
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                yield orjson.loads(line)
+    if pending.strip():
+        yield orjson.loads(pending)
+
+
+def iter_records(
+    pointer: Dict[str, Any], offset: int = 0, limit: Optional[int] = None, s3=None
+) -> Iterator[dict]:
+    """Records offset..offset+limit of an offloaded result, in page order."""
+    stop = pointer["records"] if limit is None else min(pointer["records"], offset + limit)
+    # a pointer written before parts existed is a single part itself
+    position = 0
+    for part in pointer.get("parts", [pointer]):
+        if position >= stop:
+            break
+        count = part["records"]
+        if position + count > offset:
+            yield from _part_records(
+                pointer["bucket"],
+                part,
+                max(0, offset - position),
+                min(count, stop - position),
+                s3,
+            )
+        position += count
+
+
+def _part_records(
+    bucket: str, part: Dict[str, Any], offset: int, stop: int, s3=None
+) -> Iterator[dict]:
+    """Records offset..stop of one part, one ranged GET."""
+    if offset >= stop:
+        return
+    firsts = [first for _, first in part["index"]]
+    start_member = bisect.bisect_right(firsts, offset) - 1
+    end_member = bisect.bisect_right(firsts, stop - 1)  # exclusive
+    start = part["index"][start_member][0]
+    end = (
+        part["index"][end_member][0] if end_member < len(firsts) else part["bytes"]
+    ) - 1
+    body = (s3 or get_s3_client()).get_object(
+        Bucket=bucket, Key=part["key"], Range=f"bytes={start}-{end}"
+    )["Body"]
+    position = firsts[start_member]
+    try:
+        for record in _records(iter(lambda: body.read(READ_CHUNK), b"")):
+            if position >= stop:
+                break
+            if position >= offset:
+                yield record
+            position += 1
+    finally:
+        body.close()
+
+
+def load_result(result: Optional[dict], s3=None) -> Optional[dict]:
+    """The full result (pages included) whether inline or offloaded."""
+    if not is_pointer(result):
+        return result
+    return {**result["summary"], "pages": list(iter_records(result, s3=s3))}
@@ -0,0 +1,119 @@
+# apps/jobs/infrastructure/job_events.py
+"""
+Job status events over Redis pub/sub.
+
+Tasks publish the job's status on every transition (`publish_job_event`, one
+PUBLISH on "jobs:status:<job_id>"). Web processes stream them to clients
+(SSE, apps/jobs/viewsets/job_events.py) through one JobEventHub per process:
+a single Redis connection that SUBSCRIBEs to a job's channel while at least
+one client listens and fans each message out to all of that job's listeners.
+A thousand open tabs cost one connection and no polling.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+
+from apps.core.infrastructure.cache.clients import CACHE_DEFAULT, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "jobs:status:"
+LISTENER_QUEUE_SIZE = 16  # a slow client drops old events, not the reader
+
+
+def channel_for(job_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{job_id}"
+
+
+def publish_job_event(job_id: str, payload: Dict[str, Any]) -> None:
+    """Best effort: a missed event is fixed by the next one or a reconnect."""
+    client = get_redis_client(CACHE_DEFAULT)
+    if client is None:
+        return
+    try:
+        client.publish(channel_for(job_id), json.dumps(payload, default=str))
+    except redis.RedisError as exc:
+        logger.warning("job event for %s not published: %s", job_id, exc)
+
+
+def _default_pubsub():
+    # no socket_timeout: the reader blocks on the subscription by design
+    location = settings.CACHES[CACHE_DEFAULT]["LOCATION"]
+    return aioredis.Redis.from_url(location).pubsub(ignore_subscribe_messages=True)
+
+
+class JobEventHub:
+    """Multiplexes one pub/sub connection across all listeners of a process."""
+
+    def __init__(self, pubsub_factory: Callable[[], Any] = _default_pubsub):
+        self._pubsub_factory = pubsub_factory
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._listeners: Dict[str, Set[asyncio.Queue]] = {}
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def listen(self, job_id: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(LISTENER_QUEUE_SIZE)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self._pubsub_factory()
+            if job_id not in self._listeners:
+                self._listeners[job_id] = set()
+                await self._pubsub.subscribe(channel_for(job_id))
+            self._listeners[job_id].add(queue)
+            if self._reader is None:
+                self._reader = asyncio.create_task(self._read())
+        try:
+            yield queue
+        finally:
+            async with self._lock:
+                listeners = self._listeners.get(job_id, set())
+                listeners.discard(queue)
+                if not listeners:
+                    self._listeners.pop(job_id, None)
+                    await self._pubsub.unsubscribe(channel_for(job_id))
+
+    async def _read(self) -> None:
+        while True:
+            async with self._lock:  # exit and restart can't interleave
+                if not self._listeners:
+                    self._reader = None
+                    return
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except (redis.RedisError, OSError) as exc:
+                logger.warning("job event subscription failed: %s", exc)
+                await asyncio.sleep(1.0)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            job_id = channel[len(CHANNEL_PREFIX):]
+            data = json.loads(message["data"])
+            for queue in list(self._listeners.get(job_id, ())):
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(data)
+
+
+_hubs: Dict[int, JobEventHub] = {}
+
+
+def get_job_event_hub() -> JobEventHub:
+    """The hub of the running event loop (one per ASGI worker process)."""
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(id(loop))
+    if hub is None:
+        _hubs.clear()  # a previous loop is gone (tests, reloads)
+        hub = _hubs[id(loop)] = JobEventHub()
+    return hub
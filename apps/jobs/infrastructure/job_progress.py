@@ -0,0 +1,126 @@
+# apps/jobs/infrastructure/job_progress.py
+"""
+Coalesced job progress writes.
+
+Range tasks report every analyzed page. Writing each report would be one
+UPDATE per page, thousands per document. Instead, each worker process sums
+the reports per job and counter in memory. It writes them as one UPDATE for
+all pending jobs (JobRepository.add_progress) once JOBS_PROGRESS_FLUSH_COUNT
+reports are pending or JOBS_PROGRESS_FLUSH_SECONDS have passed. The age is
+checked on every report and after every task (config/celery.py).
+
+A range's outcome is never buffered. `range_finished` writes the job's
+pending pages and the range counter together, right away, because the chord
+body and status readers rely on it. Terminal job writes call
+`flush_progress(job_id)` first. Celery's shutdown signals flush whatever is
+left. A hard-killed worker loses at most one interval of page counts, never a
+range outcome.
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+
+from apps.jobs.infrastructure.repositories.django_job_repository import (
+    get_job_repository,
+)
+
+Deltas = Dict[str, Dict[str, int]]  # job_id -> counter -> increment
+
+
+class ProgressBuffer:
+    def __init__(
+        self,
+        write: Callable[[Deltas], None],
+        max_pending: int,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._write = write
+        self.max_pending = max_pending
+        self.interval = interval
+        self._clock = clock
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._deltas: Deltas = {}
+        self._reports: Dict[str, int] = {}  # per job, for the count threshold
+        self._flushed_at = self._clock()
+
+    def _check_fork(self) -> None:
+        # created before the prefork pool forked: the parent's counts belong
+        # to the parent, and its lock may have been copied while held
+        if os.getpid() != self._pid:
+            self._reset()
+
+    def add(self, job_id: str, counter: str, count: int = 1, flush: bool = False) -> None:
+        self._check_fork()
+        with self._lock:
+            counters = self._deltas.setdefault(job_id, {})
+            counters[counter] = counters.get(counter, 0) + count
+            self._reports[job_id] = self._reports.get(job_id, 0) + 1
+            due = sum(self._reports.values()) >= self.max_pending
+        if flush:
+            self.flush([job_id])
+        elif due:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        self._check_fork()
+        if self._deltas and self._clock() - self._flushed_at >= self.interval:
+            self.flush()
+
+    def flush(self, job_ids: Optional[Iterable[str]] = None) -> None:
+        """Write pending counts (of job_ids only, if given); no-op when none."""
+        self._check_fork()
+        with self._lock:
+            if job_ids is None:
+                deltas, self._deltas, self._reports = self._deltas, {}, {}
+                self._flushed_at = self._clock()
+            else:
+                deltas = {j: self._deltas.pop(j) for j in job_ids if j in self._deltas}
+                for job_id in deltas:
+                    self._reports.pop(job_id, None)
+        if not deltas:
+            return
+        try:
+            self._write(deltas)
+        except Exception:
+            with self._lock:  # keep them for the next flush
+                for job_id, counters in deltas.items():
+                    self._reports[job_id] = self._reports.get(job_id, 0) + 1
+                    pending = self._deltas.setdefault(job_id, {})
+                    for counter, count in counters.items():
+                        pending[counter] = pending.get(counter, 0) + count
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_progress_buffer() -> ProgressBuffer:
+    return ProgressBuffer(
+        lambda deltas: get_job_repository().add_progress(deltas),
+        max_pending=settings.JOBS_PROGRESS_FLUSH_COUNT,
+        interval=settings.JOBS_PROGRESS_FLUSH_SECONDS,
+    )
+
+
+def report_pages(job_id: str, count: int = 1) -> None:
+    """count pages analyzed; a failed attempt reports -pages it had reported."""
+    get_progress_buffer().add(job_id, "pages_done", count)
+
+
+def range_finished(job_id: str, failed: bool) -> None:
+    counter = "ranges_failed" if failed else "ranges_done"
+    get_progress_buffer().add(job_id, counter, flush=True)
+
+
+def flush_progress(job_id: Optional[str] = None) -> None:
+    get_progress_buffer().flush(None if job_id is None else [job_id])
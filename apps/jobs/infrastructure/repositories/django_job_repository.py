@@ -0,0 +1,132 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from django.db.models import Case, F, PositiveIntegerField, When
+from django.utils import timezone
+
+from apps.file_upload.models import File
+from apps.jobs.domain.ports.job_repository import JobRepository
+from apps.jobs.models import Job
+
+
+# everything but `result`, which can be large (see result_store.py)
+STATUS_FIELDS = (
+    "job_id",
+    "status",
+    "tenant",
+    "bucket",
+    "key",
+    "page_count",
+    "chunk_size",
+    "pages_done",
+    "ranges_total",
+    "ranges_done",
+    "ranges_failed",
+    "error_message",
+)
+PROGRESS_COUNTERS = ("pages_done", "ranges_done", "ranges_failed")
+
+
+class DjangoJobRepository(JobRepository):
+    """Jobs table via the ORM. Counters use F() so range tasks never race."""
+
+    def create_job(
+        self,
+        job_id: str,
+        *,
+        bucket: str,
+        key: str,
+        page_count: int,
+        chunk_size: int,
+        ranges_total: int,
+        tenant: str = "",
+    ) -> None:
+        Job.objects.create(
+            job_id=job_id,
+            bucket=bucket,
+            key=key,
+            page_count=page_count,
+            chunk_size=chunk_size,
+            ranges_total=ranges_total,
+            tenant=tenant,
+        )
+
+    def get_job(self, job_id: str, tenant: Optional[str] = None) -> dict:
+        row = _jobs(tenant).filter(job_id=job_id).values(*STATUS_FIELDS).first()
+        if row is None:
+            raise KeyError(f"job not found: {job_id}")
+        return row
+
+    def list_jobs(
+        self, offset: int, limit: int, tenant: Optional[str] = None
+    ) -> List[dict]:
+        rows = _jobs(tenant).order_by("-created_at").values(*STATUS_FIELDS, "created_at")
+        return list(rows[offset : offset + limit])
+
+    def get_result(self, job_id: str, tenant: Optional[str] = None) -> Optional[dict]:
+        rows = _jobs(tenant).filter(job_id=job_id)
+        return rows.values_list("result", flat=True).first()
+
+    def get_document(self, file_id: str, tenant: str) -> dict:
+        rows = File.objects.filter(pk=file_id, user_id=tenant)
+        row = rows.values("bucket", "key").first()
+        if row is None:
+            raise KeyError(f"file not found: {file_id}")
+        return row
+
+    def start_ranges(self, job_id: str, retried: int = 0) -> None:
+        Job.objects.filter(job_id=job_id).update(
+            status="running",
+            ranges_failed=F("ranges_failed") - retried,
+            updated_at=timezone.now(),
+        )
+
+    def add_progress(self, deltas: Dict[str, Dict[str, int]]) -> None:
+        # one UPDATE for every job and counter: CASE job_id WHEN ... THEN
+        # counter + n, the statement bulk_update builds, minus the pk lookup
+        updates = {}
+        for counter in PROGRESS_COUNTERS:
+            whens = [
+                When(job_id=job_id, then=F(counter) + counts[counter])
+                for job_id, counts in deltas.items()
+                if counts.get(counter)
+            ]
+            if whens:
+                updates[counter] = Case(
+                    *whens, default=F(counter), output_field=PositiveIntegerField()
+                )
+        if updates:
+            Job.objects.filter(job_id__in=list(deltas)).update(
+                **updates, updated_at=timezone.now()
+            )
+
+    def set_progress(
+        self, job_id: str, *, pages_done: int, ranges_done: int, ranges_failed: int
+    ) -> None:
+        Job.objects.filter(job_id=job_id).update(
+            pages_done=pages_done,
+            ranges_done=ranges_done,
+            ranges_failed=ranges_failed,
+            updated_at=timezone.now(),
+        )
+
+    def finish(
+        self, job_id: str, status: str, result: Optional[dict], error: str = ""
+    ) -> None:
+        Job.objects.filter(job_id=job_id).update(
+            status=status,
+            result=result,
+            error_message=error or None,
+            updated_at=timezone.now(),
+        )
+
+
+def _jobs(tenant: Optional[str]):
+    # tenant is the owner's user pk as a string (JobViewSet.create)
+    return Job.objects.all() if tenant is None else Job.objects.filter(tenant=tenant)
+
+
+@lru_cache(maxsize=1)
+def get_job_repository() -> JobRepository:
+    return DjangoJobRepository()
@@ -0,0 +1,240 @@
+from __future__ import annotations
+import json
+import threading
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+import redis
+
+from apps.core.infrastructure.cache.clients import CACHE_DEFAULT, get_redis_client
+from apps.jobs.domain.logic.fair_share import LANE_FULL, TENANT_FULL
+from apps.jobs.domain.ports.scheduler_state import SchedulerState
+
+PREFIX = "jobs:sched"
+LOCK_TTL_MS = 30_000  # a crashed drainer blocks scheduling for at most this
+
+# KEYS: tenant queue, rotation list, rotation set. ARGV: entry, front, tenant
+PUSH_LUA = """
+if ARGV[2] == '1' then
+  redis.call('LPUSH', KEYS[1], ARGV[1])
+else
+  redis.call('RPUSH', KEYS[1], ARGV[1])
+end
+if redis.call('SADD', KEYS[3], ARGV[3]) == 1 then
+  redis.call('RPUSH', KEYS[2], ARGV[3])
+end
+"""
+
+# KEYS: tenant queue, rotation list, rotation set. ARGV: tenant
+RETIRE_LUA = """
+if redis.call('LLEN', KEYS[1]) == 0 then
+  redis.call('LREM', KEYS[2], 0, ARGV[1])
+  redis.call('SREM', KEYS[3], ARGV[1])
+end
+"""
+
+# KEYS: lane counter, tenant counter. ARGV: count, tenant capacity, capacity
+ACQUIRE_LUA = """
+local lane = tonumber(redis.call('GET', KEYS[1]) or '0')
+local tenant = tonumber(redis.call('GET', KEYS[2]) or '0')
+local lane_free = tonumber(ARGV[3]) - lane
+local tenant_free = tonumber(ARGV[2]) - tenant
+if lane_free <= 0 then return %(lane_full)d end
+if tenant_free <= 0 then return %(tenant_full)d end
+local granted = math.min(tonumber(ARGV[1]), lane_free, tenant_free)
+redis.call('INCRBY', KEYS[1], granted)
+redis.call('INCRBY', KEYS[2], granted)
+return granted
+""" % {"lane_full": LANE_FULL, "tenant_full": TENANT_FULL}
+
+# KEYS: lane counter, tenant counter. ARGV: count
+RELEASE_LUA = """
+for _, key in ipairs(KEYS) do
+  if redis.call('DECRBY', key, ARGV[1]) <= 0 then redis.call('DEL', key) end
+end
+"""
+
+UNLOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) end
+return 0
+"""
+
+
+def _grant(count: int, lane: int, tenant: int, tenant_capacity: int, capacity: int):
+    if capacity - lane <= 0:
+        return LANE_FULL
+    if tenant_capacity - tenant <= 0:
+        return TENANT_FULL
+    return min(count, capacity - lane, tenant_capacity - tenant)
+
+
+class RedisSchedulerState(SchedulerState):
+    """
+    One Redis for all web and worker processes: per-tenant lists, a rotation
+    list (+ set for membership) per lane and INCRBY counters. Pushes and slot
+    grants are Lua scripts, so they're atomic against concurrent submits.
+    """
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._push = client.register_script(PUSH_LUA)
+        self._retire = client.register_script(RETIRE_LUA)
+        self._acquire = client.register_script(ACQUIRE_LUA)
+        self._release = client.register_script(RELEASE_LUA)
+        self._unlock = client.register_script(UNLOCK_LUA)
+
+    def _keys(self, lane: str, tenant: str) -> List[str]:
+        return [
+            f"{PREFIX}:{lane}:q:{tenant}",
+            f"{PREFIX}:{lane}:tenants",
+            f"{PREFIX}:{lane}:tenant-set",
+        ]
+
+    def _counters(self, lane: str, tenant: str) -> List[str]:
+        return [f"{PREFIX}:{lane}:inflight", f"{PREFIX}:{lane}:inflight:{tenant}"]
+
+    def push(self, lane: str, tenant: str, entry: dict, front: bool = False) -> None:
+        self._push(
+            keys=self._keys(lane, tenant),
+            args=[json.dumps(entry), "1" if front else "0", tenant],
+        )
+
+    def pop(self, lane: str, tenant: str) -> Optional[dict]:
+        raw = self.client.lpop(self._keys(lane, tenant)[0])
+        return json.loads(raw) if raw else None
+
+    def tenants(self, lane: str) -> List[str]:
+        raw = self.client.lrange(f"{PREFIX}:{lane}:tenants", 0, -1)
+        return [t.decode() if isinstance(t, bytes) else t for t in raw]
+
+    def rotate(self, lane: str, tenant: str) -> None:
+        key = f"{PREFIX}:{lane}:tenants"
+        with self.client.pipeline() as pipe:  # MULTI: never lost in between
+            pipe.lrem(key, 1, tenant)
+            pipe.rpush(key, tenant)
+            pipe.execute()
+
+    def retire(self, lane: str, tenant: str) -> None:
+        self._retire(keys=self._keys(lane, tenant), args=[tenant])
+
+    def acquire(
+        self, lane: str, tenant: str, count: int, tenant_capacity: int, capacity: int
+    ) -> int:
+        return int(
+            self._acquire(
+                keys=self._counters(lane, tenant),
+                args=[count, tenant_capacity, capacity],
+            )
+        )
+
+    def release(self, lane: str, tenant: str, count: int) -> None:
+        self._release(keys=self._counters(lane, tenant), args=[count])
+
+    def in_flight(self, lane: str, tenant: Optional[str] = None) -> int:
+        key = self._counters(lane, tenant or "")[1 if tenant else 0]
+        return int(self.client.get(key) or 0)
+
+    @contextmanager
+    def lock(self) -> Iterator[bool]:
+        key, token = f"{PREFIX}:lock", uuid.uuid4().hex
+        acquired = bool(self.client.set(key, token, nx=True, px=LOCK_TTL_MS))
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._unlock(keys=[key], args=[token])
+
+    def mark_dirty(self) -> None:
+        self.client.set(f"{PREFIX}:dirty", 1)
+
+    def take_dirty(self) -> bool:
+        return bool(self.client.delete(f"{PREFIX}:dirty"))
+
+    def is_dirty(self) -> bool:
+        return bool(self.client.exists(f"{PREFIX}:dirty"))
+
+
+class InMemorySchedulerState(SchedulerState):
+    """Process-local state: dev without Redis, eager Celery and simulations."""
+
+    def __init__(self):
+        self._queues: Dict[tuple, deque] = {}
+        self._rotation: Dict[str, List[str]] = {}
+        self._in_flight: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def push(self, lane: str, tenant: str, entry: dict, front: bool = False) -> None:
+        queue = self._queues.setdefault((lane, tenant), deque())
+        queue.appendleft(entry) if front else queue.append(entry)
+        rotation = self._rotation.setdefault(lane, [])
+        if tenant not in rotation:
+            rotation.append(tenant)
+
+    def pop(self, lane: str, tenant: str) -> Optional[dict]:
+        queue = self._queues.get((lane, tenant))
+        return queue.popleft() if queue else None
+
+    def tenants(self, lane: str) -> List[str]:
+        return list(self._rotation.get(lane, ()))
+
+    def rotate(self, lane: str, tenant: str) -> None:
+        rotation = self._rotation[lane]
+        rotation.remove(tenant)
+        rotation.append(tenant)
+
+    def retire(self, lane: str, tenant: str) -> None:
+        if not self._queues.get((lane, tenant)):
+            self._queues.pop((lane, tenant), None)
+            if tenant in self._rotation.get(lane, ()):
+                self._rotation[lane].remove(tenant)
+
+    def acquire(
+        self, lane: str, tenant: str, count: int, tenant_capacity: int, capacity: int
+    ) -> int:
+        granted = _grant(
+            count,
+            self.in_flight(lane),
+            self.in_flight(lane, tenant),
+            tenant_capacity,
+            capacity,
+        )
+        if granted > 0:
+            for key in ((lane, None), (lane, tenant)):
+                self._in_flight[key] = self._in_flight.get(key, 0) + granted
+        return granted
+
+    def release(self, lane: str, tenant: str, count: int) -> None:
+        for key in ((lane, None), (lane, tenant)):
+            self._in_flight[key] = max(0, self._in_flight.get(key, 0) - count)
+
+    def in_flight(self, lane: str, tenant: Optional[str] = None) -> int:
+        return self._in_flight.get((lane, tenant), 0)
+
+    @contextmanager
+    def lock(self) -> Iterator[bool]:
+        acquired = self._lock.acquire(blocking=False)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._lock.release()
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def take_dirty(self) -> bool:
+        dirty, self._dirty = self._dirty, False
+        return dirty
+
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+
+@lru_cache(maxsize=1)
+def get_scheduler_state() -> SchedulerState:
+    client = get_redis_client(CACHE_DEFAULT)
+    return RedisSchedulerState(client) if client is not None else InMemorySchedulerState()
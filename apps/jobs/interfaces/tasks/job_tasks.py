@@ -1,10 +1,138 @@
 """Celery tasks for job operations."""
 from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.utils.module_loading import import_string
 
+from apps.jobs.infrastructure.aws.result_store import (
+    add_ranges,
+    is_pointer,
+    summary_of,
+)
+from apps.jobs.infrastructure.job_progress import (
+    flush_progress,
+    range_finished,
+    report_pages,
+)
+from apps.jobs.infrastructure.repositories.django_job_repository import (
+    get_job_repository,
+)
 
-@shared_task
+
+def _publish(job_id):
+    from apps.jobs.application.services.job_service import JobService
+
+    JobService.publish_status(job_id)
+
+
+def _wave_finished(wave):
+    from apps.jobs.application.services import job_scheduler
+
+    job_scheduler.wave_finished(wave)
+
+
+@shared_task(name="apps.jobs_tasks.check_job_status")
 def check_job_status(job_id):
-    """Check job status from microservice."""
-    # TODO: Implement job status checking task
-    pass
+    """Status and progress counters of a job."""
+    from apps.jobs.application.services.job_service import JobService
+
+    return JobService.get_job_status(job_id)
+
+
+@shared_task(
+    bind=True,
+    name="apps.jobs_tasks.analyze_page_range",
+    max_retries=settings.JOBS_RANGE_MAX_RETRIES,
+    soft_time_limit=settings.JOBS_RANGE_SOFT_TIME_LIMIT,
+)
+def analyze_page_range(self, job_id, bucket, key, first, last):
+    """
+    One chord header task: analyze pages first..last. A range that still fails
+    after its retries returns an error record instead of raising, so the chord
+    body runs and the job ends "partial" with only that range to retry. Pages
+    count towards the job's progress as the analyzer yields them; an attempt
+    that fails takes its pages back, so retries and re-runs count them once.
+    """
+    pages = []
+    try:
+        for page in import_string(settings.JOBS_PAGE_ANALYZER)(bucket, key, first, last):
+            pages.append(page)
+            report_pages(job_id)
+    except SoftTimeLimitExceeded as exc:
+        report_pages(job_id, -len(pages))
+        error = f"time limit: {exc}"
+    except Exception as exc:
+        report_pages(job_id, -len(pages))
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+        error = f"{type(exc).__name__}: {exc}"
+    else:
+        range_finished(job_id, failed=False)
+        _publish(job_id)
+        return {"first": first, "last": last, "pages": pages}
+    range_finished(job_id, failed=True)
+    _publish(job_id)
+    return {"first": first, "last": last, "error": error}
+
+
+def _merge(job_id, results, wave, recount=False):
+    repo = get_job_repository()
+    result = add_ranges(job_id, repo.get_result(job_id), results)
+    summary = summary_of(result)
+    pending = wave["rest"] if wave else []
+    if pending:
+        status = "running"
+    else:
+        status = "partial" if summary["failed_ranges"] else "completed"
+    flush_progress(job_id)
+    if recount:
+        # the lost tasks' counter updates are unknown: recount from the result
+        # (ranges still queued for a retry are also still listed as failed)
+        job = repo.get_job(job_id)
+        failed = [r for r in summary["failed_ranges"] if r not in pending]
+        pages = result["records"] if is_pointer(result) else len(result["pages"])
+        repo.set_progress(
+            job_id,
+            pages_done=pages,
+            ranges_done=job["ranges_total"] - len(failed) - len(pending),
+            ranges_failed=len(failed),
+        )
+    repo.finish(job_id, status, result)
+    _publish(job_id)
+    if wave:
+        _wave_finished(wave)
+    return status
+
+
+@shared_task(name="apps.jobs_tasks.merge_page_ranges")
+def merge_page_ranges(results, job_id, wave=None):
+    """
+    Chord body: fold the range results into Job.result (or its S3 pointer).
+    `wave` is the scheduler's record of this chord (application/services/
+    job_scheduler.py); the job stays running while it has ranges left.
+    """
+    return {"job_id": job_id, "status": _merge(job_id, results, wave)}
+
+
+@shared_task(name="apps.jobs_tasks.release_wave")
+def release_wave(wave):
+    """
+    Errback of a wave whose chord failed: a range task was killed outright
+    (hard time limit, lost worker), so the body never ran and the results of
+    the whole wave are lost. Its ranges are recorded as failed, to be re-run
+    by retry; the job goes on with its next wave, or ends partial.
+    """
+    job_id = wave["job"]["job_id"]
+    lost = [
+        {"first": first, "last": last, "error": "range task lost before the merge"}
+        for first, last in wave.get("ranges", [])
+    ]
+    return {"job_id": job_id, "status": _merge(job_id, lost, wave, recount=True)}
+
+
+@shared_task(name="apps.jobs_tasks.schedule_job_waves")
+def schedule_job_waves():
+    """Beat: admit queued waves (normally done when jobs and waves finish)."""
+    from apps.jobs.application.services import job_scheduler
 
+    return job_scheduler.schedule()
@@ -0,0 +1,29 @@
+# Monthly RANGE partitions on created_at (Postgres only; no-op elsewhere).
+# The model state is unchanged: Django keeps `id` as the primary key while the
+# database key becomes (id, created_at), and job_id stays unique through the
+# jobs_job_id_key_guard table. See apps/core/infrastructure/db/partitioning.py
+from django.db import migrations
+
+from apps.core.infrastructure.db.partitioning import (
+    convert_to_partitioned,
+    convert_to_plain,
+)
+
+
+def forwards(apps, schema_editor):
+    convert_to_partitioned(schema_editor, "jobs")
+
+
+def backwards(apps, schema_editor):
+    convert_to_plain(schema_editor, "jobs")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_tenant'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='pages_done',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# 0002 made the database constraint UNIQUE (job_id, created_at). Databases
+# partitioned before unique guards existed get the jobs_job_id_key guard here,
+# so job_id is unique across partitions again (no-op off Postgres, and where
+# 0002 already created it). See apps/core/infrastructure/db/partitioning.py
+from django.db import migrations
+
+from apps.core.infrastructure.db.partitioning import add_missing_guards
+
+
+def forwards(apps, schema_editor):
+    add_missing_guards(schema_editor, "jobs")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_pages_done'),
+    ]
+
+    operations = [
+        # the guard goes when 0002 is reversed (convert_to_plain)
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
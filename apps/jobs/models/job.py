@@ -1,12 +1,20 @@
 from django.db import models
 
 
+class JobManager(models.Manager):
+    def get_queryset(self):
+        # result can be a large JSON document; rows load without it and fetch
+        # it on access (admin lists, .all() scans). .values("result") still works
+        return super().get_queryset().defer("result")
+
+
 class Job(models.Model):
     """Model for job tracking."""
     STATUS_CHOICES = [
         ('pending', 'Pending'),
         ('running', 'Running'),
         ('completed', 'Completed'),
+        ('partial', 'Partially failed'),
         ('failed', 'Failed'),
     ]
     
@@ -16,6 +24,22 @@ class Job(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     result = models.JSONField(null=True, blank=True)
     error_message = models.TextField(null=True, blank=True)
+
+    # fair-share scheduling key (application/services/job_scheduler.py)
+    tenant = models.CharField(max_length=64, blank=True, db_index=True)
+    # source document, split into page ranges of chunk_size pages
+    bucket = models.CharField(max_length=128, blank=True)
+    key = models.CharField(max_length=1024, blank=True)
+    page_count = models.PositiveIntegerField(default=0)
+    chunk_size = models.PositiveIntegerField(default=0)
+    # pages analyzed so far, written coalesced (infrastructure/job_progress.py)
+    pages_done = models.PositiveIntegerField(default=0)
+    # progress: ranges finished ok / failed after retries, out of ranges_total
+    ranges_total = models.PositiveIntegerField(default=0)
+    ranges_done = models.PositiveIntegerField(default=0)
+    ranges_failed = models.PositiveIntegerField(default=0)
+
+    objects = JobManager()
     
     class Meta:
         db_table = 'jobs'
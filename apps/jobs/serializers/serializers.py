@@ -5,3 +5,10 @@ class JobSerializer(serializers.Serializer):
     """Serializer for job operations."""
     pass
 
+
+class JobCreateSerializer(serializers.Serializer):
+    """A page-range analysis job over one of the caller's uploaded files."""
+
+    file_id = serializers.UUIDField()
+    page_count = serializers.IntegerField(min_value=1, max_value=100_000)
+    chunk_size = serializers.IntegerField(min_value=1, required=False)
@@ -0,0 +1,8 @@
+# picked up by app.autodiscover_tasks(); the tasks live with the other interfaces
+from apps.jobs.interfaces.tasks.job_tasks import (  # noqa: F401
+    analyze_page_range,
+    check_job_status,
+    merge_page_ranges,
+    release_wave,
+    schedule_job_waves,
+)
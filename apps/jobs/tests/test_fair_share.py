@@ -0,0 +1,190 @@
+"""Fair-share admission: a simulated cluster, and waves through eager chords."""
+import itertools
+from collections import deque
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.jobs.application.services.job_service import JobService
+from apps.jobs.domain.logic import fair_share
+from apps.jobs.domain.logic.fair_share import BULK, PRIORITY, LaneLimits
+from apps.jobs.infrastructure.repositories.scheduler_state import (
+    InMemorySchedulerState,
+    get_scheduler_state,
+)
+from apps.jobs.interfaces.tasks.job_tasks import release_wave
+from apps.jobs.tests.test_page_jobs import InMemoryJobRepository
+from config.celery import app
+
+WORKERS = 8
+LIMITS = {PRIORITY: LaneLimits(8, 8), BULK: LaneLimits(16, 8)}
+
+
+class Cluster:
+    """
+    Discrete time: WORKERS workers, every range takes one tick. Each worker
+    takes the next task alternating between the two queues, like a worker
+    consuming jobs_priority,jobs. Without `fair`, every job goes to the broker
+    whole, as one chord used to.
+    """
+
+    def __init__(self, fair=True):
+        self.fair = fair
+        self.state = InMemorySchedulerState()
+        self.broker = {PRIORITY: deque(), BULK: deque()}
+        self.queue_order = itertools.cycle([(PRIORITY, BULK), (BULK, PRIORITY)])
+        self.waves, self.wave_ids = {}, itertools.count()
+        self.left, self.submitted, self.finished = {}, {}, {}
+
+    def submit(self, now, tenant, job_id, ranges):
+        self.submitted[job_id], self.left[job_id] = now, ranges
+        lane = fair_share.lane_for(ranges, priority_max_ranges=4)
+        todo = [[n, n] for n in range(ranges)]
+        if not self.fair:
+            self.dispatch(BULK, tenant, {"job_id": job_id}, todo, [])
+            return
+        fair_share.submit(self.state, lane, tenant, {"job_id": job_id}, todo)
+        fair_share.drain(self.state, self.dispatch, LIMITS, wave=8)
+
+    def dispatch(self, lane, tenant, job, wave, rest):
+        wave_id = next(self.wave_ids)
+        self.waves[wave_id] = [len(wave), lane, tenant, job, len(wave), rest]
+        self.broker[lane].extend((wave_id, job["job_id"]) for _ in wave)
+
+    def tick(self, now):
+        running = []
+        for _ in range(WORKERS):
+            for lane in next(self.queue_order):
+                if self.broker[lane]:
+                    running.append(self.broker[lane].popleft())
+                    break
+        for wave_id, job_id in running:
+            self.left[job_id] -= 1
+            if not self.left[job_id]:
+                self.finished[job_id] = now + 1
+            wave = self.waves[wave_id]
+            wave[0] -= 1
+            if not wave[0] and self.fair:
+                _, lane, tenant, job, admitted, rest = wave
+                fair_share.finish_wave(self.state, lane, tenant, job, admitted, rest)
+                fair_share.drain(self.state, self.dispatch, LIMITS, wave=8)
+
+    def run(self, arrivals):
+        """arrivals: {tick: [(tenant, job_id, ranges)]}; returns wait per job."""
+        for now in itertools.count():
+            for args in arrivals.get(now, ()):
+                self.submit(now, *args)
+            self.tick(now)
+            if len(self.finished) == len(self.left) and now >= max(arrivals):
+                return {j: self.finished[j] - self.submitted[j] for j in self.finished}
+
+
+def workload():
+    # a 10,000-page document (400 ranges of 25), a 40-range job from a second
+    # tenant and a stream of 2-range jobs from four small tenants
+    arrivals = {0: [("big", "big", 400)], 5: [("other", "other", 40)]}
+    for n in range(20):
+        arrivals.setdefault(3 + 5 * n, []).append((f"small{n % 4}", f"s{n}", 2))
+    return arrivals
+
+
+class FairShareSimulationTestCase(SimpleTestCase):
+    """Small tenants wait a bounded time no matter how much one tenant queued."""
+
+    def test_small_tenants_are_not_starved(self):
+        fifo = Cluster(fair=False).run(workload())
+        fair = Cluster(fair=True).run(workload())
+        small = [f"s{n}" for n in range(20)]
+
+        # FIFO: the small jobs wait behind whatever the big tenant sent
+        self.assertGreater(max(fifo[j] for j in small), 30)
+        self.assertGreater(fifo["other"], 40)
+        # fair share: a couple of ticks, and the second big job gets its share
+        self.assertLessEqual(max(fair[j] for j in small), 2)
+        self.assertLessEqual(fair["other"], 15)
+        # the big tenant still gets the rest: within 15% of all the work
+        # (480 ranges) back to back; the gap is the barrier between its waves
+        self.assertLessEqual(fair["big"], 1.15 * 480 / WORKERS)
+
+    def test_tenant_and_lane_capacity(self):
+        state, sent = InMemorySchedulerState(), []
+        job = {"job_id": "j"}
+        fair_share.submit(state, BULK, "a", job, [[n, n] for n in range(30)])
+        fair_share.submit(state, BULK, "b", {"job_id": "k"}, [[1, 1], [2, 2]])
+        limits = {PRIORITY: LaneLimits(4, 4), BULK: LaneLimits(8, 6)}
+        fair_share.drain(state, lambda *wave: sent.append(wave), limits, wave=8)
+
+        # one wave per job in flight, a's capped at its tenant share
+        self.assertEqual(
+            [(w[1], len(w[3]), len(w[4])) for w in sent], [("a", 6, 24), ("b", 2, 0)]
+        )
+        self.assertEqual((state.in_flight(BULK), state.in_flight(BULK, "a")), (8, 6))
+
+        fair_share.finish_wave(state, BULK, "a", job, 6, sent[0][4])
+        fair_share.drain(state, lambda *wave: sent.append(wave), limits, wave=8)
+        self.assertEqual(len(sent[2][3]), 6)  # the lane has 6 of 8 slots free again
+
+
+@override_settings(
+    JOBS_SCHED_WAVE_RANGES=2,
+    JOBS_SCHED_TENANT_CAPACITY=2,
+    JOBS_PRIORITY_MAX_RANGES=1,
+)
+class WaveChordTestCase(SimpleTestCase):
+    """A job's ranges run as consecutive chords through the scheduler."""
+
+    def setUp(self):
+        self.repo = InMemoryJobRepository()
+        for target in (
+            "apps.jobs.application.services.job_service.get_job_repository",
+            "apps.jobs.interfaces.tasks.job_tasks.get_job_repository",
+            "apps.jobs.infrastructure.job_progress.get_job_repository",
+        ):
+            p = mock.patch(target, return_value=self.repo)
+            p.start()
+            self.addCleanup(p.stop)
+        eager = {"task_always_eager": True, "task_eager_propagates": True}
+        previous = {k: app.conf[k] for k in eager}
+        app.conf.update(eager)
+        self.addCleanup(app.conf.update, previous)
+        get_scheduler_state.cache_clear()
+        self.addCleanup(get_scheduler_state.cache_clear)
+
+    def test_job_runs_in_waves(self):
+        job_id = JobService.create_job(
+            {
+                "bucket": "b",
+                "key": "doc.pdf",
+                "page_count": 10,
+                "chunk_size": 2,
+                "tenant": "7",
+            }
+        )
+        status = JobService.get_job_status(job_id)
+        self.assertEqual((status["status"], status["ranges_done"]), ("completed", 5))
+        pages = self.repo.get_result(job_id)["pages"]
+        self.assertEqual([p["page"] for p in pages], list(range(1, 11)))
+        self.assertEqual(get_scheduler_state().in_flight(BULK, "7"), 0)
+
+    def test_lost_last_wave_ends_the_job(self):
+        self.repo.create_job("j", ranges_total=2, page_count=4, tenant="7")
+        self.repo.start_ranges("j")
+        # one range reported before its worker was killed; the chord errored
+        self.repo.add_progress({"j": {"pages_done": 2, "ranges_done": 1}})
+        release_wave(
+            {
+                "lane": BULK,
+                "tenant": "7",
+                "job": {"job_id": "j", "bucket": "b", "key": "doc.pdf"},
+                "admitted": 2,
+                "ranges": [[1, 2], [3, 4]],
+                "rest": [],
+            }
+        )
+        job = self.repo.get_job("j")
+        self.assertEqual(job["status"], "partial")
+        self.assertEqual(job["result"]["failed_ranges"], [[1, 2], [3, 4]])
+        # recounted from the result, so a retry starts from consistent counters
+        self.assertEqual(
+            (job["pages_done"], job["ranges_done"], job["ranges_failed"]), (0, 0, 2)
+        )
@@ -0,0 +1,100 @@
+"""Job status stream: one pub/sub subscription per job, fanned out over SSE."""
+import asyncio
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.jobs.infrastructure.job_events import JobEventHub, channel_for
+
+
+class FakePubSub:
+    def __init__(self):
+        self.subscribed = []
+        self.unsubscribed = []
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.unsubscribed.append(channel)
+
+    async def get_message(self, timeout):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def publish(self, job_id, payload):
+        self.messages.put_nowait(
+            {"type": "message", "channel": channel_for(job_id).encode(), "data": json.dumps(payload)}
+        )
+
+
+class JobEventHubTestCase(SimpleTestCase):
+    """Listeners share the process' subscription."""
+
+    def test_one_subscription_fans_out(self):
+        async def scenario():
+            pubsub = FakePubSub()
+            hub = JobEventHub(lambda: pubsub)
+            async with hub.listen("j1") as a, hub.listen("j1") as b:
+                pubsub.publish("j1", {"status": "running"})
+                got = await asyncio.wait_for(asyncio.gather(a.get(), b.get()), 2)
+            await asyncio.sleep(0)
+            return pubsub, got
+
+        pubsub, got = asyncio.run(scenario())
+        self.assertEqual(got, [{"status": "running"}] * 2)
+        self.assertEqual(pubsub.subscribed, [channel_for("j1")])
+        self.assertEqual(pubsub.unsubscribed, [channel_for("j1")])
+
+
+class JobStatusStreamTestCase(SimpleTestCase):
+    """GET jobs/<id>/events streams transitions until the job finishes."""
+
+    def setUp(self):
+        self.pubsub = FakePubSub()
+        hub = JobEventHub(lambda: self.pubsub)
+        self.statuses = iter(
+            [{"status": "running"}, {"status": "running", "ranges_done": 0}]
+        )
+        patches = [
+            mock.patch("apps.jobs.viewsets.job_events._tenant", return_value="1"),
+            mock.patch("apps.jobs.viewsets.job_events.get_job_event_hub", return_value=hub),
+            mock.patch(
+                "apps.jobs.viewsets.job_events.JobService.get_job_status",
+                side_effect=self.get_job_status,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def get_job_status(self, pk, tenant):
+        if (pk, tenant) != ("j1", "1"):
+            raise KeyError(pk)
+        return next(self.statuses)
+
+    def test_stream_ends_with_terminal_status(self):
+        async def scenario():
+            resp = await self.async_client.get("/api/v1/jobs/j1/events")
+            self.assertEqual(resp["Content-Type"], "text/event-stream")
+            chunks = []
+            async for chunk in resp.streaming_content:
+                chunks.append(chunk.decode())
+                if len(chunks) == 1:
+                    self.pubsub.publish("j1", {"status": "completed"})
+            return chunks
+
+        chunks = asyncio.run(scenario())
+        self.assertEqual(len(chunks), 2)
+        self.assertIn('"ranges_done": 0', chunks[0])
+        self.assertEqual(chunks[1], 'event: status\ndata: {"status": "completed"}\n\n')
+
+    def test_other_tenants_job_is_not_streamed(self):
+        with mock.patch("apps.jobs.viewsets.job_events._tenant", return_value="2"):
+            resp = asyncio.run(self.async_client.get("/api/v1/jobs/j1/events"))
+        self.assertEqual(resp.status_code, 404)
+        self.assertEqual(self.pubsub.subscribed, [])
@@ -0,0 +1,60 @@
+"""Per-page progress is coalesced per process; range outcomes are not."""
+from unittest import mock
+
+from celery import signals
+from django.test import SimpleTestCase
+
+from apps.jobs.infrastructure import job_progress
+from apps.jobs.infrastructure.job_progress import ProgressBuffer
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProgressBufferTestCase(SimpleTestCase):
+    """Reports add up in memory and leave as one write."""
+
+    def setUp(self):
+        self.writes, self.clock = [], Clock()
+        self.buffer = ProgressBuffer(
+            self.writes.append, max_pending=100, interval=2.0, clock=self.clock
+        )
+
+    def test_pages_coalesce_until_count_or_interval(self):
+        for _ in range(99):
+            self.buffer.add("a", "pages_done")
+        self.buffer.add("b", "pages_done", 5)
+        self.assertEqual(self.writes, [{"a": {"pages_done": 99}, "b": {"pages_done": 5}}])
+
+        self.buffer.add("a", "pages_done")
+        self.clock.now = 1.9
+        self.buffer.flush_if_due()
+        self.clock.now = 2.1
+        self.buffer.flush_if_due()
+        self.assertEqual(self.writes[1:], [{"a": {"pages_done": 1}}])
+
+    def test_range_outcome_flushes_its_job_at_once(self):
+        self.buffer.add("a", "pages_done", 3)
+        self.buffer.add("b", "pages_done", 2)
+        self.buffer.add("a", "ranges_done", flush=True)
+        self.assertEqual(self.writes, [{"a": {"pages_done": 3, "ranges_done": 1}}])
+        self.buffer.flush()  # b was left for the next flush
+        self.assertEqual(self.writes[1:], [{"b": {"pages_done": 2}}])
+
+    def test_failed_write_keeps_counts(self):
+        self.buffer._write = mock.Mock(side_effect=[RuntimeError("db down"), None])
+        self.buffer.add("a", "pages_done", 4)
+        with self.assertRaises(RuntimeError):
+            self.buffer.flush()
+        self.buffer.flush()
+        self.buffer._write.assert_called_with({"a": {"pages_done": 4}})
+
+    def test_worker_shutdown_flushes(self):
+        self.buffer.add("a", "pages_done", 7)
+        with mock.patch.object(job_progress, "get_progress_buffer", return_value=self.buffer):
+            signals.worker_shutdown.send(sender=None)
+        self.assertEqual(self.writes, [{"a": {"pages_done": 7}}])
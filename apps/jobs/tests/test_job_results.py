@@ -0,0 +1,93 @@
+"""Large job results: gzip NDJSON in S3, read back a page at a time."""
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from moto import mock_aws
+
+from apps.core.infrastructure.aws.clients import get_s3_client
+from apps.core.infrastructure.aws.warmup import reset_clients
+from apps.jobs.infrastructure.aws.result_store import (
+    add_ranges,
+    iter_records,
+    load_result,
+    store_result,
+)
+
+BUCKET = "test-results"
+RESULT = {
+    "pages": [{"page": n, "text": f"page {n} " * 20} for n in range(1, 251)],
+    "failed_ranges": [],
+    "errors": {},
+}
+
+
+@override_settings(
+    JOBS_RESULT_BUCKET=BUCKET,
+    JOBS_RESULT_INLINE_MAX_BYTES=1024,
+    JOBS_RESULT_RECORDS_PER_BLOCK=100,
+)
+class ResultStoreTestCase(SimpleTestCase):
+    """Offloaded results round-trip and pages come from ranged GETs."""
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        reset_clients()
+        self.addCleanup(reset_clients)
+        get_s3_client().create_bucket(Bucket=BUCKET)
+
+    def test_small_results_stay_inline(self):
+        small = {"pages": [{"page": 1}], "failed_ranges": [], "errors": {}}
+        self.assertIs(store_result("j1", small), small)
+
+    def test_large_result_is_offloaded(self):
+        pointer = store_result("j1", RESULT)
+        self.assertEqual((pointer["storage"], pointer["records"]), ("s3", 250))
+        [part] = pointer["parts"]
+        self.assertEqual([first for _, first in part["index"]], [0, 100, 200])
+        self.assertLess(pointer["bytes"], pointer["raw_bytes"])
+        self.assertEqual(pointer["summary"], {"failed_ranges": [], "errors": {}})
+        self.assertEqual(load_result(pointer), RESULT)
+
+    def test_page_spanning_blocks_is_one_ranged_get(self):
+        pointer = store_result("j1", RESULT)
+        s3 = get_s3_client()
+        with mock.patch.object(s3, "get_object", wraps=s3.get_object) as get:
+            records = list(iter_records(pointer, offset=150, limit=60, s3=s3))
+        self.assertEqual([r["page"] for r in records], list(range(151, 211)))
+        # blocks 2 and 3 only: from the second member's offset to the end
+        [part] = pointer["parts"]
+        get.assert_called_once_with(
+            Bucket=BUCKET,
+            Key=part["key"],
+            Range=f"bytes={part['index'][1][0]}-{part['bytes'] - 1}",
+        )
+
+    def test_waves_append_parts_without_reading_back(self):
+        def wave(*ranges, failed=()):
+            return [
+                {"first": f, "last": l, "error": "boom"}
+                if (f, l) in failed
+                else {"first": f, "last": l, "pages": RESULT["pages"][f - 1 : l]}
+                for f, l in ranges
+            ]
+
+        s3 = get_s3_client()
+        with mock.patch.object(s3, "get_object", wraps=s3.get_object) as get:
+            result = add_ranges("j1", None, wave((1, 50), (51, 100)), s3=s3)
+            result = add_ranges(
+                "j1", result, wave((101, 150), (151, 200), failed={(101, 150)}), s3=s3
+            )
+            result = add_ranges("j1", result, wave((201, 250)), s3=s3)
+            # a retry of the failed range lands between the existing parts
+            result = add_ranges("j1", result, wave((101, 150)), s3=s3)
+        get.assert_not_called()
+        self.assertEqual(
+            [(p["first_page"], p["last_page"]) for p in result["parts"]],
+            [(1, 100), (101, 150), (151, 200), (201, 250)],
+        )
+        self.assertEqual(result["summary"], {"failed_ranges": [], "errors": {}})
+        self.assertEqual(load_result(result), RESULT)
+        records = iter_records(result, offset=95, limit=10)
+        self.assertEqual([r["page"] for r in records], list(range(96, 106)))
@@ -0,0 +1,195 @@
+"""Page-range jobs: split, chord fan-out/fan-in, retry of failed ranges."""
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.jobs.application.services.job_service import JobService
+from apps.jobs.domain.logic.page_ranges import merge_range_results, split_pages
+from apps.jobs.interfaces.tasks.job_tasks import analyze_page_range
+from apps.jobs.viewsets.job_viewset import JobViewSet
+from config.celery import app
+
+
+class InMemoryJobRepository:
+    def __init__(self):
+        self.jobs = {}
+        self.files = {}  # file_id -> (owner tenant, key)
+
+    def create_job(self, job_id, **fields):
+        self.jobs[job_id] = {
+            **fields,
+            "job_id": job_id,
+            "status": "pending",
+            "pages_done": 0,
+            "ranges_done": 0,
+            "ranges_failed": 0,
+            "error_message": None,
+            "result": None,
+        }
+
+    def get_job(self, job_id, tenant=None):
+        job = self.jobs[job_id]
+        if tenant is not None and job.get("tenant") != tenant:
+            raise KeyError(job_id)
+        return job
+
+    def list_jobs(self, offset, limit, tenant=None):
+        jobs = [j for j in self.jobs.values() if tenant in (None, j.get("tenant"))]
+        return jobs[::-1][offset : offset + limit]
+
+    def get_result(self, job_id, tenant=None):
+        return self.get_job(job_id, tenant)["result"]
+
+    def get_document(self, file_id, tenant):
+        owner, key = self.files[file_id]
+        if owner != tenant:
+            raise KeyError(file_id)
+        return {"bucket": "b", "key": key}
+
+    def start_ranges(self, job_id, retried=0):
+        self.jobs[job_id]["status"] = "running"
+        self.jobs[job_id]["ranges_failed"] -= retried
+
+    def add_progress(self, deltas):
+        for job_id, counters in deltas.items():
+            for counter, count in counters.items():
+                self.jobs[job_id][counter] += count
+
+    def set_progress(self, job_id, **counters):
+        self.jobs[job_id].update(counters)
+
+    def finish(self, job_id, status, result, error=""):
+        self.jobs[job_id].update(status=status, result=result)
+
+
+flaky_pages = set()
+
+
+def analyzer(bucket, key, first, last):
+    for n in range(first, last + 1):
+        if n in flaky_pages:
+            raise RuntimeError("boom")
+        yield {"page": n, "key": key}
+
+
+class SplitPagesTestCase(SimpleTestCase):
+    """Ranges cover every page exactly once."""
+
+    def test_split(self):
+        self.assertEqual(split_pages(5, 2), [(1, 2), (3, 4), (5, 5)])
+        self.assertEqual(split_pages(500, 25)[-1], (476, 500))
+        with self.assertRaises(ValueError):
+            split_pages(0, 25)
+
+    def test_retry_replaces_failed_ranges(self):
+        first = merge_range_results(
+            None,
+            [
+                {"first": 3, "last": 4, "error": "boom"},
+                {"first": 1, "last": 2, "pages": [{"page": 1}, {"page": 2}]},
+            ],
+        )
+        self.assertEqual(first["failed_ranges"], [[3, 4]])
+        again = merge_range_results(
+            first, [{"first": 3, "last": 4, "pages": [{"page": 3}, {"page": 4}]}]
+        )
+        self.assertEqual([p["page"] for p in again["pages"]], [1, 2, 3, 4])
+        self.assertEqual((again["failed_ranges"], again["errors"]), ([], {}))
+
+
+@override_settings(JOBS_PAGE_ANALYZER=f"{__name__}.analyzer")
+class PageJobTestCase(SimpleTestCase):
+    """The chord runs eagerly against an in-memory repository."""
+
+    def setUp(self):
+        self.repo = InMemoryJobRepository()
+        for target in (
+            "apps.jobs.application.services.job_service.get_job_repository",
+            "apps.jobs.interfaces.tasks.job_tasks.get_job_repository",
+            "apps.jobs.infrastructure.job_progress.get_job_repository",
+        ):
+            p = mock.patch(target, return_value=self.repo)
+            p.start()
+            self.addCleanup(p.stop)
+        eager = {"task_always_eager": True, "task_eager_propagates": True}
+        previous = {k: app.conf[k] for k in eager}
+        app.conf.update(eager)
+        self.addCleanup(app.conf.update, previous)
+        self.addCleanup(flaky_pages.clear)
+        # eager retries re-raise; the retry policy itself is Celery's
+        p = mock.patch.object(analyze_page_range, "max_retries", 0)
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_job_fans_out_and_merges(self):
+        job_id = JobService.create_job(
+            {"bucket": "b", "key": "doc.pdf", "page_count": 10, "chunk_size": 3}
+        )
+        status = JobService.get_job_status(job_id)
+        self.assertEqual(
+            (status["status"], status["ranges_total"], status["progress"]),
+            ("completed", 4, 1.0),
+        )
+        self.assertEqual(status["pages_done"], 10)
+        pages = self.repo.get_result(job_id)["pages"]
+        self.assertEqual([p["page"] for p in pages], list(range(1, 11)))
+
+    def test_failed_range_is_retried_alone(self):
+        flaky_pages.add(5)
+        job_id = JobService.create_job(
+            {"bucket": "b", "key": "doc.pdf", "page_count": 10, "chunk_size": 3}
+        )
+        status = JobService.get_job_status(job_id)
+        self.assertEqual((status["status"], status["ranges_failed"]), ("partial", 1))
+        self.assertEqual(self.repo.get_result(job_id)["failed_ranges"], [[4, 6]])
+        # page 4 was yielded before the failure and taken back with it
+        self.assertEqual(status["pages_done"], 7)
+
+        flaky_pages.clear()
+        with mock.patch(f"{__name__}.analyzer", wraps=analyzer) as spy:
+            self.assertEqual(JobService.retry_failed_ranges(job_id), 1)
+        spy.assert_called_once_with("b", "doc.pdf", 4, 6)
+        status = JobService.get_job_status(job_id)
+        self.assertEqual((status["status"], status["ranges_failed"]), ("completed", 0))
+        self.assertEqual(status["pages_done"], 10)
+        self.assertEqual(len(self.repo.get_result(job_id)["pages"]), 10)
+
+
+class User:
+    is_authenticated = True
+
+    def __init__(self, pk):
+        self.pk = pk
+
+
+@override_settings(JOBS_PAGE_ANALYZER=f"{__name__}.analyzer")
+class JobTenantTestCase(SimpleTestCase):
+    """The API only shows the caller's jobs and only reads the caller's files."""
+
+    setUp = PageJobTestCase.setUp
+
+    def call(self, user, action, method="get", data=None, pk=None):
+        request = getattr(APIRequestFactory(), method)("/", data, format="json")
+        force_authenticate(request, user=User(user))
+        view = JobViewSet.as_view({method: action})
+        return view(request, **({"pk": pk} if pk else {}))
+
+    def test_other_tenants_jobs_are_not_found(self):
+        file_id = "00000000-0000-0000-0000-000000000001"
+        self.repo.files[file_id] = ("1", "user1/doc.pdf")
+        resp = self.call(1, "create", "post", {"file_id": file_id, "page_count": 4})
+        self.assertEqual(resp.status_code, 202)
+        job_id = resp.data["job_id"]
+        self.assertEqual(self.repo.jobs[job_id]["key"], "user1/doc.pdf")
+
+        self.assertEqual(self.call(1, "status", pk=job_id).status_code, 200)
+        for action in ("status", "retrieve", "result"):
+            self.assertEqual(self.call(2, action, pk=job_id).status_code, 404)
+        self.assertEqual(self.call(2, "retry", "post", pk=job_id).status_code, 404)
+        self.assertEqual(len(self.call(1, "list").data["results"]), 1)
+        self.assertEqual(self.call(2, "list").data["results"], [])
+
+        # a file of someone else's is rejected like a missing one
+        resp = self.call(2, "create", "post", {"file_id": file_id, "page_count": 4})
+        self.assertEqual(resp.status_code, 400)
@@ -3,11 +3,13 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from apps.jobs.viewsets.job_events import job_status_stream
 from apps.jobs.viewsets.job_viewset import JobViewSet
 
 router = DefaultRouter()
 router.register(r"", JobViewSet, basename="jobs")
 
 urlpatterns = [
+    path("<str:pk>/events", job_status_stream, name="job-events"),
     path("", include(router.urls)),
 ]
@@ -0,0 +1,77 @@
+"""Server-Sent Events stream of a job's status."""
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from apps.jobs.application.services.job_service import JobService
+from apps.jobs.infrastructure.job_events import get_job_event_hub
+
+TERMINAL = {"completed", "partial", "failed"}
+
+
+def _tenant(request):
+    """
+    The authenticated user's tenant (pk as a string, as in JobViewSet), or
+    None. Same authenticators as the DRF views; this view is plain async Django.
+    """
+    authenticators = [cls() for cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    user = Request(request, authenticators=authenticators).user
+    return str(user.pk) if user.is_authenticated else None
+
+
+def _event(status):
+    return f"event: status\ndata: {json.dumps(status, default=str)}\n\n"
+
+
+async def job_status_stream(request, pk):
+    """
+    GET /api/v1/jobs/<id>/events: the current status, then one event per
+    transition published by the job's tasks, until the job finishes. Replaces
+    polling the status action. Needs the ASGI worker; EventSource reconnects
+    on its own after JOBS_EVENTS_MAX_SECONDS.
+    """
+    tenant = await sync_to_async(_tenant)(request)
+    if tenant is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."}, status=401
+        )
+    try:
+        # another user's job is not found, before anything is subscribed
+        current = await sync_to_async(JobService.get_job_status)(pk, tenant)
+    except KeyError:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    async def stream():
+        hub = get_job_event_hub()
+        # subscribe before re-reading the status so no transition falls between
+        async with hub.listen(pk) as queue:
+            status = await sync_to_async(JobService.get_job_status)(pk, tenant)
+            yield f"retry: 3000\n{_event(status)}"
+            deadline = time.monotonic() + settings.JOBS_EVENTS_MAX_SECONDS
+            while status["status"] not in TERMINAL and time.monotonic() < deadline:
+                try:
+                    status = await asyncio.wait_for(
+                        queue.get(), settings.JOBS_EVENTS_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"  # keeps proxies from closing an idle stream
+                    continue
+                yield _event(status)
+
+    if current["status"] in TERMINAL:
+        async def finished():
+            yield _event(current)
+
+        body = finished()
+    else:
+        body = stream()
+    response = StreamingHttpResponse(body, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: pass events through
+    return response
@@ -1,26 +1,86 @@
 """ViewSets for job operations."""
-from rest_framework import viewsets, status
+from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core.viewsets.mixins import ProfiledViewMixin, ReplicaReadMixin
+from apps.jobs.application.services.job_service import JobService
+from apps.jobs.serializers.serializers import JobCreateSerializer
+
+MAX_PAGE_SIZE = 1000
+
+
+def _page_params(request, default_limit):
+    try:
+        offset = max(0, int(request.query_params.get('offset', 0)))
+        limit = int(request.query_params.get('limit', default_limit))
+    except ValueError:
+        raise serializers.ValidationError({'detail': 'offset and limit must be integers'})
+    return offset, min(MAX_PAGE_SIZE, max(1, limit))
+
+
+def _not_found():
+    return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+
+class JobViewSet(ProfiledViewMixin, ReplicaReadMixin, viewsets.ViewSet):
+    """
+    ViewSet for job operations. Every action is scoped to the requesting
+    user's jobs (Job.tenant); anyone else's job is a 404.
+    """
+
+    def _tenant(self, request):
+        return str(request.user.pk)
 
-class JobViewSet(viewsets.ViewSet):
-    """ViewSet for job operations."""
-    
     def list(self, request):
-        """List jobs."""
-        return Response({'message': 'Job list endpoint'})
+        """List jobs (status and progress; results via the result action)."""
+        offset, limit = _page_params(request, default_limit=50)
+        jobs = JobService.list_jobs(offset, limit, tenant=self._tenant(request))
+        return Response({'results': jobs})
     
     def create(self, request):
-        """Create a new job."""
-        return Response({'message': 'Job create endpoint'})
+        """Create a page-range analysis job; its ranges are queued fair-share per user."""
+        ser = JobCreateSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        tenant = self._tenant(request)
+        data = dict(ser.validated_data)
+        try:
+            # workers read only what the caller uploaded, never a client path
+            document = JobService.get_document(data.pop('file_id'), tenant)
+        except KeyError:
+            raise serializers.ValidationError({'file_id': 'No such file.'})
+        job_id = JobService.create_job({**data, **document, 'tenant': tenant})
+        return Response(
+            JobService.get_job_status(job_id, tenant), status=status.HTTP_202_ACCEPTED
+        )
     
     def retrieve(self, request, pk=None):
         """Retrieve job details."""
-        return Response({'message': f'Job {pk} details endpoint'})
+        return self.status(request, pk)
     
     @action(detail=True, methods=['get'])
     def status(self, request, pk=None):
-        """Get job status."""
-        return Response({'message': f'Job {pk} status endpoint'})
+        """Get job status and progress."""
+        try:
+            return Response(JobService.get_job_status(pk, self._tenant(request)))
+        except KeyError:
+            return _not_found()
+
+    @action(detail=True, methods=['get'])
+    def result(self, request, pk=None):
+        """One page of the job's page records (?offset=&limit=, limit <= 1000)."""
+        offset, limit = _page_params(request, default_limit=100)
+        try:
+            page = JobService.get_result_page(pk, offset, limit, self._tenant(request))
+        except KeyError:
+            return _not_found()
+        return Response(page)
 
+    @action(detail=True, methods=['post'])
+    def retry(self, request, pk=None):
+        """Re-run the failed page ranges of a partially failed job."""
+        try:
+            retried = JobService.retry_failed_ranges(pk, self._tenant(request))
+        except KeyError:
+            return _not_found()
+        return Response({'job_id': pk, 'retried_ranges': retried})
@@ -0,0 +1,76 @@
+"""
+Per-request middleware cost on /api/v1/file-upload/: full chain vs lean chain.
+
+The file service and Cognito token check are stubbed so the numbers are the
+Django/DRF overhead only. MIDDLEWARE_TIMING is on in both runs; the per-middleware
+columns are mean self-time in ms taken from request.middleware_timings.
+
+    python -m benchmarks.bench_api_middleware [N]
+"""
+from __future__ import annotations
+import sys
+from collections import defaultdict
+from unittest import mock
+
+from benchmarks.common import measure, report, setup_django
+
+URL = "/api/v1/file-upload/download/presign"
+BODY = {"provider": "aws", "key": "user/1/project/default/a.pdf"}
+
+
+def main(n: int = 2000) -> None:
+    setup_django(migrate=False)
+    from django.test import Client, override_settings
+
+    from apps.core.models import User
+
+    service = mock.Mock()
+    service.presign_download.return_value = "https://bucket.s3.amazonaws.com/a.pdf"
+    patches = [
+        mock.patch(
+            "apps.file_upload.viewsets.upload_viewset.get_file_service",
+            return_value=service,
+        ),
+        mock.patch(
+            "apps.core.infrastructure.aws.cognito.verify_access_token",
+            return_value={"sub": "00000000-0000-0000-0000-0000000be0c4"},
+        ),
+        mock.patch(
+            "apps.core.authentication._user_for_sub",
+            return_value=User(pk=1, username="bench"),
+        ),
+    ]
+    for p in patches:
+        p.start()
+
+    rows = {}
+    breakdown = {}
+    for label, prefixes in (("full chain", []), ("lean chain", ["/api/v1/file-upload/"])):
+        totals = defaultdict(float)
+        with override_settings(
+            LEAN_API_PREFIXES=prefixes,
+            MIDDLEWARE_TIMING=True,
+            REST_FRAMEWORK={"DEFAULT_THROTTLE_CLASSES": []},
+        ):
+            client = Client(HTTP_AUTHORIZATION="Bearer bench")
+
+            def call(i: int) -> None:
+                resp = client.post(URL, BODY, content_type="application/json")
+                if i >= 0:
+                    for name, ms in resp.wsgi_request.middleware_timings.items():
+                        totals[name] += ms
+
+            rows[label] = measure(call, n)
+        breakdown[label] = {k: round(v / n, 4) for k, v in sorted(totals.items())}
+        rows[label]["middleware_ms"] = round(
+            sum(v for k, v in breakdown[label].items() if k != "view"), 4
+        )
+
+    for p in patches:
+        p.stop()
+    report(f"POST {URL}, {n} requests", rows)
+    report("mean self-time per middleware (ms)", breakdown)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,51 @@
+"""
+Validation cost of a multipart completion body.
+
+Compares CompletionPayloadSerializer (one nested serializer per part) with
+validate_completion_payload (pydantic TypeAdapter) at 10, 1k and 10k parts.
+
+    python -m benchmarks.bench_completion_payload
+"""
+from __future__ import annotations
+
+from benchmarks.common import measure, report, setup_django
+
+
+def main(sizes=(10, 1_000, 10_000)) -> None:
+    setup_django(migrate=False)
+    from apps.file_upload.domain.models.dto import CompletionPayload
+    from apps.file_upload.serializers import (
+        CompletionPayloadSerializer,
+        validate_completion_payload,
+    )
+
+    for parts in sizes:
+        body = {
+            "provider": "aws",
+            "bucket": "bucket",
+            "key": "user/1/project/default/big.bin",
+            "session_id": "abc",
+            "mpu_upload_id": "x" * 64,
+            "parts": [
+                {"PartNumber": i, "ETag": '"%032x"' % i} for i in range(1, parts + 1)
+            ],
+        }
+
+        def serializer_path(_):
+            ser = CompletionPayloadSerializer(data=body)
+            ser.is_valid(raise_exception=True)
+            return CompletionPayload(**ser.validated_data)
+
+        def fast_path(_):
+            return validate_completion_payload(body)
+
+        n = max(5, 20_000 // parts)
+        rows = {
+            "serializer": measure(serializer_path, n, warmup=2),
+            "type-adapter": measure(fast_path, n, warmup=2),
+        }
+        report(f"completion payload, {parts} parts", rows)
+
+
+if __name__ == "__main__":
+    main()
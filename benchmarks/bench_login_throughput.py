@@ -0,0 +1,64 @@
+"""
+Login throughput: Axes/session bookkeeping in Postgres vs the Redis cache layer.
+
+Drives POST /<ADMIN_URL>login/ through the full middleware stack with a mix of
+failed and successful attempts. Password hashing is switched to MD5 so the
+numbers reflect lockout/session bookkeeping rather than PBKDF2 cost.
+
+    python -m benchmarks.bench_login_throughput [N]
+"""
+from __future__ import annotations
+import sys
+
+from benchmarks.common import measure, report, setup_django
+
+SCENARIOS = {
+    "before (db)": {
+        "AXES_HANDLER": "axes.handlers.database.AxesDatabaseHandler",
+        "SESSION_ENGINE": "django.contrib.sessions.backends.db",
+    },
+    "after (cache)": {
+        "AXES_HANDLER": "axes.handlers.cache.AxesCacheHandler",
+        "SESSION_ENGINE": "django.contrib.sessions.backends.cached_db",
+    },
+}
+
+
+def main(n: int = 500) -> None:
+    setup_django()
+    from axes.handlers.proxy import AxesProxyHandler
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    login_url = f"/{settings.ADMIN_URL}login/"
+    hashers = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    rows = {}
+    for label, overrides in SCENARIOS.items():
+        with override_settings(PASSWORD_HASHERS=hashers, **overrides):
+            AxesProxyHandler.implementation = None  # re-resolve AXES_HANDLER
+            User = get_user_model()
+            User.objects.filter(username="bench").delete()
+            User.objects.create_user("bench", password="bench-pass", is_staff=True)
+            client = Client()
+
+            def attempt(i: int) -> None:
+                # 3 failures (distinct usernames, so nobody locks out) per success
+                if i % 4:
+                    creds = {"username": f"nobody{i}", "password": "x"}
+                else:
+                    creds = {"username": "bench", "password": "bench-pass"}
+                client.post(login_url, creds, REMOTE_ADDR=f"10.0.{i % 250}.1")
+
+            with CaptureQueriesContext(connection) as ctx:
+                row = measure(attempt, n)
+            row["db_queries_per_op"] = round(len(ctx.captured_queries) / (n + 20), 2)
+            rows[label] = row
+    AxesProxyHandler.implementation = None
+    report(f"login throughput, {n} attempts", rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
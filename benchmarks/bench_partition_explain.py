@@ -0,0 +1,102 @@
+"""
+Partition pruning on a "my files in this date range" query.
+
+Builds two scratch copies of `file` (plain and monthly-partitioned via the same
+helpers the migration uses), fills both with ROWS rows over 24 months, and
+compares EXPLAIN (ANALYZE, BUFFERS) and latency for one user's month and for
+a month-wide aggregate. Needs
+Postgres (BENCH_SQLITE=0); the scratch tables are dropped afterwards.
+
+    BENCH_SQLITE=0 python -m benchmarks.bench_partition_explain [ROWS]
+"""
+from __future__ import annotations
+import sys
+
+from benchmarks.common import measure, report, setup_django
+
+PLAIN, PARTITIONED = "bench_file_plain", "bench_file_part"
+QUERIES = {
+    "user month": (
+        "SELECT id, key, status FROM {table} WHERE user_id = 42 "
+        "AND created_at >= %s AND created_at < %s ORDER BY created_at DESC LIMIT 50"
+    ),
+    "month by status": (
+        "SELECT status, count(*) FROM {table} "
+        "WHERE created_at >= %s AND created_at < %s GROUP BY status"
+    ),
+}
+
+
+def _plan_stats(plan: dict) -> dict:
+    scanned, hit, read = set(), 0, 0
+    stack = [plan["Plan"]]
+    while stack:
+        node = stack.pop()
+        if "Relation Name" in node:
+            scanned.add(node["Relation Name"])
+        hit += node.get("Shared Hit Blocks", 0) if node is plan["Plan"] else 0
+        read += node.get("Shared Read Blocks", 0) if node is plan["Plan"] else 0
+        stack.extend(node.get("Plans", []))
+    return {
+        "tables_scanned": len(scanned),
+        "buffers_hit": hit,
+        "buffers_read": read,
+        "exec_ms": round(plan["Execution Time"], 3),
+    }
+
+
+def main(rows: int = 200_000, n: int = 200) -> None:
+    setup_django(migrate=False)
+    from django.db import connection
+
+    from apps.core.infrastructure.db.partitioning import convert_to_partitioned
+
+    if connection.vendor != "postgresql":
+        print("bench_partition_explain: needs Postgres (BENCH_SQLITE=0), skipped")
+        return
+
+    with connection.cursor() as c:
+        for table in (PLAIN, PARTITIONED):
+            c.execute(f"DROP TABLE IF EXISTS {table}")
+            c.execute(
+                f"CREATE TABLE {table} (id uuid PRIMARY KEY DEFAULT gen_random_uuid(), "
+                "user_id bigint NOT NULL, key varchar(1024) NOT NULL, "
+                "status varchar(16) NOT NULL, created_at timestamptz NOT NULL)"
+            )
+            c.execute(f"CREATE INDEX ON {table} (user_id, created_at)")
+            c.execute(
+                f"INSERT INTO {table} (user_id, key, status, created_at) "
+                "SELECT g %% 500, 'k' || g, 'available', "
+                "now() - (g %% 730) * interval '1 day' - (g %% 86400) * interval '1 second' "
+                "FROM generate_series(1, %s) g",
+                [rows],
+            )
+        with connection.schema_editor() as editor:
+            convert_to_partitioned(editor, PARTITIONED, months_ahead=1)
+        for table in (PLAIN, PARTITIONED):
+            c.execute(f"ANALYZE {table}")
+        c.execute("SELECT date_trunc('month', now()) - interval '3 months'")
+        lo = c.fetchone()[0]
+        params = [lo, lo.replace(month=lo.month % 12 + 1, year=lo.year + lo.month // 12)]
+
+        try:
+            for name, query in QUERIES.items():
+                results = {}
+                for label, table in (("plain", PLAIN), ("partitioned", PARTITIONED)):
+                    sql = query.format(table=table)
+                    c.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+                    stats = _plan_stats(c.fetchone()[0][0])
+
+                    def run(_, sql=sql):
+                        c.execute(sql, params)
+                        return c.fetchall()
+
+                    results[label] = {**measure(run, n), **stats}
+                report(f"{name}, {rows} rows over 24 months", results)
+        finally:
+            c.execute(f"DROP TABLE IF EXISTS {PLAIN}")
+            c.execute(f"DROP TABLE IF EXISTS {PARTITIONED}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,70 @@
+"""
+Serialization cost of a large multipart plan response.
+
+Compares the old path (UploadPlanResponseSerializer + DRF JSONRenderer) with the
+hot path (plan_response_data + ORJSONRenderer) for one plan with N part URLs.
+
+    python -m benchmarks.bench_plan_response [PARTS]
+"""
+from __future__ import annotations
+import sys
+
+from benchmarks.common import measure, report, setup_django
+
+
+def main(parts: int = 1000, n: int = 300) -> None:
+    setup_django(migrate=False)
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.core.renderers import ORJSONRenderer
+    from apps.file_upload.domain.models.dto import UploadPlan
+    from apps.file_upload.domain.models.types import UploadType
+    from apps.file_upload.serializers import (
+        UploadPlanResponseSerializer,
+        plan_response_data,
+    )
+
+    key = "user/1/project/default/year=2025/month=01/day=01/abc/big.pdf"
+    url = (
+        "https://bucket.s3.amazonaws.com/" + key + "?uploadId=" + "x" * 64
+        + "&partNumber={}&X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Signature=" + "f" * 64
+    )
+    plan = UploadPlan(
+        upload_type=UploadType.MULTI_PART,
+        upload_id="abc",
+        bucket="bucket",
+        key=key,
+        part_size=20 * 1024 * 1024,
+        total_parts=parts,
+        part_urls=[url.format(i) for i in range(1, parts + 1)],
+        complete_url_payload={"bucket": "bucket", "key": key, "session_id": "abc"},
+    )
+
+    def serializer_path(_):
+        data = UploadPlanResponseSerializer(
+            {
+                "upload_type": plan.upload_type,
+                "upload_id": plan.upload_id,
+                "bucket": plan.bucket,
+                "key": plan.key,
+                "part_size": plan.part_size,
+                "total_parts": plan.total_parts,
+                "put_url": plan.put_url,
+                "part_urls": plan.part_urls,
+                "complete_url_payload": plan.complete_url_payload,
+            }
+        ).data
+        return JSONRenderer().render(data)
+
+    def fast_path(_):
+        return ORJSONRenderer().render(plan_response_data(plan))
+
+    rows = {}
+    for label, fn in (("serializer+json", serializer_path), ("dict+orjson", fast_path)):
+        rows[label] = measure(fn, n)
+        rows[label]["bytes"] = len(fn(0))
+    report(f"plan response, {parts} part URLs", rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
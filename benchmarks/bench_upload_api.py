@@ -0,0 +1,325 @@
+"""
+Upload API end to end: plan, complete and presign through the Django test
+client against moto-backed S3 and DynamoDB, with a baseline regression gate.
+
+Every call runs the real view, service, uploaders and session repository;
+only the AWS endpoints (moto, in process) and the Cognito token check are
+stand-ins. BENCH_AWS_LATENCY_MS adds a fixed sleep before each AWS call to
+approximate a real network round trip, so removing or adding a call shows up
+in the latency columns and not only in aws_calls.
+
+AWS calls per request come from the Server-Timing breakdown
+(REQUEST_BREAKDOWN_HEADER); presigning is local and should cost none.
+
+    python -m benchmarks.bench_upload_api [N]            # report
+    python -m benchmarks.bench_upload_api [N] --update   # rewrite the baseline
+    python -m benchmarks.bench_upload_api [N] --check    # gate against it
+
+--check fails when any case makes more AWS calls than the baseline; call
+counts are deterministic. Latency is only compared, never gated by default:
+absolute milliseconds from another host mean nothing here, so each run also
+times a fixed pure-Python workload (calibration_ms) and p50s are compared in
+units of it. A case whose normalized p50 is more than BENCH_MAX_SLOWDOWN
+(default 0.25) above the baseline's is reported as SLOWER. --strict-latency
+fails on those too; use it with a baseline generated on the same host.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest import mock
+
+from benchmarks.common import BACKEND_NOTE, measure, report, setup_django
+
+BASELINE = Path(__file__).parent / "baselines" / "upload_api.json"
+BUCKET = "bench-uploads"
+PREFIX = "/api/v1/file-upload"
+MB = 1024 * 1024
+
+_AWS_TOTAL = re.compile(r'\baws;dur=[\d.]+;desc="(\d+) calls"')
+_AWS_OP = re.compile(r'\baws\.([\w-]+)\.(\w+);dur=[\d.]+;desc="x(\d+)"')
+
+
+def aws_calls(resp) -> Dict[str, int]:
+    """{"total": n, "<service>.<Operation>": n, ...} from Server-Timing."""
+    header = resp.get("Server-Timing", "")
+    match = _AWS_TOTAL.search(header)
+    calls = {"total": int(match.group(1)) if match else 0}
+    for service, operation, count in _AWS_OP.findall(header):
+        calls[f"{service}.{operation}"] = int(count)
+    return calls
+
+
+def calibrate() -> float:
+    """p50 in ms of a fixed CPU-bound workload: this host's speed, this run."""
+    doc = {"items": [{"id": i, "name": f"item-{i}", "tags": ["a"]} for i in range(200)]}
+
+    def work(i: int) -> None:
+        for _ in range(10):
+            json.loads(json.dumps(doc, sort_keys=True))
+
+    return measure(work, 50, warmup=5)["p50_ms"]
+
+
+def host() -> str:
+    return f"{platform.node()} {platform.machine()} py{platform.python_version()}"
+
+
+def plan_body(size_bytes: int, name: str = "bench.bin") -> dict:
+    return {
+        "provider": "aws",
+        "user_sub": "bench",
+        "prefix": "bench/",
+        "file_meta": {
+            "filename": name,
+            "content_type": "application/octet-stream",
+            "size_bytes": size_bytes,
+        },
+    }
+
+
+def _start_aws(latency_ms: float) -> List:
+    from moto import mock_aws
+
+    from apps.core.infrastructure.aws import clients
+    from apps.core.infrastructure.aws.warmup import reset_clients
+    from apps.file_upload.infrastructure.repositories.dynamo_session_repository import (
+        create_session_table,
+    )
+
+    patches = [
+        mock_aws(),
+        # parts below are a few bytes; S3 enforces 5 MiB for all but the last
+        mock.patch("moto.s3.models.S3_UPLOAD_PART_MIN_SIZE", 1),
+        mock.patch("config.settings.AWS_STORAGE_BUCKET_NAME", BUCKET),
+    ]
+    for p in patches:
+        p.start()
+    reset_clients()
+
+    s3 = clients.get_s3_client()
+    s3.create_bucket(Bucket=BUCKET)
+    create_session_table(clients.get_dynamodb_resource().meta.client)
+    if latency_ms:
+        delay = latency_ms / 1000
+
+        def sleep(**kwargs):
+            time.sleep(delay)
+
+        for c in (s3, clients.get_dynamodb_resource().meta.client):
+            c.meta.events.register("before-call.*.*", sleep)
+    return patches
+
+
+def run(n: int) -> Dict[str, Dict]:
+    from django.test import Client
+
+    from apps.core.infrastructure.aws.clients import get_s3_client
+
+    client = Client(HTTP_AUTHORIZATION="Bearer bench")
+    s3 = get_s3_client()
+
+    def post(action: str, body: dict):
+        resp = client.post(f"{PREFIX}/{action}", body, content_type="application/json")
+        if resp.status_code != 200:
+            raise RuntimeError(f"{action}: {resp.status_code} {resp.content[:300]!r}")
+        return resp
+
+    def completion(plan: dict, parts: List[dict]) -> dict:
+        payload = plan["complete_url_payload"] or {
+            "bucket": plan["bucket"],
+            "key": plan["key"],
+            "session_id": plan["upload_id"],
+        }
+        return {**payload, "provider": "aws", "parts": parts}
+
+    def single_ready() -> dict:
+        return completion(post("upload/plan", plan_body(MB)).json(), [])
+
+    def multipart_ready() -> dict:
+        plan = post("upload/plan", plan_body(200 * MB)).json()
+        mpu = plan["complete_url_payload"]
+        parts = [
+            {
+                "PartNumber": i,
+                "ETag": s3.upload_part(
+                    Bucket=mpu["bucket"],
+                    Key=mpu["key"],
+                    UploadId=mpu["mpu_upload_id"],
+                    PartNumber=i,
+                    Body=b"x",
+                )["ETag"],
+            }
+            for i in range(1, plan["total_parts"] + 1)
+        ]
+        return completion(plan, parts)
+
+    key = "bench/0.bin"
+    cases: Dict[str, tuple] = {
+        "plan single 1MB": ("upload/plan", lambda: plan_body(MB)),
+        "plan multipart 200MB": ("upload/plan", lambda: plan_body(200 * MB)),
+        "plan multipart 2GB": ("upload/plan", lambda: plan_body(2048 * MB)),
+        "plan multipart 5GB": ("upload/plan", lambda: plan_body(5120 * MB)),
+        "complete single": ("upload/complete", single_ready),
+        "complete multipart 10 parts": ("upload/complete", multipart_ready),
+        "presign download": (
+            "download/presign",
+            lambda: {"provider": "aws", "key": key},
+        ),
+    }
+
+    warmup = 5
+    rows: Dict[str, Dict] = {}
+    for name, (action, make_body) in cases.items():
+        # bodies are built up front: complete needs a live session per call
+        bodies = [make_body() for _ in range(n + warmup)]
+        seen: Dict[str, int] = {}
+
+        def call(i: int, action=action, bodies=bodies, seen=seen) -> None:
+            calls = aws_calls(post(action, bodies[i]))
+            if i >= 0:
+                for op, count in calls.items():
+                    seen[op] = seen.get(op, 0) + count
+
+        rows[name] = measure(call, n, warmup=warmup)
+        rows[name]["aws_calls"] = round(seen.get("total", 0) / n, 2)
+        rows[name]["aws_ops"] = {
+            op: round(count / n, 2) for op, count in sorted(seen.items()) if op != "total"
+        }
+    return rows
+
+
+def check(
+    rows: Dict[str, Dict], calibration_ms: float, baseline: Dict, max_slowdown: float
+) -> Tuple[List[str], List[str]]:
+    """(failures, slower): extra AWS calls, and p50s above the limit."""
+    failures, slower = [], []
+    # this host relative to the baseline's; 1 for a baseline without one
+    speed = calibration_ms / baseline.get("calibration_ms", calibration_ms)
+    for name, base in baseline["cases"].items():
+        row = rows.get(name)
+        if row is None:
+            failures.append(f"{name}: case missing from this run")
+            continue
+        if row["aws_calls"] > base["aws_calls"]:
+            failures.append(
+                f"{name}: {row['aws_calls']} AWS calls per request, baseline "
+                f"{base['aws_calls']} ({base['aws_ops']} -> {row['aws_ops']})"
+            )
+        # the baseline p50 as it would read on this host
+        expected = base["p50_ms"] * speed
+        limit = expected * (1 + max_slowdown)
+        if row["p50_ms"] > limit:
+            slower.append(
+                f"{name}: p50 {row['p50_ms']}ms, baseline {base['p50_ms']}ms = "
+                f"{expected:.3f}ms here (limit {limit:.3f}ms at +{max_slowdown:.0%})"
+            )
+    return failures, slower
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("n", nargs="?", type=int)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="gate against the baseline")
+    mode.add_argument("--update", action="store_true", help="rewrite the baseline")
+    parser.add_argument(
+        "--strict-latency",
+        action="store_true",
+        help="with --check, also fail on SLOWER cases (same-host baselines)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    args = parser.parse_args(argv)
+    baseline = json.loads(args.baseline.read_text()) if args.check else None
+    if args.n is None:
+        # moto scans its tables, so later cases slow down as sessions pile up:
+        # compare runs of the same size
+        args.n = baseline["n"] if baseline else 200
+    latency_ms = float(os.getenv("BENCH_AWS_LATENCY_MS", "0"))
+    max_slowdown = float(os.getenv("BENCH_MAX_SLOWDOWN", "0.25"))
+
+    # moto needs credentials to sign with; the real endpoints are never reached
+    os.environ.update(AWS_ACCESS_KEY_ID="bench", AWS_SECRET_ACCESS_KEY="bench")
+    os.environ["AWS_WARMUP"] = "0"
+    setup_django(migrate=False)
+    from django.test import override_settings
+
+    from apps.core.models import User
+    from apps.file_upload.viewsets.upload_viewset import UploadViewSet
+
+    patches: List = [
+        mock.patch(
+            "apps.core.infrastructure.aws.cognito.verify_access_token",
+            return_value={"sub": "00000000-0000-0000-0000-0000000be0c4"},
+        ),
+        mock.patch(
+            "apps.core.authentication._user_for_sub",
+            return_value=User(pk=1, username="bench"),
+        ),
+        mock.patch.object(UploadViewSet, "throttle_classes", []),
+    ]
+    for p in patches:
+        p.start()
+    patches = _start_aws(latency_ms) + patches
+    bench_settings = override_settings(
+        REQUEST_BREAKDOWN_HEADER=True, PROFILING_ENABLED=False
+    )
+    bench_settings.enable()
+    BACKEND_NOTE["aws"] = f"moto +{latency_ms:g}ms"
+    try:
+        # before and after the cases: the host's speed can drift during a run
+        before = calibrate()
+        rows = run(args.n)
+        calibration_ms = round((before + calibrate()) / 2, 3)
+    finally:
+        bench_settings.disable()
+        for p in reversed(patches):
+            p.stop()
+
+    report(
+        f"upload API, {args.n} requests per case",
+        {k: {c: v for c, v in r.items() if c != "aws_ops"} for k, r in rows.items()},
+    )
+    report("AWS calls per request by operation", {k: r["aws_ops"] for k, r in rows.items()})
+    print(f"\ncalibration: {calibration_ms}ms on {host()}")
+
+    if args.update:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "n": args.n,
+            "aws_latency_ms": latency_ms,
+            "calibration_ms": calibration_ms,
+            "host": host(),
+            "cases": rows,
+        }
+        args.baseline.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+        print(f"\nbaseline written to {args.baseline}")
+    elif args.check:
+        if baseline["n"] != args.n or baseline.get("aws_latency_ms") != latency_ms:
+            print(
+                f"\nnote: baseline recorded with N={baseline['n']}, BENCH_AWS_LATENCY_MS="
+                f"{baseline.get('aws_latency_ms')}; this run N={args.n}, {latency_ms:g}"
+            )
+        if baseline.get("host") != host():
+            print(f"note: baseline recorded on {baseline.get('host', 'another host')}")
+        failures, slower = check(rows, calibration_ms, baseline, max_slowdown)
+        for line in slower:
+            print(f"SLOWER {line}")
+        if args.strict_latency:
+            failures += slower
+        for line in failures:
+            print(f"REGRESSION {line}")
+        if failures:
+            return 1
+        print(f"\nwithin baseline ({len(baseline['cases'])} cases)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run a benchmark from the repo root, e.g.:
+    python -m benchmarks.bench_login_throughput
+
+BENCH_SQLITE=0 keeps the configured Postgres; by default an in-memory SQLite
+database is used so the scripts run anywhere. Redis is used when reachable,
+otherwise every cache alias falls back to LocMemCache (reported in the output).
+"""
+from __future__ import annotations
+import json
+import logging
+import os
+import statistics
+import time
+import warnings
+from typing import Callable, Dict, List
+
+BACKEND_NOTE: Dict[str, str] = {}
+
+
+class _NoMigrations(dict):
+    """Build tables straight from models (same as pytest's --nomigrations)."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+def _redis_reachable(url: str) -> bool:
+    try:
+        import redis
+
+        return bool(redis.Redis.from_url(url, socket_connect_timeout=0.2).ping())
+    except Exception:
+        return False
+
+
+def setup_django(*, sqlite: bool | None = None, migrate: bool = True) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    from django.conf import settings
+
+    if sqlite is None:
+        sqlite = os.getenv("BENCH_SQLITE", "1") == "1"
+    if sqlite:
+        settings.DATABASES["default"] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        }
+    BACKEND_NOTE["db"] = settings.DATABASES["default"]["ENGINE"].rsplit(".", 1)[-1]
+
+    if _redis_reachable(settings.REDIS_URL):
+        BACKEND_NOTE["cache"] = "redis"
+    else:
+        settings.CACHES = {
+            alias: {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": alias,
+            }
+            for alias in settings.CACHES
+        }
+        BACKEND_NOTE["cache"] = "locmem (redis unreachable)"
+
+    import django
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+    logging.disable(logging.WARNING)  # axes/django chatter skews the timings
+    warnings.filterwarnings("ignore", message="No directory at")  # whitenoise
+    if migrate:
+        from django.core.management import call_command
+
+        settings.MIGRATION_MODULES = _NoMigrations()
+        call_command("migrate", run_syncdb=True, verbosity=0, interactive=False)
+
+
+def measure(fn: Callable[[int], object], n: int, warmup: int = 20) -> Dict[str, float]:
+    """Call fn(i) n times; return throughput and latency percentiles in ms."""
+    for i in range(warmup):
+        fn(-1 - i)
+    samples: List[float] = []
+    started = time.perf_counter()
+    for i in range(n):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "ops_per_sec": round(n / elapsed, 1),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(samples[min(n - 1, int(n * 0.99))], 3),
+    }
+
+
+def report(title: str, rows: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}  [{', '.join(f'{k}={v}' for k, v in BACKEND_NOTE.items())}]")
+    cols = sorted({c for r in rows.values() for c in r})
+    width = max(len(k) for k in rows) + 2
+    widths = [max(16, len(c) + 2) for c in cols]
+    print("".ljust(width) + "".join(c.rjust(w) for c, w in zip(cols, widths)))
+    for name, row in rows.items():
+        print(
+            name.ljust(width)
+            + "".join(str(row.get(c, "")).rjust(w) for c, w in zip(cols, widths))
+        )
+    out = os.getenv("BENCH_JSON")
+    if out:
+        with open(out, "a") as fh:
+            fh.write(json.dumps({"title": title, "rows": rows, **BACKEND_NOTE}) + "\n")
@@ -0,0 +1,72 @@
+"""
+Compare two locust runs (the `<prefix>_stats.csv` written by `--csv <prefix>`).
+
+    python -m benchmarks.load.compare reports/before reports/after
+
+Prints req/s, p50/p95/p99 and failure rate per request name with the change.
+With --max-slowdown F, exits 1 when a request's p95 grew by more than F
+(0.25 = 25%) or its failure rate went up.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+COLUMNS = (("req/s", "Requests/s"), ("p50", "50%"), ("p95", "95%"), ("p99", "99%"))
+
+
+def load(prefix: str) -> Dict[str, Dict[str, float]]:
+    path = Path(prefix if prefix.endswith(".csv") else f"{prefix}_stats.csv")
+    rows = {}
+    with path.open(newline="") as fh:
+        for row in csv.DictReader(fh):
+            name = f"{row['Type']} {row['Name']}".strip()
+            count = int(row["Request Count"]) or 1
+            rows[name] = {label: float(row[col] or 0) for label, col in COLUMNS}
+            rows[name]["fail%"] = 100 * int(row["Failure Count"]) / count
+    return rows
+
+
+def _change(old: float, new: float) -> str:
+    if not old:
+        return "" if not new else "new"
+    return f"{(new - old) / old:+.0%}"
+
+
+def compare(before: Dict, after: Dict, max_slowdown: float | None) -> List[str]:
+    labels = [label for label, _ in COLUMNS] + ["fail%"]
+    width = max(len(name) for name in {**before, **after}) + 2
+    print("".ljust(width) + "".join(f"{label:>24}" for label in labels))
+    regressions = []
+    for name in {**before, **after}:
+        old, new = before.get(name, {}), after.get(name, {})
+        cells = []
+        for label in labels:
+            a, b = old.get(label, 0.0), new.get(label, 0.0)
+            cells.append(f"{a:.1f} -> {b:.1f} {_change(a, b):>5}".rjust(24))
+        print(name.ljust(width) + "".join(cells))
+        if max_slowdown is None or not old or not new:
+            continue
+        if new["p95"] > old["p95"] * (1 + max_slowdown):
+            regressions.append(f"{name}: p95 {old['p95']:.0f} -> {new['p95']:.0f}ms")
+        if new["fail%"] > old["fail%"]:
+            regressions.append(f"{name}: failures {old['fail%']:.2f}% -> {new['fail%']:.2f}%")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--max-slowdown", type=float)
+    args = parser.parse_args(argv)
+    regressions = compare(load(args.before), load(args.after), args.max_slowdown)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Upload flow under concurrent load:
+
+    login -> plan -> PUT to the presigned URL(s) -> complete -> presign download
+
+Each simulated user logs in once (Cognito USER_PASSWORD_AUTH, served by moto
+in the compose "bench" profile) and then loops over the flow. Users come from
+`manage.py bootstrap_local_aws`; PUTs go straight to the presigned S3 URLs, so
+the stand-in's latency is reported separately ("s3 PUT ...").
+
+Declared file sizes drive the plan (single part below 100 MB, multipart above);
+only LOAD_PUT_BYTES are actually sent per PUT, so a 5 GB plan costs its real
+number of part round trips without moving 5 GB.
+
+Environment:
+    LOAD_USER_COUNT      users seeded by bootstrap_local_aws (default 100)
+    LOAD_USER_PREFIX     their username prefix (default loaduser)
+    LOAD_PASSWORD        their password
+    LOAD_FILE_SIZES_MB   declared sizes, one picked per flow (default 1,50,200)
+    LOAD_PUT_BYTES       bytes sent per PUT (default 65536)
+    LOAD_WAIT_SECONDS    think time between flows, "min,max" (default 0.5,2)
+
+    locust -f benchmarks/load/locustfile.py --host http://localhost:8000
+"""
+from __future__ import annotations
+import os
+import random
+
+from locust import HttpUser, between, task
+
+USER_COUNT = int(os.getenv("LOAD_USER_COUNT", "100"))
+USER_PREFIX = os.getenv("LOAD_USER_PREFIX", "loaduser")
+PASSWORD = os.getenv("LOAD_PASSWORD", "Load-test-pass-1!")
+SIZES_MB = [int(s) for s in os.getenv("LOAD_FILE_SIZES_MB", "1,50,200").split(",")]
+PUT_BODY = b"x" * int(os.getenv("LOAD_PUT_BYTES", "65536"))
+WAIT_MIN, WAIT_MAX = (
+    float(s) for s in os.getenv("LOAD_WAIT_SECONDS", "0.5,2").split(",")
+)
+CONTENT_TYPE = "application/octet-stream"
+API = "/api/v1"
+
+
+class UploadUser(HttpUser):
+    wait_time = between(WAIT_MIN, WAIT_MAX)
+
+    def on_start(self):
+        username = f"{USER_PREFIX}{random.randrange(USER_COUNT)}"
+        resp = self.client.post(
+            f"{API}/core/auth/login",
+            json={"username": username, "password": PASSWORD},
+            name="login",
+        )
+        resp.raise_for_status()
+        self.client.headers["Authorization"] = f"Bearer {resp.json()['accessToken']}"
+
+    @task
+    def upload_flow(self):
+        size_mb = random.choice(SIZES_MB)
+        with self.client.post(
+            f"{API}/file-upload/upload/plan",
+            json={
+                "provider": "aws",
+                "user_sub": "-",  # the API uses the token's user
+                "prefix": "load/",
+                "file_meta": {
+                    "filename": f"{size_mb}mb.bin",
+                    "content_type": CONTENT_TYPE,
+                    "size_bytes": size_mb * 1024 * 1024,
+                },
+            },
+            name="plan",
+            catch_response=True,
+        ) as resp:
+            if resp.status_code != 200:
+                resp.failure(f"{resp.status_code}: {resp.text[:200]}")
+                return
+            plan = resp.json()
+
+        payload = {**plan["complete_url_payload"], "provider": "aws"}
+        if plan["put_url"]:
+            self._put(plan["put_url"], "s3 PUT object", {"Content-Type": CONTENT_TYPE})
+        else:
+            payload["parts"] = [
+                {"PartNumber": number, "ETag": self._put(url, "s3 PUT part")}
+                for number, url in enumerate(plan["part_urls"], start=1)
+            ]
+        self.client.post(f"{API}/file-upload/upload/complete", json=payload, name="complete")
+        self.client.post(
+            f"{API}/file-upload/download/presign",
+            json={"provider": "aws", "key": plan["key"]},
+            name="presign",
+        )
+
+    def _put(self, url: str, name: str, headers: dict | None = None) -> str:
+        # presigned URLs must go out as-is, without the API's bearer header
+        resp = self.client.put(
+            url, data=PUT_BODY, headers={"Authorization": None, **(headers or {})}, name=name
+        )
+        return resp.headers.get("ETag", "")
@@ -29,6 +29,9 @@ app.conf.update(
 QUEUE_DEFAULT = os.getenv("CELERY_Q_DEFAULT", "default")
 QUEUE_UPLOADS = os.getenv("CELERY_Q_UPLOADS", "file_upload")
 QUEUE_JOBS = os.getenv("CELERY_Q_JOBS", "jobs")
+# small jobs' waves (apps/jobs/domain/logic/fair_share.py); jobs workers consume
+# it next to QUEUE_JOBS, so interactive work never waits behind bulk ranges
+QUEUE_JOBS_PRIORITY = os.getenv("CELERY_Q_JOBS_PRIORITY", "jobs_priority")
 QUEUE_ANALYTICS = os.getenv("CELERY_Q_ANALYTICS", "analytics")
 
 default_ex = Exchange("celery", type="direct")
@@ -37,11 +40,17 @@ app.conf.task_queues = (
     Queue(QUEUE_DEFAULT, default_ex, routing_key=QUEUE_DEFAULT),
     Queue(QUEUE_UPLOADS, default_ex, routing_key=QUEUE_UPLOADS),
     Queue(QUEUE_JOBS, default_ex, routing_key=QUEUE_JOBS),
+    Queue(QUEUE_JOBS_PRIORITY, default_ex, routing_key=QUEUE_JOBS_PRIORITY),
     Queue(QUEUE_ANALYTICS, default_ex, routing_key=QUEUE_ANALYTICS),
 )
 app.conf.task_routes = {
     "apps.core_tasks.*": {"queue": QUEUE_DEFAULT, "routing_key": QUEUE_DEFAULT},
     "apps.file_upload_tasks.*": {"queue": QUEUE_UPLOADS, "routing_key": QUEUE_UPLOADS},
+    # the beat safety net must not wait behind the bulk ranges it admits
+    "apps.jobs_tasks.schedule_job_waves": {
+        "queue": QUEUE_DEFAULT,
+        "routing_key": QUEUE_DEFAULT,
+    },
     "apps.jobs_tasks.*": {"queue": QUEUE_JOBS, "routing_key": QUEUE_JOBS},
     "apps.analytics_tasks.*": {
         "queue": QUEUE_ANALYTICS,
@@ -55,6 +64,29 @@ app.conf.task_routes = {
 #         "schedule": crontab(hour=0, minute=0),
 #     },
 # }
+app.conf.beat_schedule = {
+    # next months' created_at partitions for file/jobs, retention detach
+    "manage-partitions-daily": {
+        "task": "apps.core_tasks.manage_partitions",
+        "schedule": crontab(hour=2, minute=15),
+    },
+    # fair-share job waves are admitted on submit and wave completion; this
+    # catches wakeups lost to crashes
+    "schedule-job-waves": {
+        "task": "apps.jobs_tasks.schedule_job_waves",
+        "schedule": 15.0,
+    },
+}
+
+
+@signals.setup_logging.connect
+def setup_logging(**_):
+    # keep settings.LOGGING (queued JSON pipeline) instead of Celery's handlers
+    from logging.config import dictConfig
+
+    from django.conf import settings
+
+    dictConfig(settings.LOGGING)
 
 
 @signals.task_failure.connect
@@ -64,27 +96,123 @@ def task_failure_handler(**kwargs):
     task_id = kwargs.get("task_id")
     exception = kwargs.get("exception")
     traceback = kwargs.get("traceback")
-    exc_info = (type(exception), exception, traceback)
 
+    # the traceback goes through exc_info (rendered by the formatter); `extra`
+    # only carries plain values so it can be serialized off-thread
     logger.error(
-        f"Task {sender} with ID {task_id} failed with exception: {exception}",
-        exc_info=exc_info,
+        "Task %s with ID %s failed with exception: %r",
+        getattr(sender, "name", sender),
+        task_id,
+        exception,
+        exc_info=(type(exception), exception, traceback) if exception else None,
         extra={
             "data": {
                 "task_id": task_id,
-                "sender": sender,
-                "exception": exception,
-                "traceback": traceback,
+                "task": getattr(sender, "name", str(sender)),
+                "exception_type": type(exception).__name__ if exception else None,
+                "exception": str(exception),
             }
         },
     )
 
 
+@signals.worker_process_init.connect
+def warm_up_aws(**_):
+    from apps.core.infrastructure.aws.warmup import warm_up
+    from apps.core.infrastructure.db.pool import reset_pools_after_fork
+
+    reset_pools_after_fork()  # DB pool sized by DB_POOL_* like the web tier
+    warm_up("celery.worker_process_init")
+
+
+@signals.worker_shutdown.connect
+def worker_shutdown_handler(**_):
+    from apps.jobs.infrastructure.job_progress import flush_progress
+
+    flush_progress()  # solo/threads pools run tasks in the main process
+
+
+@signals.worker_init.connect
+def start_metrics_server(**_):
+    from django.conf import settings
+
+    if settings.CELERY_METRICS_PORT:
+        from apps.core.infrastructure.metrics import task_metrics
+
+        task_metrics.start_http_server(settings.CELERY_METRICS_PORT)
+
+
+@signals.worker_process_shutdown.connect
+def worker_process_shutdown_handler(pid=None, **_):
+    from apps.core.infrastructure.logs import flush_logs
+    from apps.jobs.infrastructure.job_progress import flush_progress
+
+    flush_progress()  # job page counts buffered in this pool child
+    flush_logs()  # pool children may exit without running atexit
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+@signals.before_task_publish.connect
+def before_task_publish_handler(headers=None, **_):
+    from apps.core.infrastructure.metrics import task_metrics
+
+    task_metrics.stamp_headers(headers)  # enqueue time for queue-wait metrics
+
+
 @signals.task_prerun.connect
 def task_prerun_handler(task=None, task_id=None, **_):
-    logger.info(f"Starting task {task.name} id={task_id}")
+    from apps.core.infrastructure.metrics import task_metrics
+    from apps.core.infrastructure.profiling import hooks as profiling
+
+    wait = task_metrics.task_started(task, task_id)
+    logger.info(
+        "Starting task %s id=%s queue_wait_ms=%s",
+        task.name,
+        task_id,
+        "-" if wait is None else round(wait * 1000, 1),
+        extra={
+            "data": {
+                "task": task.name,
+                "task_id": task_id,
+                "queue": task_metrics.task_queue(task),
+                "queue_wait_ms": None if wait is None else round(wait * 1000, 1),
+            }
+        },
+    )
+    profiling.task_started(task, task_id)  # PROFILING_* settings
 
 
 @signals.task_postrun.connect
 def task_postrun_handler(task=None, task_id=None, state=None, **_):
-    logger.info(f"Finished task {task.name} id={task_id} state={state}")
+    from apps.core.infrastructure.metrics import task_metrics
+    from apps.core.infrastructure.profiling import hooks as profiling
+    from apps.jobs.infrastructure.job_progress import get_progress_buffer
+
+    get_progress_buffer().flush_if_due()  # an idle process still flushes
+    profiling.task_finished(task, task_id)
+    runtime = task_metrics.task_finished(task, task_id, state)
+    logger.info(
+        "Finished task %s id=%s state=%s runtime_ms=%s",
+        task.name,
+        task_id,
+        state,
+        "-" if runtime is None else round(runtime * 1000, 1),
+        extra={
+            "data": {
+                "task": task.name,
+                "task_id": task_id,
+                "state": state,
+                "runtime_ms": None if runtime is None else round(runtime * 1000, 1),
+            }
+        },
+    )
+
+
+@signals.task_retry.connect
+def task_retry_handler(sender=None, **_):
+    from apps.core.infrastructure.metrics import task_metrics
+
+    task_metrics.task_retried(sender)
@@ -1,5 +1,37 @@
 import multiprocessing
+import os
 wsgi_app = "config.wsgi:application"
 bind=":8000"
-workers = min(multiprocessing.cpu_count() * 2 + 1,12)
+# settings.DB_POOL_* reads the same env vars to size the per-worker DB pool
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1,12)))
+threads = int(os.getenv("WEB_THREADS", "1"))
 timeout = 60
+
+
+def post_fork(server, worker):
+    # with preload_app the master built the AWS clients / DB pool; give each
+    # worker its own
+    from django.apps import apps as django_apps
+
+    if django_apps.models_ready:
+        from apps.core.infrastructure.db.pool import reset_pools_after_fork
+
+        reset_pools_after_fork()
+    from apps.core.infrastructure.aws.warmup import warm_up
+
+    warm_up("gunicorn.post_fork")
+
+
+def child_exit(server, worker):
+    # multiprocess Prometheus: drop the exited worker's live gauges
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def worker_exit(server, worker):
+    # write out queued log records before the worker goes away
+    from apps.core.infrastructure.logs import flush_logs
+
+    flush_logs()
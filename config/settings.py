@@ -4,6 +4,7 @@ Django settings for pdf_image_analyzer_backend project.
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -88,18 +89,50 @@ AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",  # needed for /admin auth
 ]
 
+# apps.core.middleware.lean wraps the stock classes: the browser-only ones step
+# aside for LEAN_API_PREFIXES (token-auth API routes), and all of them report
+# per-middleware Server-Timing when MIDDLEWARE_TIMING is on
 MIDDLEWARE = [
-    "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # static for admin
-    "corsheaders.middleware.CorsMiddleware",  # keep high
-    "axes.middleware.AxesMiddleware",  # before session/auth
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",  # admin uses CSRF
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.core.middleware.metrics.RequestMetricsMiddleware",  # outermost: totals
+    "apps.core.middleware.lean.SecurityMiddleware",
+    "apps.core.middleware.lean.WhiteNoiseMiddleware",  # static for admin
+    "apps.core.middleware.lean.CorsMiddleware",  # keep high
+    "apps.core.middleware.lean.AxesMiddleware",  # before session/auth
+    "apps.core.middleware.lean.SessionMiddleware",
+    "apps.core.middleware.lean.CommonMiddleware",
+    "apps.core.middleware.lean.CsrfViewMiddleware",  # admin uses CSRF
+    "apps.core.middleware.lean.AuthenticationMiddleware",
+    "apps.core.middleware.lean.MessageMiddleware",
+    "apps.core.middleware.lean.XFrameOptionsMiddleware",
+    "apps.core.middleware.replica.ReplicaRoutingMiddleware",
 ]
+# axes.W002 looks for the literal "axes.middleware.AxesMiddleware" path. The
+# lean wrapper above subclasses it and runs it on every route except
+# LEAN_API_PREFIXES, which take bearer tokens, not the login axes protects.
+SILENCED_SYSTEM_CHECKS = ["axes.W002"]
+LEAN_API_PREFIXES = env_csv("LEAN_API_PREFIXES", "/api/v1/file-upload/")
+MIDDLEWARE_TIMING = env_bool("MIDDLEWARE_TIMING", DEBUG)
+# db / aws / per-operation entries in Server-Timing (RequestMetricsMiddleware);
+# the same numbers always feed the Prometheus histograms at /metrics
+REQUEST_BREAKDOWN_HEADER = env_bool("REQUEST_BREAKDOWN_HEADER", DEBUG)
+METRICS_ENABLED = env_bool("METRICS_ENABLED", True)
+# /metrics answers clients in METRICS_ALLOWED_CIDRS (REMOTE_ADDR: never list
+# the load balancer's subnets) and requests bearing METRICS_TOKEN
+METRICS_ALLOWED_CIDRS = env_csv("METRICS_ALLOWED_CIDRS", "127.0.0.1/32,::1/128")
+METRICS_TOKEN = env("METRICS_TOKEN", "")
+
+# On-demand sampling profiler (apps/core/infrastructure/profiling): requests
+# with a valid X-Profile-Token (`manage.py profiling token`) or in the sample
+# rate are profiled; collapsed stacks go to PROFILING_STORE under an id
+PROFILING_ENABLED = env_bool("PROFILING_ENABLED", False)
+PROFILING_SECRET = env("PROFILING_SECRET", "")
+PROFILING_SAMPLE_RATE = float(env("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_TASK_SAMPLE_RATE = float(env("PROFILING_TASK_SAMPLE_RATE", "0"))
+PROFILING_INTERVAL_MS = env_int("PROFILING_INTERVAL_MS", 5)
+PROFILING_STORE = env("PROFILING_STORE", "local")  # local | s3
+PROFILING_DIR = Path(env("PROFILING_DIR", BASE_DIR / "profiles"))
+PROFILING_S3_BUCKET = env("PROFILING_S3_BUCKET", env("AWS_STORAGE_BUCKET_NAME", ""))
+PROFILING_S3_PREFIX = env("PROFILING_S3_PREFIX", "profiles/")
 
 # DRF uses internal service JWT (Option B)
 REST_FRAMEWORK = {
@@ -107,6 +140,15 @@ REST_FRAMEWORK = {
     #     "config.auth_internal.InternalServiceJWTAuthentication",
     # ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_FILTER_BACKENDS": [
@@ -114,6 +156,20 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
+    # counters live in the "throttle" cache (see CACHES below), not in "default"
+    "DEFAULT_THROTTLE_CLASSES": [
+        "apps.core.throttling.CachedAnonRateThrottle",
+        "apps.core.throttling.CachedUserRateThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": env("THROTTLE_RATE_ANON", "120/min"),
+        "user": env("THROTTLE_RATE_USER", "2000/min"),
+        # token buckets (apps.core.throttling.TokenBucketThrottle): "<scope>.<user|ip>"
+        "upload_plan.user": env("THROTTLE_RATE_UPLOAD_PLAN_USER", "30/min"),
+        "upload_plan.ip": env("THROTTLE_RATE_UPLOAD_PLAN_IP", "60/min"),
+        "download_presign.user": env("THROTTLE_RATE_PRESIGN_USER", "300/min"),
+        "download_presign.ip": env("THROTTLE_RATE_PRESIGN_IP", "600/min"),
+    },
 }
 
 # ---------------------------
@@ -135,8 +191,10 @@ TEMPLATES = [
     },
 ]
 
-# Axes config (Redis cache strongly recommended in prod)
+# Axes config (lockout bookkeeping lives in the "axes" Redis cache, not Postgres)
 AXES_ENABLED = True
+AXES_HANDLER = env("AXES_HANDLER", "axes.handlers.cache.AxesCacheHandler")
+AXES_CACHE = "axes"
 AXES_FAILURE_LIMIT = env_int("AXES_FAILURE_LIMIT", 5)
 AXES_COOLOFF_TIME = env_int("AXES_COOLOFF_TIME", 60)  # minutes
 AXES_LOCK_OUT_BY_COMBINATION_USER_AND_IP = True
@@ -163,10 +221,117 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD", "postgres"),
         "HOST": env("DB_HOST", "localhost"),
         "PORT": env("DB_PORT", "5432"),
+        # pooled connections are validated on checkout (psycopg_pool check)
+        "CONN_HEALTH_CHECKS": True,
     }
 }
+
+
+def db_pool_options(processes, threads, budget, headroom=1):
+    """
+    psycopg_pool sizing for Django's native pool. Pools are per process, so
+    max_size covers the threads that can hold a connection at once (+headroom)
+    and is capped so processes * max_size stays within this service's share
+    of Postgres max_connections (budget).
+    """
+    per_process = max(1, budget // max(1, processes))
+    max_size = max(1, min(threads + headroom, per_process))
+    return {
+        "min_size": max(1, min(threads, max_size) // 2),
+        "max_size": max_size,
+        "timeout": float(env("DB_POOL_TIMEOUT", "10")),  # wait for a free conn
+        "max_idle": env_int("DB_POOL_MAX_IDLE", 300),
+        "max_lifetime": env_int("DB_POOL_MAX_LIFETIME", 1800),
+    }
+
+
+# DB_POOL_PROCESSES/THREADS describe *this* deployment unit: gunicorn workers
+# and threads for web, the prefork concurrency (threads=1) for Celery
+DB_POOL = env_bool("DB_POOL", True)
+DB_POOL_PROCESSES = env_int("DB_POOL_PROCESSES", env_int("WEB_CONCURRENCY", 4))
+DB_POOL_THREADS = env_int("DB_POOL_THREADS", env_int("WEB_THREADS", 1))
+DB_POOL_BUDGET = env_int("DB_POOL_BUDGET", 80)
+# the langgraph checkpointer keeps a second pool per process
+# (apps/core/infrastructure/db/pool.py); it gets this slice of the budget,
+# Django's pool the rest
+DB_POOL_CHECKPOINTER_BUDGET = env_int(
+    "DB_POOL_CHECKPOINTER_BUDGET", DB_POOL_BUDGET // 5
+)
+DB_POOL_OPTIONS = db_pool_options(
+    DB_POOL_PROCESSES, DB_POOL_THREADS, DB_POOL_BUDGET - DB_POOL_CHECKPOINTER_BUDGET
+)
+DB_CHECKPOINTER_POOL_OPTIONS = db_pool_options(
+    DB_POOL_PROCESSES, DB_POOL_THREADS, DB_POOL_CHECKPOINTER_BUDGET
+)
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"] = {"pool": DB_POOL_OPTIONS}
+
+# Optional read replica: only reads inside use_replica() go there (list
+# endpoints, analytics); users are pinned to the primary for
+# REPLICA_PIN_SECONDS after a write. See apps/core/infrastructure/db/routing.py
+if env("DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": env("DB_REPLICA_HOST"),
+        "PORT": env("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["apps.core.infrastructure.db.routing.ReplicaRouter"]
+REPLICA_PIN_SECONDS = env_int("REPLICA_PIN_SECONDS", 5)
+
+# Monthly created_at partitions (Postgres): table -> months of data kept
+# attached (0 = keep everything). `manage.py manage_partitions` / the daily
+# beat task create PARTITION_MONTHS_AHEAD future months and detach the rest.
+PARTITIONED_TABLES = {
+    "file": env_int("FILE_RETENTION_MONTHS", 0),
+    "jobs": env_int("JOBS_RETENTION_MONTHS", 0),
+}
+PARTITION_MONTHS_AHEAD = env_int("PARTITION_MONTHS_AHEAD", 3)
+PARTITION_DROP_DETACHED = env_bool("PARTITION_DROP_DETACHED", False)
 FRONTEND_REDIRECT_URL = env("FRONTEND_REDIRECT_URL", "")
 
+# ---------------------------
+# Cache (Redis; one logical DB per use, Celery broker stays on /0)
+# ---------------------------
+REDIS_URL = env(
+    "REDIS_URL", f"redis://{env('REDIS_HOST', 'redis')}:{env('REDIS_PORT', '6379')}"
+).rstrip("/")
+REDIS_MAX_CONNECTIONS = env_int("REDIS_MAX_CONNECTIONS", 50)
+REDIS_SOCKET_TIMEOUT = float(env("REDIS_SOCKET_TIMEOUT", "0.5"))
+
+
+def redis_cache(db, prefix, timeout=300):
+    return {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"{REDIS_URL}/{db}",
+        "KEY_PREFIX": prefix,
+        "TIMEOUT": timeout,
+        # passed straight to redis.ConnectionPool.from_url
+        "OPTIONS": {
+            "max_connections": REDIS_MAX_CONNECTIONS,
+            "socket_timeout": REDIS_SOCKET_TIMEOUT,
+            "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+            "retry_on_timeout": True,
+            "health_check_interval": 30,
+        },
+    }
+
+
+SESSION_COOKIE_AGE = env_int("SESSION_COOKIE_AGE", 60 * 60 * 24 * 14)
+
+CACHES = {
+    "default": redis_cache(env_int("REDIS_CACHE_DB", 1), "app"),
+    "sessions": redis_cache(
+        env_int("REDIS_SESSIONS_DB", 2), "sess", timeout=SESSION_COOKIE_AGE
+    ),
+    "axes": redis_cache(env_int("REDIS_AXES_DB", 3), "axes", timeout=None),
+    "throttle": redis_cache(env_int("REDIS_THROTTLE_DB", 4), "thr"),
+}
+
+# write-through: reads come from Redis, Postgres stays the source of truth
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_CACHE_ALIAS = "sessions"
+
 # ---------------------------
 # Password validation
 # ---------------------------
@@ -208,6 +373,12 @@ AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID", "")
 AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY", "")
 AWS_STORAGE_BUCKET_NAME = env("AWS_STORAGE_BUCKET_NAME", "")
 AWS_REGION = env("AWS_REGION", "us-east-1")
+# Local stand-in for every AWS API (moto server in the compose "bench" profile);
+# empty means the real regional endpoints
+AWS_ENDPOINT_URL = env("AWS_ENDPOINT_URL", "")
+AWS_S3_ADDRESSING_STYLE = env(
+    "AWS_S3_ADDRESSING_STYLE", "path" if AWS_ENDPOINT_URL else "virtual"
+)
 AWS_COGNITO_USER_POOL_ID = env("AWS_COGNITO_USER_POOL_ID", "")
 AWS_COGNITO_CLIENT_ID = env("AWS_COGNITO_CLIENT_ID", "")
 AWS_COGNITO_CLIENT_SECRET = env("AWS_COGNITO_CLIENT_SECRET", "")
@@ -215,6 +386,49 @@ AWS_COGNITO_DOMAIN = env(
     "AWS_COGNITO_DOMAIN", ""
 )  # https://your-domain.auth.us-east-1.amazoncognito.com
 
+# Pre-build AWS clients at worker boot (gunicorn workers, celery pool
+# processes); see aws/warmup.py
+AWS_WARMUP = env_bool("AWS_WARMUP", not DEBUG)
+AWS_WARMUP_CONNECT = env_bool("AWS_WARMUP_CONNECT", True)  # HeadBucket etc.
+# connect/read timeout of those round trips, which are never retried
+AWS_WARMUP_TIMEOUT = float(env("AWS_WARMUP_TIMEOUT", "2"))
+AWS_WARMUP_STEPS = env_csv(
+    "AWS_WARMUP_STEPS",
+    "apps.core.infrastructure.aws.warmup.warm_s3,"
+    "apps.core.infrastructure.aws.warmup.warm_cognito_jwks,"
+    "apps.file_upload.application.services.file_service.warm_file_service",
+)
+
+# Upload/download storage: "s3", or "local" (files under LOCAL_STORAGE_ROOT,
+# HMAC-signed URLs served by this app; dev and benchmarks without any AWS).
+# "local" also swaps the DynamoDB session table for JSON files under the root.
+FILE_STORAGE = env("FILE_STORAGE", "s3")
+LOCAL_STORAGE_ROOT = env("LOCAL_STORAGE_ROOT", str(BASE_DIR / "local_storage"))
+LOCAL_STORAGE_BUCKET = env("LOCAL_STORAGE_BUCKET", "uploads")
+LOCAL_STORAGE_URL = env("LOCAL_STORAGE_URL", "")  # absolute base for signed URLs
+LOCAL_STORAGE_SECRET = env("LOCAL_STORAGE_SECRET", SECRET_KEY)
+
+# S3 ObjectCreated notifications (bucket -> SQS) drive post-upload processing;
+# `manage.py consume_s3_events` long-polls the queue. Empty disables it.
+S3_EVENTS_QUEUE_URL = env("S3_EVENTS_QUEUE_URL", "")
+S3_EVENTS_WAIT_SECONDS = env_int("S3_EVENTS_WAIT_SECONDS", 20)  # SQS max
+S3_EVENTS_DEDUP_TTL = env_int("S3_EVENTS_DEDUP_TTL", 24 * 3600)
+
+# Ranged S3 reads (apps/file_upload/infrastructure/aws/s3_range_reader.py):
+# block size, blocks kept per open reader (LRU), max read-ahead in blocks, and
+# the process-wide prefetch thread pool
+S3_RANGE_BLOCK_SIZE = env_int("S3_RANGE_BLOCK_SIZE", 1024 * 1024)
+S3_RANGE_CACHE_BLOCKS = env_int("S3_RANGE_CACHE_BLOCKS", 32)
+S3_RANGE_MAX_READAHEAD = env_int("S3_RANGE_MAX_READAHEAD", 8)
+S3_RANGE_PREFETCH_WORKERS = env_int("S3_RANGE_PREFETCH_WORKERS", 8)
+
+# Worker-local disk cache of S3 objects, LRU-bounded to MAX_BYTES per host
+# (apps/file_upload/infrastructure/aws/object_spool.py)
+OBJECT_SPOOL_DIR = env(
+    "OBJECT_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "object-spool")
+)
+OBJECT_SPOOL_MAX_BYTES = env_int("OBJECT_SPOOL_MAX_BYTES", 10 * 1024**3)
+
 GOOGLE_REDIRECT_URI = env("GOOGLE_REDIRECT_URI", "")  # same as Node had
 INTERNAL_SYNC_SECRET = env("INTERNAL_SYNC_SECRET", "change-me")
 
@@ -255,6 +469,55 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
 
 CELERY_RESULT_EXPIRES = env_int("CELERY_RESULT_EXPIRES", 3600)
 
+# Task metrics (apps/core/infrastructure/metrics/task_metrics.py): workers serve
+# /metrics on this port (0 = off); queue depth/backlog age are sampled from the
+# broker on each /metrics scrape of the web tier
+CELERY_METRICS_PORT = env_int("CELERY_METRICS_PORT", 0)
+CELERY_QUEUE_METRICS = env_bool("CELERY_QUEUE_METRICS", True)
+
+# Page-range jobs (apps/jobs): a document is split into ranges of
+# JOBS_PAGE_CHUNK_SIZE pages, one task each on the jobs queue (a chord), so no
+# single task gets near TASK_TIME_LIMIT. A range is retried
+# JOBS_RANGE_MAX_RETRIES times before it counts as failed.
+JOBS_PAGE_CHUNK_SIZE = env_int("JOBS_PAGE_CHUNK_SIZE", 25)
+JOBS_RANGE_MAX_RETRIES = env_int("JOBS_RANGE_MAX_RETRIES", 2)
+JOBS_RANGE_SOFT_TIME_LIMIT = env_int("JOBS_RANGE_SOFT_TIME_LIMIT", 5 * 60)
+# callable(bucket, key, first_page, last_page) -> list of per-page dicts
+JOBS_PAGE_ANALYZER = env(
+    "JOBS_PAGE_ANALYZER", "apps.jobs.domain.logic.page_ranges.page_stubs"
+)
+
+# Job results above INLINE_MAX_BYTES of JSON go to S3 as gzip NDJSON (blocks of
+# RECORDS_PER_BLOCK page records, each readable with one ranged GET); the jobs
+# row keeps a pointer and summary
+JOBS_RESULT_INLINE_MAX_BYTES = env_int("JOBS_RESULT_INLINE_MAX_BYTES", 256 * 1024)
+JOBS_RESULT_RECORDS_PER_BLOCK = env_int("JOBS_RESULT_RECORDS_PER_BLOCK", 200)
+JOBS_RESULT_BUCKET = env("JOBS_RESULT_BUCKET", "")  # default: AWS_STORAGE_BUCKET_NAME
+JOBS_RESULT_PREFIX = env("JOBS_RESULT_PREFIX", "job-results/")
+
+# Per-page job progress is summed per worker process and written in one UPDATE
+# every FLUSH_SECONDS or FLUSH_COUNT reports; range outcomes and final states
+# are written at once (apps/jobs/infrastructure/job_progress.py)
+JOBS_PROGRESS_FLUSH_SECONDS = float(env("JOBS_PROGRESS_FLUSH_SECONDS", "2"))
+JOBS_PROGRESS_FLUSH_COUNT = env_int("JOBS_PROGRESS_FLUSH_COUNT", 200)
+
+# Fair-share scheduling of job ranges (apps/jobs/domain/logic/fair_share.py):
+# ranges enter the broker in waves of WAVE_RANGES, round-robin across tenants,
+# with at most TENANT_CAPACITY ranges in flight per tenant and lane and
+# BULK/PRIORITY_CAPACITY per lane. Jobs of up to PRIORITY_MAX_RANGES ranges use
+# the priority lane (jobs_priority queue)
+JOBS_SCHED_WAVE_RANGES = env_int("JOBS_SCHED_WAVE_RANGES", 8)
+JOBS_SCHED_TENANT_CAPACITY = env_int("JOBS_SCHED_TENANT_CAPACITY", 8)
+JOBS_SCHED_BULK_CAPACITY = env_int("JOBS_SCHED_BULK_CAPACITY", 32)
+JOBS_SCHED_PRIORITY_CAPACITY = env_int("JOBS_SCHED_PRIORITY_CAPACITY", 16)
+JOBS_PRIORITY_MAX_RANGES = env_int("JOBS_PRIORITY_MAX_RANGES", 4)
+
+# Job status stream (SSE, GET jobs/<id>/events): comment line every
+# HEARTBEAT seconds while idle; the stream ends after MAX seconds and the
+# browser's EventSource reconnects
+JOBS_EVENTS_HEARTBEAT_SECONDS = env_int("JOBS_EVENTS_HEARTBEAT_SECONDS", 15)
+JOBS_EVENTS_MAX_SECONDS = env_int("JOBS_EVENTS_MAX_SECONDS", 300)
+
 # Flower (optional; for local/dev)
 FLOWER_PORT = env_int("FLOWER_PORT", 5555)
 FLOWER_BROKER_API = CELERY_BROKER_URL
@@ -275,30 +538,64 @@ SWAGGER_SETTINGS = {
     "DEEP_LINKING": True,
     "SHOW_EXTENSIONS": True,
     "DEFAULT_MODEL_RENDERING": "example",
+    # docs UIs load the stored artifact instead of regenerating the schema
+    "SPEC_URL": "/swagger.json",
 }
+REDOC_SETTINGS = {"SPEC_URL": "/swagger.json"}
+# `manage.py generate_openapi` writes swagger.{json,yaml}(+.gz/.br) here at
+# build time; /swagger.json serves those files and only generates on a miss
+OPENAPI_SCHEMA_DIR = Path(env("OPENAPI_SCHEMA_DIR", BASE_DIR / "openapi"))
 
 # ---------------------------
 # Test DB override
 # ---------------------------
 if "test" in sys.argv or "pytest" in sys.modules:
-    DATABASES["default"] = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+    DATABASES = {
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+            "TEST": {"MIRROR": "default"},
+        },
+    }
+    CACHES = {
+        alias: {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": alias,
+        }
+        for alias in CACHES
+    }
+    AWS_WARMUP = False
 
 AUTH_USER_MODEL = "core.User"
 APPEND_SLASH = False
 # ---------------------------
 # Logging
 # ---------------------------
+# Request/task threads only enqueue log records; a background listener formats
+# (JSON by default) and writes them. See apps/core/infrastructure/logs.py
+LOG_FORMAT = env("LOG_FORMAT", "text" if DEBUG else "json")  # json | text
+LOG_QUEUE = env_bool("LOG_QUEUE", True)
+LOG_QUEUE_SIZE = env_int("LOG_QUEUE_SIZE", 10000)
+_console_handler = {"class": "logging.StreamHandler", "formatter": LOG_FORMAT}
+if LOG_QUEUE:
+    _console_handler = {
+        "()": "apps.core.infrastructure.logs.QueuedHandler",
+        "formatter": LOG_FORMAT,
+        "queue_size": LOG_QUEUE_SIZE,
+    }
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
-        "jsonlite": {
+        "text": {
             "format": "{levelname} {asctime} {name} {message}",
             "style": "{",
         },
+        "json": {"()": "apps.core.infrastructure.logs.JSONFormatter"},
     },
     "handlers": {
-        "console": {"class": "logging.StreamHandler", "formatter": "jsonlite"},
+        "console": _console_handler,
     },
     "root": {"handlers": ["console"], "level": os.getenv("DJANGO_LOG_LEVEL", "INFO")},
     "loggers": {
@@ -1,30 +1,29 @@
 """
 URL configuration for pdf_image_analyzer_backend project.
 """
+import logging
 
 from django.contrib import admin
 from django.urls import path, include, re_path
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.conf import settings
+from django.db import DatabaseError
 
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 
-SWAGGER_BASE_URL = "http://localhost:8000"
+from apps.core.infrastructure.db.pool import pool_stats, probe_checkout
+from apps.core.infrastructure.metrics import prometheus
+from apps.core.openapi import API_INFO, SCHEMA_URL, schema_document
+
+logger = logging.getLogger(__name__)
+
+# only backs the docs UI pages; the spec itself comes from schema_document
 schema_view = get_schema_view(
-    openapi.Info(
-        title="PDF Image Analyzer API",
-        default_version="v1",
-        description=(
-            "API for PDF and image analysis. "
-            "This OpenAPI spec can be used with Orval for frontend code generation."
-        ),
-        license=openapi.License(name="MIT License"),
-    ),
+    API_INFO,
     public=True,
     permission_classes=(permissions.AllowAny,),
-    url=f"{SWAGGER_BASE_URL}/api/v1",
+    url=SCHEMA_URL,
 )
 
 
@@ -33,25 +32,54 @@ def health(_request):
     return JsonResponse({"ok": True, "service": "pdf_image_analyzer_backend"})
 
 
+def health_db(request):
+    """
+    DB round trip (checkout + SELECT 1) and this process's pool stats; same
+    audience as /metrics (scrape_allowed). Errors are logged, not returned:
+    psycopg messages name hosts, ports and users.
+    """
+    if not prometheus.scrape_allowed(request):
+        return HttpResponse(status=403)
+    try:
+        checkout_ms = probe_checkout()
+    except DatabaseError:
+        logger.exception("health/db: checkout failed")
+        return JsonResponse({"ok": False, "error": "database unavailable"}, status=503)
+    return JsonResponse({"ok": True, "checkout_ms": checkout_ms, "pool": pool_stats()})
+
+
+def metrics(request):
+    """Prometheus exposition (request/AWS/DB histograms); see scrape_allowed."""
+    if not prometheus.scrape_allowed(request):
+        return HttpResponse(status=403)
+    payload, content_type = prometheus.render()
+    return HttpResponse(payload, content_type=content_type)
+
+
 urlpatterns = [
     # Admin (customizable via settings.ADMIN_URL)
     path(getattr(settings, "ADMIN_URL", "admin/"), admin.site.urls),
     # Health check (compose & ALB reference this)
     path("health", health, name="health"),
+    path("health/db", health_db, name="health-db"),
     # API v1
     path("api/v1/file-upload/", include("apps.file_upload.urls")),
     path("api/v1/jobs/", include("apps.jobs.urls")),
     path("api/v1/analytics/", include("apps.analytics.urls")),
     path("api/v1/core/", include("apps.core.urls")),
-    # OpenAPI schema for Orval (JSON/YAML) — always available internally
+    # OpenAPI schema for Orval (JSON/YAML) — always available internally;
+    # served from the `generate_openapi` artifact
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
+        schema_document,
         name="schema-json",
     ),
 ]
 
 
+if settings.METRICS_ENABLED:
+    urlpatterns += [path("metrics", metrics, name="metrics")]
+
 if settings.DEBUG or getattr(settings, "ENABLE_API_DOCS", False):
     urlpatterns += [
         path(